@@ -0,0 +1,22 @@
+from app.database import engine
+from sqlalchemy import text
+
+def run_migration():
+    # Structured diff next to the text log, and the (story_id, created_at, id) index
+    # behind keyset-paginated history. Existing rows keep diff = NULL.
+    statements = [
+        "ALTER TABLE user_story_activity ADD COLUMN diff JSON NULL",
+        "CREATE INDEX ix_user_story_activity_story_created ON user_story_activity (story_id, created_at, id)",
+    ]
+    with engine.connect() as connection:
+        for sql in statements:
+            try:
+                print("Executing:", sql)
+                connection.execute(text(sql))
+                connection.commit()
+                print("Migration successful.")
+            except Exception as e:
+                print(f"Migration failed (might already exist): {e}")
+
+if __name__ == "__main__":
+    run_migration()
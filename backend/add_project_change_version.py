@@ -0,0 +1,16 @@
+from app.database import engine
+from sqlalchemy import text
+
+def run_migration():
+    # Per-project change version used for ETag / conditional GET support
+    sql = "ALTER TABLE project ADD COLUMN change_version INT NOT NULL DEFAULT 0"
+    with engine.connect() as connection:
+        try:
+            connection.execute(text(sql))
+            connection.commit()
+            print("Migration successful: Added change_version to project")
+        except Exception as e:
+            print(f"Migration failed (might already exist): {e}")
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,17 @@
+from app.database import engine
+from sqlalchemy import text
+
+def run_migration():
+    # Backs the grouped per-project report queries (status / type breakdowns)
+    sql = "CREATE INDEX ix_user_story_project_status_type ON user_story (project_id, status, issue_type)"
+    with engine.connect() as connection:
+        try:
+            print("Executing:", sql)
+            connection.execute(text(sql))
+            connection.commit()
+            print("Migration successful: ix_user_story_project_status_type added.")
+        except Exception as e:
+            print(f"Migration failed (might already exist): {e}")
+
+if __name__ == "__main__":
+    run_migration()
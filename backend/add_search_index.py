@@ -0,0 +1,22 @@
+from app.database import engine
+from sqlalchemy import text
+
+def run_migration():
+    statements = [
+        # Prefix lookups on story codes (e.g. "BA-00")
+        "CREATE INDEX ix_user_story_story_code ON user_story (story_code)",
+        # Ranked full text search over code/title/description
+        "CREATE FULLTEXT INDEX ft_user_story_search ON user_story (story_code, title, description)",
+    ]
+    with engine.connect() as connection:
+        for sql in statements:
+            try:
+                print("Executing:", sql)
+                connection.execute(text(sql))
+                print("Migration successful.")
+            except Exception as e:
+                print(f"Migration failed (might already exist): {e}")
+        connection.commit()
+
+if __name__ == "__main__":
+    run_migration()
@@ -0,0 +1,22 @@
+from app.database import engine
+from sqlalchemy import text
+
+def run_migration():
+    # change_seq + index back the incremental sync endpoint (/projects/{id}/issues/changes);
+    # the user_story_tombstone table itself is created by app.bootstrap (create_all)
+    statements = [
+        "ALTER TABLE user_story ADD COLUMN change_seq INT NOT NULL DEFAULT 0",
+        "CREATE INDEX ix_user_story_project_change_seq ON user_story (project_id, change_seq, id)",
+    ]
+    with engine.connect() as connection:
+        for sql in statements:
+            try:
+                print("Executing:", sql)
+                connection.execute(text(sql))
+                connection.commit()
+                print("Migration successful.")
+            except Exception as e:
+                print(f"Migration failed (might already exist): {e}")
+
+if __name__ == "__main__":
+    run_migration()
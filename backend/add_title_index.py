@@ -0,0 +1,17 @@
+from app.database import engine
+from sqlalchemy import text
+
+def run_migration():
+    # Backs the "title" / "title (n)" prefix lookup used for duplicate-title resolution
+    sql = "CREATE INDEX ix_user_story_project_title ON user_story (project_id, title)"
+    with engine.connect() as connection:
+        try:
+            print("Executing:", sql)
+            connection.execute(text(sql))
+            connection.commit()
+            print("Migration successful: ix_user_story_project_title added.")
+        except Exception as e:
+            print(f"Migration failed (might already exist): {e}")
+
+if __name__ == "__main__":
+    run_migration()
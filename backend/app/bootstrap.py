@@ -0,0 +1,61 @@
+"""
+Schema creation and seed data, run once per deploy:
+
+    python -m app.bootstrap
+
+or from the app's lifespan hook when BOOTSTRAP_ON_STARTUP is enabled.
+Nothing here runs at import time.
+"""
+import logging
+
+from sqlalchemy.orm import Session
+
+from app.database import Base, engine as default_engine
+from app.modules.auth import crud as auth_crud, models as auth_models
+from app.modules.auth.security import get_password_hash
+from app.modules.workflow import crud as workflow_crud
+
+# Importing the model modules registers every table on Base.metadata
+from app.modules.project import models as project_models  # noqa: F401
+from app.modules.user_story import models as story_models  # noqa: F401
+from app.modules.workflow import models as workflow_models  # noqa: F401
+from app.modules.settings import models as settings_models  # noqa: F401
+from app.modules.reports import models as reports_models  # noqa: F401
+
+SUPER_ADMIN_EMAIL = "admin@admin.com"
+SUPER_ADMIN_PASSWORD = "admin@123"
+
+logger = logging.getLogger(__name__)
+
+
+def create_tables(engine):
+    Base.metadata.create_all(bind=engine)
+
+
+# Create the super admin account if missing; the bcrypt hash is only computed in that case
+def bootstrap_super_admin(db: Session):
+    if auth_crud.get_user_by_email(db, SUPER_ADMIN_EMAIL):
+        return False
+
+    logger.info("Bootstrapping Super Admin: %s", SUPER_ADMIN_EMAIL)
+    db.add(auth_models.User(
+        name="admin",
+        email=SUPER_ADMIN_EMAIL,
+        password_hash=get_password_hash(SUPER_ADMIN_PASSWORD),
+        is_active=True,
+        global_role=auth_models.GlobalRole.ADMIN
+    ))
+    db.commit()
+    return True
+
+
+def bootstrap(engine=None):
+    engine = engine or default_engine
+    create_tables(engine)
+    with Session(engine) as db:
+        workflow_crud.seed_workflow_transitions(db)
+        bootstrap_super_admin(db)
+
+
+if __name__ == "__main__":
+    bootstrap()
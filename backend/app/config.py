@@ -1,9 +1,88 @@
-﻿DB_HOST = "localhost"
-DB_USER = "root"
-DB_PASSWORD = "Pujith@2235"
-DB_NAME = "user_story"
+import os
+
+
+def env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# Database (environment overrides the local development defaults)
+DB_HOST = os.getenv("DB_HOST", "localhost")
+DB_USER = os.getenv("DB_USER", "root")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "Pujith@2235")
+DB_NAME = os.getenv("DB_NAME", "user_story")
+# Full SQLAlchemy URL; when set it takes precedence over the DB_* parts above
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+# Connection pool: each worker process holds up to DB_POOL_SIZE + DB_MAX_OVERFLOW connections
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+# Recycle before MySQL's wait_timeout closes idle connections server-side
+DB_POOL_RECYCLE_SECONDS = int(os.getenv("DB_POOL_RECYCLE_SECONDS", "1800"))
+DB_POOL_PRE_PING = env_bool("DB_POOL_PRE_PING", True)
+# Per-statement limit for SELECTs (MySQL max_execution_time); 0 disables
+DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "30000"))
+# Log every SQL statement; for local debugging only
+DB_ECHO = env_bool("DB_ECHO", False)
+
+# Async DB path: serve the hot read endpoints (story list/detail, project report
+# overview, calendar) from async handlers on an asyncio engine (aiomysql), so
+# concurrency is bounded by the connection pool rather than the threadpool
+ASYNC_DB_ENABLED = env_bool("ASYNC_DB_ENABLED", False)
+# Full async SQLAlchemy URL; defaults to the DB_* parts with the aiomysql driver
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
 
 # JWT Settings
-SECRET_KEY = "your-secret-key-CHANGE-THIS-IN-PROD"
+SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-CHANGE-THIS-IN-PROD")
 ALGORITHM = "HS256"
-ACCESS_TOKEN_EXPIRE_MINUTES = 60
+ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
+
+# Password hashing: bcrypt cost factor for new hashes (existing hashes with a different
+# cost are upgraded on the next successful login), and the dedicated worker pool that
+# runs bcrypt off the request threads. Requests beyond workers + queue get a 503.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "4"))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
+
+# RBAC: how long (seconds) a user's project roles are cached per process.
+# Writes through auth.crud invalidate immediately in this process; other workers
+# see the change within this window. Set to 0 to disable.
+ROLE_CACHE_TTL_SECONDS = float(os.getenv("ROLE_CACHE_TTL_SECONDS", "5"))
+
+# Stateless auth (opt-in): trust short-lived JWTs for identity and global role
+# instead of loading the user row on every request. Tokens whose lifetime
+# (exp - iat) exceeds the max still go through the database; while enabled,
+# login and register issue tokens no longer than the max.
+STATELESS_AUTH_ENABLED = env_bool("STATELESS_AUTH_ENABLED", False)
+STATELESS_AUTH_MAX_TOKEN_LIFETIME_MINUTES = int(os.getenv("STATELESS_AUTH_MAX_TOKEN_LIFETIME_MINUTES", "15"))
+# How often (seconds) each process reloads the set of deactivated users; this bounds
+# how long a deactivated user's short-lived tokens keep working
+REVOCATION_REFRESH_SECONDS = float(os.getenv("REVOCATION_REFRESH_SECONDS", "5"))
+
+# Workflow: edits made in this process invalidate the cached transition graph
+# immediately; other workers reload it after this many seconds.
+WORKFLOW_CACHE_TTL_SECONDS = float(os.getenv("WORKFLOW_CACHE_TTL_SECONDS", "60"))
+
+# Startup: run schema creation, workflow seeding and admin bootstrap in the app's
+# lifespan hook. Multi-worker deployments should set this to False and run
+# `python -m app.bootstrap` once per deploy instead.
+BOOTSTRAP_ON_STARTUP = env_bool("BOOTSTRAP_ON_STARTUP", True)
+
+# Logging: level for the app.* loggers, JSON lines vs plain text, and the fraction
+# of DEBUG records kept when DEBUG is enabled (hot paths log at DEBUG)
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_JSON = env_bool("LOG_JSON", True)
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv("LOG_DEBUG_SAMPLE_RATE", "0.1"))
+
+# Live project events (SSE): per-connection buffer before a slow client is told to
+# resync, and the idle heartbeat interval in seconds
+EVENTS_QUEUE_SIZE = int(os.getenv("EVENTS_QUEUE_SIZE", "256"))
+EVENTS_HEARTBEAT_SECONDS = float(os.getenv("EVENTS_HEARTBEAT_SECONDS", "15"))
+
+# Backlog import (CSV / NDJSON): rows inserted per transaction unless the request
+# sets batch_size (capped at IMPORT_MAX_BATCH_SIZE)
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+IMPORT_MAX_BATCH_SIZE = 5000
@@ -1,17 +1,165 @@
-from sqlalchemy import create_engine
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import QueuePool
 from urllib.parse import quote_plus
 from sqlalchemy.orm import Session
-from app.config import DB_HOST, DB_USER, DB_PASSWORD, DB_NAME
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from app.config import (
+    DB_HOST, DB_USER, DB_PASSWORD, DB_NAME, DATABASE_URL as CONFIGURED_DATABASE_URL,
+    ASYNC_DATABASE_URL as CONFIGURED_ASYNC_DATABASE_URL,
+    DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_TIMEOUT_SECONDS, DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_PRE_PING, DB_STATEMENT_TIMEOUT_MS, DB_ECHO
+)
 
 # Encode password to handle special characters in MySQL connection string
 encoded_password = quote_plus(DB_PASSWORD)
 
-# Create database connection URL for MySQL using pymysql driver
-DATABASE_URL = f"mysql+pymysql://{DB_USER}:{encoded_password}@{DB_HOST}/{DB_NAME}"
+# Create database connection URL for MySQL using pymysql driver (unless DATABASE_URL is set)
+DATABASE_URL = CONFIGURED_DATABASE_URL or f"mysql+pymysql://{DB_USER}:{encoded_password}@{DB_HOST}/{DB_NAME}"
+ASYNC_DATABASE_URL = CONFIGURED_ASYNC_DATABASE_URL or f"mysql+aiomysql://{DB_USER}:{encoded_password}@{DB_HOST}/{DB_NAME}"
+
+
+class PoolMetrics:
+    """
+    Counters for time spent waiting on the connection pool.
+    Checked-out / overflow figures come live from the pool itself.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.total_wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+            else:
+                self.checkouts += 1
+            self.total_wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "avg_wait_ms": round(self.total_wait_seconds * 1000 / self.checkouts, 3) if self.checkouts else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    # QueuePool that times every checkout, including waits for a free connection
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except Exception:
+            self.metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+# In-memory SQLite keeps SQLAlchemy's single-connection pools; everything else gets the configured QueuePool
+def uses_queue_pool(url: str) -> bool:
+    parsed = make_url(url)
+    return parsed.get_backend_name() != "sqlite" or parsed.database not in (None, "", ":memory:")
+
+
+# Build an engine from config; keyword arguments override individual settings (tests, scripts)
+def create_db_engine(url: str | None = None, **overrides):
+    url = url or DATABASE_URL
+    options = {"echo": DB_ECHO}
+
+    if uses_queue_pool(url):
+        options.update(
+            poolclass=MeteredQueuePool,
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+    statement_timeout_ms = overrides.pop("statement_timeout_ms", DB_STATEMENT_TIMEOUT_MS)
+    options.update(overrides)
+
+    db_engine = create_engine(url, **options)
+    set_statement_timeout(db_engine, statement_timeout_ms)
+    return db_engine
+
+
+# Async counterpart of create_db_engine (same pool settings, asyncio driver)
+def create_async_db_engine(url: str | None = None, **overrides):
+    url = url or ASYNC_DATABASE_URL
+    options = {"echo": DB_ECHO}
 
-# Create SQLAlchemy engine with echo=True for debugging SQL queries
-engine = create_engine(DATABASE_URL, echo=True)
+    if uses_queue_pool(url):
+        options.update(
+            pool_size=DB_POOL_SIZE,
+            max_overflow=DB_MAX_OVERFLOW,
+            pool_timeout=DB_POOL_TIMEOUT_SECONDS,
+            pool_recycle=DB_POOL_RECYCLE_SECONDS,
+            pool_pre_ping=DB_POOL_PRE_PING,
+        )
+    statement_timeout_ms = overrides.pop("statement_timeout_ms", DB_STATEMENT_TIMEOUT_MS)
+    options.update(overrides)
+
+    db_engine = create_async_engine(url, **options)
+    set_statement_timeout(db_engine.sync_engine, statement_timeout_ms)
+    return db_engine
+
+
+# MySQL: cap SELECT run time per session via max_execution_time
+def set_statement_timeout(db_engine, statement_timeout_ms: int):
+    if db_engine.dialect.name != "mysql" or not statement_timeout_ms:
+        return
+
+    @event.listens_for(db_engine, "connect")
+    def apply_statement_timeout(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET SESSION max_execution_time = {int(statement_timeout_ms)}")
+        cursor.close()
+
+
+# Live pool figures for monitoring; wait-time counters only exist on MeteredQueuePool
+def get_pool_metrics(db_engine=None) -> dict:
+    pool = (db_engine or engine).pool
+    metrics = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            max_overflow=pool._max_overflow,
+        )
+    if isinstance(pool, MeteredQueuePool):
+        metrics.update(pool.metrics.snapshot())
+    return metrics
+
+
+engine = create_db_engine()
 
 # Session factory for database operations
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -28,3 +176,37 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# The async engine is created on first use so the async driver is only
+# required when the async path is enabled
+_async_engine = None
+_async_session_factory = None
+
+
+def get_async_engine():
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine()
+    return _async_engine
+
+
+def get_async_session_factory():
+    global _async_session_factory
+    if _async_session_factory is None:
+        _async_session_factory = async_sessionmaker(get_async_engine(), expire_on_commit=False, autoflush=False)
+    return _async_session_factory
+
+
+# Async counterpart of get_db for the async handlers
+async def get_async_db():
+    async with get_async_session_factory()() as db:
+        yield db
+
+
+async def dispose_async_engine():
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+        _async_engine = None
+        _async_session_factory = None
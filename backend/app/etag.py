@@ -0,0 +1,35 @@
+import hashlib
+
+from fastapi import Request, Response
+
+# Clients must revalidate every time, but may keep the body and send If-None-Match
+CACHE_CONTROL = "private, no-cache"
+
+
+# Weak ETag for a project-scoped read. The project's change_version moves on every
+# write to its issues or members; scope and user keep different endpoints and callers
+# (role-dependent payloads) apart. Endpoints whose payload depends on query parameters
+# must put those values in scope.
+def make_etag(scope: str, project_id: int, version: int, user_id: int | None = None) -> str:
+    key = f"{scope}:{project_id}:{version}:{user_id}"
+    return f'W/"{hashlib.sha1(key.encode("utf-8")).hexdigest()[:24]}"'
+
+
+# True when the request's If-None-Match already names this ETag (weak comparison)
+def is_not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+def set_etag(response: Response, etag: str):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -0,0 +1,148 @@
+import asyncio
+import json
+import logging
+import threading
+from collections import defaultdict
+
+from sqlalchemy import event as sa_event
+from sqlalchemy.orm import Session
+
+from app.config import EVENTS_HEARTBEAT_SECONDS, EVENTS_QUEUE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Sent instead of the backlog when a subscriber falls too far behind; the client
+# should catch up through /projects/{id}/issues/changes with its last cursor
+RESYNC_EVENT = {"type": "resync"}
+
+# Session.info key holding the events of the open transaction
+PENDING_EVENTS_KEY = "pending_project_events"
+
+
+class Subscription:
+    """
+    One live connection's view of a project: a bounded queue owned by the
+    connection's event loop. Only touched from that loop.
+    """
+
+    def __init__(self, project_id: int, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.project_id = project_id
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize)
+
+    def offer(self, event: dict):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Slow consumer: drop the backlog and ask it to resync
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self) -> dict:
+        return await self.queue.get()
+
+
+class InProcessEventHub:
+    """
+    Fan-out of project events to the subscribers of this process.
+    Multi-worker deployments can swap in a broker-backed hub with the same
+    subscribe / unsubscribe / publish interface via set_hub().
+    """
+
+    def __init__(self, queue_size: int = EVENTS_QUEUE_SIZE):
+        self.queue_size = queue_size
+        self._lock = threading.Lock()
+        self._subscribers: dict[int, set[Subscription]] = defaultdict(set)
+
+    # Must be called from the event loop that will consume the subscription
+    def subscribe(self, project_id: int) -> Subscription:
+        subscription = Subscription(project_id, asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscribers[project_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.project_id]
+
+    # Thread-safe: called from request threads after their transaction commits
+    def publish(self, project_id: int, event: dict):
+        with self._lock:
+            subscribers = list(self._subscribers.get(project_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, event)
+            except RuntimeError:
+                # The connection's loop is gone
+                self.unsubscribe(subscription)
+
+    def subscriber_count(self, project_id: int | None = None) -> int:
+        with self._lock:
+            if project_id is not None:
+                return len(self._subscribers.get(project_id, ()))
+            return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+
+hub = InProcessEventHub()
+
+
+def set_hub(new_hub):
+    global hub
+    hub = new_hub
+
+
+# Queue a project event on the session; it is published only if the transaction commits
+def queue_event(db: Session, project_id: int, event_type: str, story_id: int, change_seq: int | None = None, story: dict | None = None):
+    db.info.setdefault(PENDING_EVENTS_KEY, []).append({
+        "type": event_type,
+        "project_id": project_id,
+        "story_id": story_id,
+        "change_seq": change_seq,
+        "story": story,
+    })
+
+
+@sa_event.listens_for(Session, "after_commit")
+def publish_pending_events(session):
+    for event in session.info.pop(PENDING_EVENTS_KEY, ()):
+        try:
+            hub.publish(event["project_id"], event)
+        except Exception:
+            logger.exception("Failed to publish %s event for project %s", event["type"], event["project_id"])
+
+
+@sa_event.listens_for(Session, "after_rollback")
+def discard_pending_events(session):
+    session.info.pop(PENDING_EVENTS_KEY, None)
+
+
+# Server-Sent Events wire format; the change_seq doubles as the event id
+def format_sse(event: dict) -> str:
+    lines = []
+    if event.get("change_seq") is not None:
+        lines.append(f"id: {event['change_seq']}")
+    lines.append(f"event: {event['type']}")
+    lines.append(f"data: {json.dumps(event, separators=(',', ':'), default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+# Body of a project's SSE response: events as they are published, with comment
+# heartbeats so proxies keep idle connections open
+async def stream_project_events(project_id: int, heartbeat_seconds: float = EVENTS_HEARTBEAT_SECONDS):
+    subscription = hub.subscribe(project_id)
+    try:
+        yield ": connected\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield format_sse(event)
+    finally:
+        hub.unsubscribe(subscription)
@@ -0,0 +1,67 @@
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+
+# Encoded output is handed to the response in chunks of roughly this many bytes
+EXPORT_CHUNK_BYTES = 64 * 1024
+
+
+def _json_default(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value)
+
+
+def _csv_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+# One JSON object per line, built from (record_type, mapping) pairs
+def ndjson_lines(records):
+    for record_type, row in records:
+        yield json.dumps({"record_type": record_type, **row}, default=_json_default, separators=(",", ":")) + "\n"
+
+
+# Header line, then one CSV line per record; columns a record does not have stay empty
+def csv_lines(records, columns: list[str]):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(["record_type"] + columns)
+    for record_type, row in records:
+        writer.writerow([record_type] + [_csv_value(row.get(column)) for column in columns])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+# Join small text pieces into ~EXPORT_CHUNK_BYTES byte chunks
+def encode_chunks(lines, chunk_bytes: int = EXPORT_CHUNK_BYTES):
+    pending = []
+    size = 0
+    for line in lines:
+        data = line.encode("utf-8")
+        pending.append(data)
+        size += len(data)
+        if size >= chunk_bytes:
+            yield b"".join(pending)
+            pending = []
+            size = 0
+    if pending:
+        yield b"".join(pending)
+
+
+# Compress a byte stream into a single gzip member as it is produced
+def gzip_chunks(chunks):
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
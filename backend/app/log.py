@@ -0,0 +1,98 @@
+"""
+Structured logging for the app.* loggers.
+
+Records are handed to a QueueHandler and written by a background QueueListener, so
+request threads never block on stdout. Each record carries the current request id.
+DEBUG records are sampled; with the default INFO level they are never formatted at all.
+"""
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import uuid
+from contextvars import ContextVar
+
+from app.config import LOG_LEVEL, LOG_JSON, LOG_DEBUG_SAMPLE_RATE
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+request_id_var: ContextVar[str] = ContextVar("request_id", default="-")
+
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: logging.handlers.QueueHandler | None = None
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+class RequestIdFilter(logging.Filter):
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    # Keep every INFO+ record and roughly `rate` of DEBUG records
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record):
+        if record.levelno > logging.DEBUG or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "request_id": getattr(record, "request_id", "-"),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def setup_logging(level: str = LOG_LEVEL, json_format: bool = LOG_JSON, debug_sample_rate: float = LOG_DEBUG_SAMPLE_RATE):
+    global _listener, _queue_handler
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    if json_format:
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s"))
+
+    # Filters run on the QueueHandler, i.e. in the request's thread/context
+    queue_handler = logging.handlers.QueueHandler(queue.Queue(-1))
+    queue_handler.addFilter(RequestIdFilter())
+    queue_handler.addFilter(DebugSamplingFilter(debug_sample_rate))
+
+    logger = logging.getLogger("app")
+    logger.setLevel(level)
+    logger.addHandler(queue_handler)
+    logger.propagate = False
+
+    _queue_handler = queue_handler
+    _listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+
+
+# Flush queued records and detach the handler (runs at interpreter exit)
+def shutdown_logging():
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        logging.getLogger("app").removeHandler(_queue_handler)
+        _queue_handler = None
@@ -1,62 +1,56 @@
-from fastapi import FastAPI, Depends, Form, UploadFile, File, HTTPException, Request
+from fastapi import FastAPI, Depends, Form, UploadFile, File, HTTPException, Request, Response
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
+from contextlib import asynccontextmanager
+import logging
 import os
 import shutil
 
-from app.database import engine, get_db
+from app import etag
+from app.bootstrap import bootstrap
+from app.config import ASYNC_DB_ENABLED, BOOTSTRAP_ON_STARTUP
+from app.database import dispose_async_engine, get_db
+from app.log import REQUEST_ID_HEADER, new_request_id, request_id_var, setup_logging
+from app.pagination import NEXT_CURSOR_HEADER
 from app.modules.user_story import crud as story_crud, models as story_models, schemas as story_schemas
 from app.modules.project import crud as project_crud, models as project_models, schemas as project_schemas
-from app.modules.workflow import crud as workflow_crud, models as workflow_models
-from app.modules.auth import models as auth_models, crud as auth_crud, dependencies as auth_deps, router as auth_router
-
-# Create tables
-project_models.Base.metadata.create_all(bind=engine)
-story_models.Base.metadata.create_all(bind=engine)
-workflow_models.Base.metadata.create_all(bind=engine)
-auth_models.Base.metadata.create_all(bind=engine)
-
-# Seed Workflow & Mock Auth Data
-# Seed Workflow
-with Session(engine) as db:
-    workflow_crud.seed_workflow_transitions(db)
-    
-    # Bootstrap Super Admin (admin@admin.com)
-    super_admin_email = "admin@admin.com"
-    super_admin = auth_crud.get_user_by_email(db, super_admin_email)
-    
-    from app.modules.auth.security import get_password_hash
-    
-    if not super_admin:
-        print(f"Bootstrapping Super Admin: {super_admin_email}")
-        user_data = auth_models.User(
-            name="admin",
-            email=super_admin_email,
-            password_hash=get_password_hash("admin@123"),
-            is_active=True,
-            global_role=auth_models.GlobalRole.ADMIN
-        )
-        db.add(user_data)
-        db.commit()
-
-
-    # DEBUG: Print all user stories
-    stories = db.query(story_models.UserStory).all()
-    print("DEBUG: EXISTING STORIES START")
-    for s in stories:
-        print(f"ID: {s.id}, PID: {s.project_id}, Code: {s.story_code}, Title: {s.title}")
-    print("DEBUG: EXISTING STORIES END")
+from app.modules.auth import models as auth_models, dependencies as auth_deps, router as auth_router
+
+setup_logging()
+logger = logging.getLogger(__name__)
+
+# Schema creation and seeding live in app.bootstrap and never run at import time
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if BOOTSTRAP_ON_STARTUP:
+        await run_in_threadpool(bootstrap)
+    yield
+    await dispose_async_engine()
 
 app = FastAPI(
     title="User Story API",
     desc="API to manage User Stories",
     version="2.0",
+    lifespan=lifespan,
 )
 
 app.include_router(auth_router.router)
 
+# Correlate log records with the request (honours an upstream X-Request-ID)
+@app.middleware("http")
+async def request_id_middleware(request: Request, call_next):
+    request_id = request.headers.get(REQUEST_ID_HEADER) or new_request_id()
+    token = request_id_var.set(request_id)
+    try:
+        response = await call_next(request)
+    finally:
+        request_id_var.reset(token)
+    response.headers[REQUEST_ID_HEADER] = request_id
+    return response
+
 # Exception Handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -81,7 +75,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         
         errors.append(msg)
         
-    print(f"DEBUG: 422 Validation Error: {exc.errors()}") # Log FULL details
+    logger.debug("422 validation error on %s: %s", request.url.path, exc.errors())
     return JSONResponse(
         status_code=422,
         content={"detail": errors[0] if len(errors) == 1 else errors},
@@ -89,8 +83,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError):
-    import traceback
-    traceback.print_exc()
+    logger.debug("ValueError on %s", request.url.path, exc_info=exc)
     return JSONResponse(
         status_code=400,
         content={"detail": str(exc)},
@@ -104,6 +97,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, REQUEST_ID_HEADER],
 )
 
 # upload base directory
@@ -115,36 +109,37 @@ os.makedirs(UPLOAD_BASE_DIR, exist_ok=True)
 def root():
     return {"message": "User Story API is running (V2)"}
 
-@app.get("/debug/stories")
-def debug_stories(db: Session = Depends(get_db)):
-    stories = db.query(story_models.UserStory).all()
-    return [{"id": s.id, "pid": s.project_id, "code": s.story_code, "title": s.title} for s in stories]
-
 
 # -------------------- PROJECT ROUTER --------------------
 from app.modules.project import router as project_router
 from app.modules.user_story import router as story_router
-from app.modules.reports import router as reports_router
+from app.modules.reports import router as reports_router, crud as reports_crud
 from app.modules.settings import router as settings_router
-from app.modules.settings import models as settings_models
+from app.modules.workflow import router as workflow_router
 
-settings_models.Base.metadata.create_all(bind=engine)
+# Async read handlers shadow their sync counterparts, so they must be mounted first
+if ASYNC_DB_ENABLED:
+    app.include_router(project_router.async_router)
+    app.include_router(story_router.async_router)
+    app.include_router(reports_router.async_router)
 
 app.include_router(auth_router.router)
 app.include_router(project_router.router)
 app.include_router(story_router.router)
 app.include_router(reports_router.router)
 app.include_router(settings_router.router)
+app.include_router(workflow_router.router)
 
 # -------------------- REPORT ENDPOINTS --------------------
 
 # -------------------- REPORT ENDPOINTS --------------------
 from sqlalchemy import func
 
+# Workspace-wide counts are served from the materialized project_issue_stats counters
 @app.get("/reports/summary", tags=["Reports"])
 def get_reports_summary(db: Session = Depends(get_db)):
     total_projects = db.query(project_models.Project).count()
-    total_issues = db.query(story_models.UserStory).count()
+    total_issues = reports_crud.get_total_issues(db)
     return {
         "total_projects": total_projects,
         "total_issues": total_issues
@@ -152,59 +147,76 @@ def get_reports_summary(db: Session = Depends(get_db)):
 
 @app.get("/reports/issues-by-status", tags=["Reports"])
 def get_issues_by_status(db: Session = Depends(get_db)):
-    # Group by status
-    results = db.query(
-        story_models.UserStory.status, 
-        func.count(story_models.UserStory.id)
-    ).group_by(story_models.UserStory.status).all()
+    results = reports_crud.get_issue_counts_by_status(db)
     
     return [
-        {"status": row[0], "count": row[1]}
+        {"status": row[0], "count": int(row[1])}
         for row in results
     ]
 
 @app.get("/reports/issues-by-type", tags=["Reports"])
 def get_issues_by_type(db: Session = Depends(get_db)):
-    # Group by issue_type
-    results = db.query(
-        story_models.UserStory.issue_type, 
-        func.count(story_models.UserStory.id)
-    ).group_by(story_models.UserStory.issue_type).all()
+    results = reports_crud.get_issue_counts_by_type(db)
     
     return [
-        {"type": row[0], "count": row[1]}
+        {"type": row[0], "count": int(row[1])}
         for row in results
     ]
 
 # -------------------- PROJECT REPORT ENDPOINTS --------------------
 
 @app.get("/projects/{project_id}/reports/summary", tags=["Reports"])
-def get_project_reports_summary(project_id: int, db: Session = Depends(get_db)):
+def get_project_reports_summary(project_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     # Verify Project Exists
-    project = project_crud.get_project_by_id(db, project_id)
-    if not project:
+    version = project_crud.get_change_version(db, project_id)
+    if version is None:
          raise HTTPException(status_code=404, detail="Project not found")
 
-    base_query = db.query(story_models.UserStory).filter(story_models.UserStory.project_id == project_id)
-    
-    total_issues = base_query.count()
-    done = base_query.filter(story_models.UserStory.status == 'done').count()
-    in_progress = base_query.filter(story_models.UserStory.status == 'in_progress').count()
-    backlog = base_query.filter(story_models.UserStory.status == 'backlog').count()
-    
-    return {
-        "total_issues": total_issues,
-        "done": done,
-        "in_progress": in_progress,
-        "backlog": backlog
-    }
+    tag = etag.make_etag("reports:summary", project_id, version)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+    etag.set_etag(response, tag)
+
+    return reports_crud.get_project_summary(db, project_id)
+
+@app.get("/projects/{project_id}/reports/overview", tags=["Reports"])
+def get_project_reports_overview(
+    project_id: int,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    """
+    Status, type, assignee and sprint breakdowns for the project dashboard,
+    computed from a single grouped query.
+    """
+    version = project_crud.get_change_version(db, project_id)
+    if version is None:
+         raise HTTPException(status_code=404, detail="Project not found")
+
+    if not auth_deps.get_current_user_role(project_id, db, current_user):
+         raise HTTPException(status_code=403, detail="Access denied")
+
+    tag = etag.make_etag("reports:overview", project_id, version)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+    etag.set_etag(response, tag)
+
+    return reports_crud.get_project_overview(db, project_id)
 
 @app.get("/projects/{project_id}/reports/issues-by-status", tags=["Reports"])
-def get_project_issues_by_status(project_id: int, db: Session = Depends(get_db)):
+def get_project_issues_by_status(project_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     # Verify Project
-    if not project_crud.get_project_by_id(db, project_id):
+    version = project_crud.get_change_version(db, project_id)
+    if version is None:
          raise HTTPException(status_code=404, detail="Project not found")
 
+    tag = etag.make_etag("reports:issues-by-status", project_id, version)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+    etag.set_etag(response, tag)
+
     results = db.query(
         story_models.UserStory.status, 
         func.count(story_models.UserStory.id)
@@ -217,11 +229,17 @@ def get_project_issues_by_status(project_id: int, db: Session = Depends(get_db))
     ]
 
 @app.get("/projects/{project_id}/reports/issues-by-type", tags=["Reports"])
-def get_project_issues_by_type(project_id: int, db: Session = Depends(get_db)):
+def get_project_issues_by_type(project_id: int, request: Request, response: Response, db: Session = Depends(get_db)):
     # Verify Project
-    if not project_crud.get_project_by_id(db, project_id):
+    version = project_crud.get_change_version(db, project_id)
+    if version is None:
          raise HTTPException(status_code=404, detail="Project not found")
 
+    tag = etag.make_etag("reports:issues-by-type", project_id, version)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+    etag.set_etag(response, tag)
+
     results = db.query(
         story_models.UserStory.issue_type, 
         func.count(story_models.UserStory.id)
@@ -0,0 +1,73 @@
+import threading
+import time
+
+from app.config import ROLE_CACHE_TTL_SECONDS, REVOCATION_REFRESH_SECONDS
+
+
+class RoleCache:
+    """
+    Process-wide, short-TTL cache of {project_id: RoleType} per user.
+    Invalidated by auth.crud whenever a membership is added, changed or removed.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._entries: dict[int, tuple[float, dict]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int):
+        if self.ttl_seconds <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, roles = entry
+            if expires_at < time.monotonic():
+                del self._entries[user_id]
+                return None
+            return roles
+
+    def set(self, user_id: int, roles: dict):
+        if self.ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl_seconds, roles)
+
+    def invalidate(self, user_id: int | None = None):
+        with self._lock:
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+
+role_cache = RoleCache(ROLE_CACHE_TTL_SECONDS)
+
+
+class RevocationList:
+    """
+    In-memory view of users whose tokens must not be trusted statelessly:
+    deactivated users, reloaded from the database every refresh_seconds, so a
+    deactivation applies to every worker within that window.
+    """
+
+    def __init__(self, refresh_seconds: float):
+        self.refresh_seconds = refresh_seconds
+        self._inactive: frozenset[int] = frozenset()
+        self._loaded_at: float | None = None
+        self._lock = threading.Lock()
+
+    def needs_refresh(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at >= self.refresh_seconds
+
+    def refresh(self, inactive_user_ids):
+        with self._lock:
+            self._inactive = frozenset(inactive_user_ids)
+            self._loaded_at = time.monotonic()
+
+    def is_revoked(self, user_id: int) -> bool:
+        return user_id in self._inactive
+
+
+revocations = RevocationList(REVOCATION_REFRESH_SECONDS)
@@ -1,6 +1,14 @@
+import logging
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.modules.auth import models, schemas, security
+from app.modules.auth.cache import role_cache
 from app.modules.project.models import Project
+from app.modules.project import crud as project_crud
+
+logger = logging.getLogger(__name__)
 
 # Fetch user from database using unique user ID
 def get_user_by_id(db: Session, user_id: int):
@@ -10,21 +18,33 @@ def get_user_by_id(db: Session, user_id: int):
 def get_user_by_email(db: Session, email: str):
     return db.query(models.User).filter(models.User.email == email).first()
 
+# IDs of deactivated users, used to refresh the stateless auth revocation list
+def get_inactive_user_ids(db: Session) -> list[int]:
+    rows = db.query(models.User.id).filter(models.User.is_active == False).all()
+    return [row.id for row in rows]
+
+async def get_inactive_user_ids_async(db: AsyncSession) -> list[int]:
+    result = await db.execute(select(models.User.id).where(models.User.is_active == False))
+    return list(result.scalars())
+
+async def get_user_by_id_async(db: AsyncSession, user_id: int):
+    return await db.get(models.User, user_id)
+
 # Create new user in database with hashed password and assigned role
 # Handles bcrypt 72-byte password limit by truncating if necessary
-def create_user(db: Session, user: schemas.UserCreate, global_role: models.GlobalRole):
-    # Bcrypt has a 72 byte limit. 
-    # We must truncate BYTES, not characters.
-    pwd_bytes = user.password.encode('utf-8')
-    
+# Bcrypt has a 72 byte limit.
+# We must truncate BYTES, not characters.
+def truncate_password(password: str) -> str:
+    pwd_bytes = password.encode('utf-8')
     if len(pwd_bytes) > 72:
-        pwd_bytes = pwd_bytes[:72]
-        # Decode back to string for passlib, ignoring partial chars at end
-        truncated_pwd = pwd_bytes.decode('utf-8', errors='ignore')
-    else:
-        truncated_pwd = user.password
-        
-    hashed_password = security.get_password_hash(truncated_pwd)
+        # Decode back to string, ignoring partial chars at end
+        return pwd_bytes[:72].decode('utf-8', errors='ignore')
+    return password
+
+# Pass hashed_password when the hash was already computed off-thread (see security.password_hash_pool)
+def create_user(db: Session, user: schemas.UserCreate, global_role: models.GlobalRole, hashed_password: str | None = None):
+    if hashed_password is None:
+        hashed_password = security.get_password_hash(truncate_password(user.password))
     
     db_user = models.User(
         name=user.name,
@@ -39,6 +59,12 @@ def create_user(db: Session, user: schemas.UserCreate, global_role: models.Globa
     db.refresh(db_user)
     return db_user
 
+# Store an upgraded hash (rehash-on-login after BCRYPT_ROUNDS changes)
+def update_password_hash(db: Session, user: models.User, hashed_password: str):
+    user.password_hash = hashed_password
+    db.commit()
+    db.refresh(user)
+
 # Get user's role in a specific project for RBAC (Role-Based Access Control)
 # Returns role if user is project member, None otherwise
 def get_user_role(db: Session, user_id: int, project_id: int):
@@ -46,12 +72,26 @@ def get_user_role(db: Session, user_id: int, project_id: int):
         models.ProjectMember.user_id == user_id,
         models.ProjectMember.project_id == project_id
     ).first()
-    print(f"DEBUG: get_user_role uid={user_id} pid={project_id} member={member}")
+    logger.debug("get_user_role uid=%s pid=%s member=%s", user_id, project_id, member)
     
     if member:
         return member.role
     return None
 
+# Load every project role of a user in one query: {project_id: RoleType}
+def get_user_roles(db: Session, user_id: int) -> dict:
+    rows = db.query(models.ProjectMember.project_id, models.ProjectMember.role).filter(
+        models.ProjectMember.user_id == user_id
+    ).all()
+    return {row.project_id: row.role for row in rows}
+
+async def get_user_roles_async(db: AsyncSession, user_id: int) -> dict:
+    result = await db.execute(
+        select(models.ProjectMember.project_id, models.ProjectMember.role)
+        .where(models.ProjectMember.user_id == user_id)
+    )
+    return {row.project_id: row.role for row in result}
+
 # Assign or update user role in a project (Admin, Developer, Viewer)
 # Creates new ProjectMember if user not yet in project, updates role if already member
 def assign_role(db: Session, user_id: int, project_id: int, role: models.RoleType):
@@ -60,15 +100,17 @@ def assign_role(db: Session, user_id: int, project_id: int, role: models.RoleTyp
         models.ProjectMember.project_id == project_id
     ).first()
 
-    print(f"DEBUG: assign_role UID={user_id} PID={project_id} TARGET_ROLE={role} EXISTING={member.role if member else 'None'}")
+    logger.debug("assign_role uid=%s pid=%s target_role=%s existing=%s", user_id, project_id, role, member.role if member else None)
 
     if member:
         member.role = role
     else:
         member = models.ProjectMember(user_id=user_id, project_id=project_id, role=role)
         db.add(member)
+    project_crud.bump_change_version(db, project_id)
     
     db.commit()
+    role_cache.invalidate(user_id)
     return member
 
 def get_user_projects(db: Session, user_id: int):
@@ -100,6 +142,8 @@ def remove_project_member(db: Session, user_id: int, project_id: int):
     
     if member:
         db.delete(member)
+        project_crud.bump_change_version(db, project_id)
         db.commit()
+        role_cache.invalidate(user_id)
         return True
     return False
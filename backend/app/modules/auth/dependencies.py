@@ -1,48 +1,152 @@
+from dataclasses import dataclass
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_db, get_async_db
 from app.modules.auth import crud, models, schemas
-from app.config import SECRET_KEY, ALGORITHM
+from app.modules.auth.cache import role_cache, revocations
+from app.config import SECRET_KEY, ALGORITHM, STATELESS_AUTH_ENABLED, STATELESS_AUTH_MAX_TOKEN_LIFETIME_MINUTES
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+@dataclass
+class TokenPrincipal:
+    """
+    Authenticated user built from JWT claims alone (stateless auth fast path).
+    Exposes the same attributes handlers read from models.User.
+    """
+    id: int
+    email: str
+    name: str
+    global_role: models.GlobalRole
+    preferred_role: Optional[models.PreferredRole] = None
+    is_active: bool = True
+
+def stateless_claims_usable(payload: dict) -> bool:
+    # Short-lived token carrying every claim the principal needs
+    issued_at = payload.get("iat")
+    expires_at = payload.get("exp")
+    if issued_at is None or expires_at is None or payload.get("name") is None or payload.get("global_role") is None:
+        return False
+    return expires_at - issued_at <= STATELESS_AUTH_MAX_TOKEN_LIFETIME_MINUTES * 60
+
+def build_principal(payload: dict) -> Optional[TokenPrincipal]:
+    user_id = int(payload["sub"])
+    if revocations.is_revoked(user_id):
+        return None
+
+    try:
+        preferred_role = payload.get("preferred_role")
+        return TokenPrincipal(
+            id=user_id,
+            email=payload.get("email"),
+            name=payload["name"],
+            global_role=models.GlobalRole(payload["global_role"]),
+            preferred_role=models.PreferredRole(preferred_role) if preferred_role else None,
+        )
+    except ValueError:
+        return None
+
+def principal_from_claims(payload: dict, db: Session) -> Optional[TokenPrincipal]:
+    """
+    Build a principal from a verified token without a users SELECT, or return None
+    when the token must be checked against the database instead (long-lived token,
+    missing claims, or the user has been deactivated).
+    """
+    if not stateless_claims_usable(payload):
+        return None
+    if revocations.needs_refresh():
+        revocations.refresh(crud.get_inactive_user_ids(db))
+    return build_principal(payload)
+
+async def principal_from_claims_async(payload: dict, db: AsyncSession) -> Optional[TokenPrincipal]:
+    if not stateless_claims_usable(payload):
+        return None
+    if revocations.needs_refresh():
+        revocations.refresh(await crud.get_inactive_user_ids_async(db))
+    return build_principal(payload)
+
+def credentials_exception():
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+# Verify the JWT and return its claims; raises 401 for bad or incomplete tokens
+def decode_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
         email: str = payload.get("email")
         if user_id is None:
-            raise credentials_exception
-        token_data = schemas.TokenData(id=int(user_id), email=email)
-    except JWTError:
-        raise credentials_exception
+            raise credentials_exception()
+        schemas.TokenData(id=int(user_id), email=email)
+    except (JWTError, ValueError):
+        raise credentials_exception()
+    return payload
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
+    payload = decode_token(token)
+
+    # Opt-in fast path: trust short-lived tokens for identity and global role
+    if STATELESS_AUTH_ENABLED:
+        principal = principal_from_claims(payload, db)
+        if principal is not None:
+            return principal
     
-    user = crud.get_user_by_id(db, user_id=token_data.id)
+    user = crud.get_user_by_id(db, user_id=int(payload["sub"]))
     if user is None:
-        raise credentials_exception
+        raise credentials_exception()
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     
     return user
 
+# Async counterpart of get_current_user for handlers on the async DB path
+async def get_current_user_async(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)):
+    payload = decode_token(token)
+
+    if STATELESS_AUTH_ENABLED:
+        principal = await principal_from_claims_async(payload, db)
+        if principal is not None:
+            return principal
+
+    user = await crud.get_user_by_id_async(db, int(payload["sub"]))
+    if user is None:
+        raise credentials_exception()
+    if not user.is_active:
+        raise HTTPException(status_code=400, detail="Inactive user")
+
+    return user
+
+def get_project_roles(db: Session, user: models.User) -> dict:
+    """
+    All project roles of the user as {project_id: RoleType}.
+    Resolved at most once per request (memoized on the request's User instance),
+    backed by the short-TTL process cache in auth.cache.
+    """
+    roles = getattr(user, "_project_roles", None)
+    if roles is None:
+        roles = role_cache.get(user.id)
+        if roles is None:
+            roles = crud.get_user_roles(db, user.id)
+            role_cache.set(user.id, roles)
+        user._project_roles = roles
+    return roles
+
 def require_role(roles: list[models.RoleType]):
     """
     Dependency factory to check if user has one of the required roles for the project.
     We need project_id from the request.
     """
     def dependency(project_id: int, db: Session = Depends(get_db), user: models.User = Depends(get_current_user)):
-        if user.global_role == models.GlobalRole.ADMIN:
-            user_role = models.RoleType.ADMIN
-        else:
-            user_role = crud.get_user_role(db, user.id, project_id)
+        user_role = get_current_user_role(project_id, db, user)
         
         # If no role assigned, deny access
         if not user_role:
@@ -61,10 +165,26 @@ def require_role(roles: list[models.RoleType]):
 def get_current_user_role(project_id: int, db: Session, user: models.User):
      """
      Helper to get role for logic, requires explicit user object now.
+     Served from the per-request role map, so repeated checks cost no queries.
      """
      if user.global_role == models.GlobalRole.ADMIN:
          return models.RoleType.ADMIN
-     return crud.get_user_role(db, user.id, project_id)
+     return get_project_roles(db, user).get(project_id)
+
+async def get_project_roles_async(db: AsyncSession, user: models.User) -> dict:
+    roles = getattr(user, "_project_roles", None)
+    if roles is None:
+        roles = role_cache.get(user.id)
+        if roles is None:
+            roles = await crud.get_user_roles_async(db, user.id)
+            role_cache.set(user.id, roles)
+        user._project_roles = roles
+    return roles
+
+async def get_current_user_role_async(project_id: int, db: AsyncSession, user: models.User):
+    if user.global_role == models.GlobalRole.ADMIN:
+        return models.RoleType.ADMIN
+    return (await get_project_roles_async(db, user)).get(project_id)
 
 class Permissions:
     @staticmethod
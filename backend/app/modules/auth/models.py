@@ -44,7 +44,4 @@ class ProjectMember(Base):
     role = Column(Enum(RoleType), default=RoleType.VIEWER, nullable=False)
 
     user = relationship("User", back_populates="project_memberships")
-    # Assuming Project model has a relationship back to members if needed, 
-    # but for now we just need the ForeignKey. 
-    # If we want to access project from here:
-    # project = relationship("Project") 
+    project = relationship("app.modules.project.models.Project", back_populates="members")
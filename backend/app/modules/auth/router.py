@@ -1,21 +1,29 @@
-from datetime import timedelta
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from fastapi.security import OAuth2PasswordRequestForm
 import re
 
 from app.database import get_db
 from app.modules.auth import crud, schemas, security, dependencies, models
-from app.config import ACCESS_TOKEN_EXPIRE_MINUTES
 
 router = APIRouter(
     prefix="/auth",
     tags=["Authentication"]
 )
 
+# Turn a saturated hashing pool into a retryable 503 instead of queueing without bound
+async def run_hashing(coro):
+    try:
+        return await coro
+    except security.PasswordHashPoolBusy as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "1"})
+
+# Register and login are async so bcrypt runs on the dedicated hashing pool;
+# their few blocking DB calls go through the threadpool
 @router.post("/register", response_model=schemas.Token)
-def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
     # 1. Check Passwords Match
     if user.password != user.confirm_password:
         raise HTTPException(status_code=400, detail="Passwords do not match.")
@@ -25,7 +33,7 @@ def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail="Password must be at least 8 characters long.")
     
     # 3. Check Email Existence
-    db_user = crud.get_user_by_email(db, email=user.email)
+    db_user = await run_in_threadpool(crud.get_user_by_email, db, user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
@@ -38,25 +46,26 @@ def register(user: schemas.UserCreate, db: Session = Depends(get_db)):
         
     # Map 'role' from input to 'preferred_role' in DB
     # We explicitly set preferred_role to what the user chose (Developer, Tester, etc.)
-    new_user = crud.create_user(db=db, user=user, global_role=assigned_role)
+    hashed_password = await run_hashing(security.get_password_hash_async(crud.truncate_password(user.password)))
+    new_user = await run_in_threadpool(crud.create_user, db, user, assigned_role, hashed_password)
     # Note: crud.create_user needs to handle 'role' -> 'preferred_role' mapping if it uses .dict()
     # Let's verify crud.create_user, but typically we pass the sqlalchemy model.
     # Actually, let's look at crud.py. If it takes schema, we might need to adjust it or passed args.
     # For now, let's assume crud.create_user takes the schema and we might need to update it too.
     
     # Auto-login after register
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token_expires = security.access_token_lifetime()
     access_token = security.create_access_token(
-        data={"sub": str(new_user.id), "email": new_user.email, "global_role": new_user.global_role.value}, 
+        data=security.user_token_claims(new_user),
         expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
 
 @router.post("/login", response_model=schemas.Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     # Note: OAuth2PasswordRequestForm expects username (we use email) and password
-    user = crud.get_user_by_email(db, email=form_data.username)
-    if not user or not security.verify_password(form_data.password, user.password_hash):
+    user = await run_in_threadpool(crud.get_user_by_email, db, form_data.username)
+    if not user or not await run_hashing(security.verify_password_async(form_data.password, user.password_hash)):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -66,10 +75,18 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
 
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    # Transparently upgrade hashes made with an old cost factor; best effort
+    if security.password_needs_rehash(user.password_hash):
+        try:
+            new_hash = await security.get_password_hash_async(crud.truncate_password(form_data.password))
+            await run_in_threadpool(crud.update_password_hash, db, user, new_hash)
+        except security.PasswordHashPoolBusy:
+            pass
+
+    access_token_expires = security.access_token_lifetime()
     # Include global_role in token
     access_token = security.create_access_token(
-        data={"sub": str(user.id), "email": user.email, "global_role": user.global_role.value}, 
+        data=security.user_token_claims(user),
         expires_delta=access_token_expires
     )
     return {"access_token": access_token, "token_type": "bearer"}
@@ -1,8 +1,16 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import jwt
 import bcrypt
-from app.config import SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES
+from app.config import (
+    SECRET_KEY, ALGORITHM, ACCESS_TOKEN_EXPIRE_MINUTES,
+    STATELESS_AUTH_ENABLED, STATELESS_AUTH_MAX_TOKEN_LIFETIME_MINUTES,
+    BCRYPT_ROUNDS, PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE
+)
 
 def verify_password(plain_password, hashed_password):
     if isinstance(plain_password, str):
@@ -11,7 +19,7 @@ def verify_password(plain_password, hashed_password):
         hashed_password = hashed_password.encode('utf-8')
     return bcrypt.checkpw(plain_password, hashed_password)
 
-def get_password_hash(password):
+def get_password_hash(password, rounds: int | None = None):
     if isinstance(password, str):
         password = password.encode('utf-8')
     
@@ -19,9 +27,106 @@ def get_password_hash(password):
     if len(password) > 72:
         password = password[:72]
         
-    hashed = bcrypt.hashpw(password, bcrypt.gensalt())
+    hashed = bcrypt.hashpw(password, bcrypt.gensalt(rounds or BCRYPT_ROUNDS))
     return hashed.decode('utf-8')
 
+# True when a stored hash was made with a different cost than BCRYPT_ROUNDS ("$2b$<cost>$...")
+def password_needs_rehash(hashed_password: str) -> bool:
+    try:
+        return int(hashed_password.split("$")[2]) != BCRYPT_ROUNDS
+    except (AttributeError, IndexError, ValueError):
+        return False
+
+
+class PasswordHashPoolBusy(Exception):
+    pass
+
+
+class PasswordHashPool:
+    """
+    Dedicated, bounded pool for bcrypt work. bcrypt releases the GIL, so threads give
+    real parallelism while keeping logins off the request threadpool. At most
+    workers + max_queue calls are admitted; the rest fail fast with PasswordHashPoolBusy.
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.running = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _run(self, fn, args, submitted_at):
+        waited = time.perf_counter() - submitted_at
+        with self._lock:
+            self.running += 1
+            self.total_wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        return fn(*args)
+
+    # Frees the admission slot; runs on completion and also when a queued job is
+    # cancelled (e.g. the awaiting request was disconnected), where _run never starts
+    def _release(self, future):
+        with self._lock:
+            self.pending -= 1
+            if not future.cancelled():
+                self.running -= 1
+                self.completed += 1
+
+    def submit(self, fn, *args):
+        with self._lock:
+            if self.pending >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise PasswordHashPoolBusy("Too many concurrent authentication requests, retry shortly")
+            self.pending += 1
+        try:
+            future = self._executor.submit(self._run, fn, args, time.perf_counter())
+        except BaseException:
+            with self._lock:
+                self.pending -= 1
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    async def run(self, fn, *args):
+        return await asyncio.wrap_future(self.submit(fn, *args))
+
+    def metrics(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self.running,
+                "queued": self.pending - self.running,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait_seconds * 1000 / self.completed, 3) if self.completed else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 3),
+                "bcrypt_rounds": BCRYPT_ROUNDS,
+            }
+
+
+password_hash_pool = PasswordHashPool(PASSWORD_HASH_WORKERS, PASSWORD_HASH_MAX_QUEUE)
+
+async def verify_password_async(plain_password, hashed_password) -> bool:
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password) -> str:
+    return await password_hash_pool.run(get_password_hash, password)
+
+# Lifetime of tokens issued by login/register; capped in stateless mode so the
+# tokens qualify for the fast path
+def access_token_lifetime() -> timedelta:
+    minutes = ACCESS_TOKEN_EXPIRE_MINUTES
+    if STATELESS_AUTH_ENABLED:
+        minutes = min(minutes, STATELESS_AUTH_MAX_TOKEN_LIFETIME_MINUTES)
+    return timedelta(minutes=minutes)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -29,6 +134,17 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
+
+# Claims embedded in access tokens; enough for the stateless auth fast path
+# to build a principal without loading the user row
+def user_token_claims(user) -> dict:
+    return {
+        "sub": str(user.id),
+        "email": user.email,
+        "name": user.name,
+        "global_role": user.global_role.value,
+        "preferred_role": user.preferred_role.value if user.preferred_role else None,
+    }
@@ -1,5 +1,8 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 from app.modules.project import models, schemas
+from app.modules.auth import models as auth_models
 
 # Create new project with unique name and prefix for issue tracking
 # Validates that both project name and prefix are unique before creation
@@ -25,6 +28,50 @@ def create_project(db: Session, project: schemas.ProjectCreate):
 def get_project_by_id(db: Session, project_id: int):
     return db.query(models.Project).filter(models.Project.id == project_id).first()
 
+async def get_project_by_id_async(db: AsyncSession, project_id: int):
+    result = await db.execute(select(models.Project).where(models.Project.id == project_id))
+    return result.scalars().first()
+
+# -------------------- CHANGE VERSION --------------------
+
+# Bump the project's change version inside the caller's transaction, so cached
+# reads are invalidated exactly when the write commits. Returns the new version;
+# the row stays locked until commit, so versions become visible in order and
+# double as the change_seq of the rows written (incremental sync).
+def bump_change_version(db: Session, project_id: int):
+    db.execute(
+        update(models.Project)
+        .where(models.Project.id == project_id)
+        .values(change_version=models.Project.change_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    return get_change_version(db, project_id)
+
+# Current change version of a project, or None if it does not exist (primary key lookup)
+def get_change_version(db: Session, project_id: int):
+    return db.execute(
+        select(models.Project.change_version).where(models.Project.id == project_id)
+    ).scalar_one_or_none()
+
+async def get_change_version_async(db: AsyncSession, project_id: int):
+    result = await db.execute(select(models.Project.change_version).where(models.Project.id == project_id))
+    return result.scalar_one_or_none()
+
 # Get all projects from database for project listing page
 def get_all_projects(db: Session):
     return db.query(models.Project).all()
+
+# Members of a project with their User rows loaded in the same query (no per-member SELECT)
+def get_project_members(db: Session, project_id: int):
+    return db.query(auth_models.ProjectMember)\
+        .options(joinedload(auth_models.ProjectMember.user))\
+        .filter(auth_models.ProjectMember.project_id == project_id)\
+        .order_by(auth_models.ProjectMember.id)\
+        .all()
+
+# Project with members and their users eager-loaded (3 queries total, independent of member count)
+def get_project_with_members(db: Session, project_id: int):
+    return db.query(models.Project)\
+        .options(selectinload(models.Project.members).selectinload(auth_models.ProjectMember.user))\
+        .filter(models.Project.id == project_id)\
+        .first()
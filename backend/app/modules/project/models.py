@@ -1,4 +1,5 @@
 from sqlalchemy import Column, Integer, String
+from sqlalchemy.orm import relationship
 from app.database import Base
 
 class Project(Base):
@@ -8,3 +9,9 @@ class Project(Base):
     project_name = Column(String(100), unique=True, nullable=False)
     project_prefix = Column(String(10), unique=True, nullable=False)
     increment_number = Column(Integer, default=1, nullable=False)
+    # Bumped (in the writing transaction) on every change to the project's issues or
+    # members; conditional GETs derive their ETags from it
+    change_version = Column(Integer, default=0, server_default="0", nullable=False)
+
+    # Use project_crud.get_project_members / get_project_with_members to eager-load users
+    members = relationship("app.modules.auth.models.ProjectMember", back_populates="project")
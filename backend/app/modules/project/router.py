@@ -1,17 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, UploadFile, File
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Form, UploadFile, File, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
-from app.database import get_db
+from app import etag, events, export
+from app.config import IMPORT_BATCH_SIZE, IMPORT_MAX_BATCH_SIZE
+from app.database import get_db, get_async_db
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor
+from app.modules.reports import crud as reports_crud
 from app.modules.project import crud as project_crud, schemas as project_schemas, models as project_models
 from app.modules.auth import dependencies as auth_deps, models as auth_models, crud as auth_crud
-from app.modules.user_story import models as story_models, schemas as story_schemas, crud as story_crud
+from app.modules.user_story import models as story_models, schemas as story_schemas, crud as story_crud, router as story_router
 from typing import List
+import logging
 import os
 import shutil
+import uuid
 
 router = APIRouter(tags=["Projects"])
 
+logger = logging.getLogger(__name__)
+
 UPLOAD_BASE_DIR = "uploads/user_stories"
+IMPORT_UPLOAD_DIR = "uploads/imports"
 os.makedirs(UPLOAD_BASE_DIR, exist_ok=True)
 
 # -------------------- PROJECT ENDPOINTS --------------------
@@ -34,12 +46,12 @@ def create_project(
         new_project = project_crud.create_project(db, project_data)
         
         # CRITICAL: Assign Creator as ADMIN explicitly
-        print(f"DEBUG: assigning creator {current_user.id} as ADMIN for project {new_project.id}")
+        logger.debug("Assigning creator %s as ADMIN for project %s", current_user.id, new_project.id)
         auth_crud.assign_role(db, current_user.id, new_project.id, auth_models.RoleType.ADMIN)
         
         return new_project
     except Exception as e:
-        print(f"ERROR: create_project failed: {e}")
+        logger.warning("create_project failed: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/projects/{project_id}", response_model=project_schemas.ProjectResponse)
@@ -118,12 +130,14 @@ def delete_project(
 @router.get("/projects/{project_id}/board", tags=["Project Issues"])
 def get_project_board_data(
     project_id: int, 
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: auth_models.User = Depends(auth_deps.get_current_user)
 ):
-    # 1. Fetch Project
-    project = project_crud.get_project_by_id(db, project_id)
-    if not project:
+    # 1. Check Project Exists (change version doubles as the ETag source)
+    version = project_crud.get_change_version(db, project_id)
+    if version is None:
         raise HTTPException(status_code=404, detail="Project not found")
 
     # 3. Check Role (Enforce Access)
@@ -133,9 +147,21 @@ def get_project_board_data(
     if current_user.global_role != auth_models.GlobalRole.ADMIN and not current_role:
           raise HTTPException(status_code=403, detail="You do not have access to this project")
 
+    # Payload carries the caller's role, so the ETag is per user
+    tag = etag.make_etag("board", project_id, version, current_user.id)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+    etag.set_etag(response, tag)
+
+    project = project_crud.get_project_by_id(db, project_id)
+
     # 2. Fetch Issues
-    issues = db.query(story_models.UserStory).filter(story_models.UserStory.project_id == project_id).all()
+    issues = story_crud.get_board_issues(db, project_id)
+
+    return board_payload(project, current_role, current_user, issues)
 
+# Response body of the full board, shared by the sync and async handlers
+def board_payload(project, current_role, current_user, issues):
     return {
         "project": {
             "id": project.id,
@@ -143,22 +169,204 @@ def get_project_board_data(
             "project_prefix": project.project_prefix,
             "currentUserRole": current_role.value if current_role else ("ADMIN" if current_user.global_role == auth_models.GlobalRole.ADMIN else None)
         },
-        "issues": [
-            {
-                "id": issue.id,
-                "story_code": issue.story_code,
-                "title": issue.title,
-                "description": issue.description,
-                "status": issue.status,
-                "issue_type": issue.issue_type,
-                "assignee": issue.assignee, 
-                "project_id": issue.project_id,
-                "sprint_number": issue.sprint_number
-            }
-            for issue in issues
-        ]
+        "issues": [issue._asdict() for issue in issues]
+    }
+
+# Shared access check for the board endpoints; returns (project, role label for the UI)
+def get_board_project(db: Session, project_id: int, current_user):
+    project = project_crud.get_project_by_id(db, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    current_role = auth_deps.get_current_user_role(project_id, db, current_user)
+    if not current_role:
+        raise HTTPException(status_code=403, detail="You do not have access to this project")
+    return project, current_role.value
+
+def board_filters(issue_type, assignee, sprint_number, include_epics, in_sprint):
+    return {
+        "issue_type": issue_type,
+        "assignee": assignee,
+        "sprint_number": sprint_number,
+        "exclude_issue_types": None if include_epics or issue_type else ["epic"],
+        "in_sprint": in_sprint,
     }
 
+@router.get("/projects/{project_id}/board/columns", response_model=story_schemas.BoardColumnsResponse, tags=["Project Issues"])
+def get_project_board_columns(
+    project_id: int,
+    per_column: int = Query(25, ge=1, le=MAX_PAGE_SIZE),
+    statuses: str | None = Query(None, description="Comma separated column statuses; defaults to the board columns"),
+    issue_type: str | None = None,
+    assignee: str | None = None,
+    sprint_number: str | None = None,
+    include_epics: bool = False,
+    in_sprint: bool = Query(False, description="Only cards planned into a sprint"),
+    include_sprints: bool = Query(False, description="Also return the project's sprint numbers for the filter"),
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    """
+    Kanban board sliced by column: the first `per_column` card summaries of each
+    status plus the column's total and a cursor for /board/columns/{status}.
+    Cost is bounded by columns x per_column, not by the project size.
+    """
+    project, role = get_board_project(db, project_id, current_user)
+    filters = board_filters(issue_type, assignee, sprint_number, include_epics, in_sprint)
+    column_statuses = [s.strip() for s in statuses.split(",") if s.strip()] if statuses else story_crud.BOARD_COLUMNS
+
+    counts = reports_crud.get_project_status_counts(db, project_id, **filters)
+    columns = []
+    for column_status in column_statuses:
+        cards, next_id = story_crud.get_board_column(db, project_id, column_status, per_column, **filters)
+        columns.append({
+            "status": column_status,
+            "count": counts.get(column_status, 0),
+            "cards": [card._asdict() for card in cards],
+            "next_cursor": encode_cursor(next_id) if next_id is not None else None,
+        })
+
+    return {
+        "project": {
+            "id": project.id,
+            "project_name": project.project_name,
+            "project_prefix": project.project_prefix,
+            "currentUserRole": role,
+        },
+        "columns": columns,
+        "sprints": story_crud.get_project_sprints(db, project_id) if include_sprints else None,
+    }
+
+@router.get("/projects/{project_id}/board/columns/{status}", response_model=story_schemas.BoardColumn, tags=["Project Issues"])
+def get_project_board_column(
+    project_id: int,
+    status: str,
+    cursor: str | None = None,
+    limit: int = Query(25, ge=1, le=MAX_PAGE_SIZE),
+    issue_type: str | None = None,
+    assignee: str | None = None,
+    sprint_number: str | None = None,
+    include_epics: bool = False,
+    in_sprint: bool = False,
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    # Next cards of one column; the client appends them without refetching the board
+    get_board_project(db, project_id, current_user)
+    filters = board_filters(issue_type, assignee, sprint_number, include_epics, in_sprint)
+    after_id = int(decode_cursor(cursor)[0]) if cursor else None
+
+    cards, next_id = story_crud.get_board_column(db, project_id, status, limit, after_id=after_id, **filters)
+    counts = reports_crud.get_project_status_counts(db, project_id, **filters)
+    return {
+        "status": status,
+        "count": counts.get(status, 0),
+        "cards": [card._asdict() for card in cards],
+        "next_cursor": encode_cursor(next_id) if next_id is not None else None,
+    }
+
+@router.get("/projects/{project_id}/issues/changes", response_model=story_schemas.IssueChangesResponse, tags=["Project Issues"])
+def get_project_issue_changes(
+    project_id: int,
+    since: str | None = Query(None, description="Cursor from the previous response; omit for a full snapshot"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    """
+    Incremental sync: issues created or updated after `since`, plus tombstones for
+    deleted ones. Keep calling with the returned cursor while `has_more` is true.
+    """
+    if project_crud.get_change_version(db, project_id) is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not auth_deps.get_current_user_role(project_id, db, current_user):
+        raise HTTPException(status_code=403, detail="You do not have access to this project")
+
+    after_seq, after_id = (int(value) for value in decode_cursor(since, size=2)) if since else (0, 0)
+    changes, deleted, next_cursor, has_more = story_crud.get_project_changes(
+        db, project_id, limit, after_seq=after_seq, after_id=after_id
+    )
+    return {
+        "changes": story_router.serialize_list_rows(changes),
+        "deleted": [row._asdict() for row in deleted],
+        "cursor": encode_cursor(*next_cursor),
+        "has_more": has_more,
+    }
+
+@router.get("/projects/{project_id}/issues/export", tags=["Project Issues"])
+def export_project_issues(
+    project_id: int,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    include_activity: bool = False,
+    gzip: bool = False,
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    """
+    Streamed export of every issue in the project, optionally followed by their
+    activity rows, as NDJSON or CSV (each record carries a `record_type`).
+    With `gzip=true` the file is compressed on the fly.
+    """
+    project = project_crud.get_project_by_id(db, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    if not auth_deps.get_current_user_role(project_id, db, current_user):
+        raise HTTPException(status_code=403, detail="You do not have access to this project")
+
+    records = story_crud.iter_project_export(db, project_id, include_activity=include_activity)
+    if format == "csv":
+        columns = story_crud.CHANGE_FIELDS + ["change_seq"]
+        if include_activity:
+            columns += [f for f in story_crud.EXPORT_ACTIVITY_FIELDS if f not in columns]
+        lines = export.csv_lines(records, columns)
+        media_type = "text/csv"
+    else:
+        lines = export.ndjson_lines(records)
+        media_type = "application/x-ndjson"
+
+    body = export.encode_chunks(lines)
+    filename = f"{project.project_prefix}-issues.{format}"
+    if gzip:
+        body = export.gzip_chunks(body)
+        media_type = "application/gzip"
+        filename += ".gz"
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+# Access check for a live event stream; releases the session's pooled connection,
+# since the stream itself never touches the database
+def authorize_event_stream(db: Session, project_id: int, current_user):
+    try:
+        if project_crud.get_change_version(db, project_id) is None:
+            raise HTTPException(status_code=404, detail="Project not found")
+        if not auth_deps.get_current_user_role(project_id, db, current_user):
+            raise HTTPException(status_code=403, detail="You do not have access to this project")
+    finally:
+        db.close()
+
+@router.get("/projects/{project_id}/events", tags=["Project Issues"])
+async def stream_project_issue_events(
+    project_id: int,
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    """
+    Server-Sent Events stream of story created / updated / status_changed / deleted
+    events for the project, published after each write commits. Access is checked
+    once when the stream opens. Event ids are the issues' change_seq; after a
+    reconnect or a `resync` event, catch up via /issues/changes.
+    """
+    await run_in_threadpool(authorize_event_stream, db, project_id, current_user)
+    return StreamingResponse(
+        events.stream_project_events(project_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 # -------------------- ISSUE MANAGEMENT --------------------
 
 @router.post("/projects/{project_id}/issues", response_model=story_schemas.UserStoryResponse, tags=["Project Issues"])
@@ -186,8 +394,7 @@ def create_project_issue(
 
     # 2. Strict Role Check (ADMIN, SCRUM_MASTER, DEVELOPER, TESTER)
     user_role = auth_deps.get_current_user_role(project_id, db, current_user)
-    display_role = user_role if user_role else "None"
-    print(f"DEBUG: create_issue User {current_user.email} (ID: {current_user.id}) Role: {display_role}")
+    logger.debug("create_issue user_id=%s role=%s", current_user.id, user_role)
     
     if not user_role or not auth_deps.Permissions.can_create_issue(user_role):
          raise HTTPException(
@@ -195,21 +402,16 @@ def create_project_issue(
              detail=f"Permission denied. Role: {user_role} ({type(user_role)}) UID: {current_user.id} PID: {project_id}"
          )
 
+    # Copy the upload before title resolution locks the project row: the lock is held
+    # until commit, and only a rename into the story folder happens while it is held
+    staged_path = None
+    if support_doc:
+        staged_path = os.path.join(UPLOAD_BASE_DIR, f".{uuid.uuid4().hex}.upload")
+        with open(staged_path, "wb") as buffer:
+            shutil.copyfileobj(support_doc.file, buffer)
+
     # 3. Check Business Rules (Duplicate Title) - Auto-resolve duplicates
-    base_title = title
-    counter = 1
-    while True:
-        existing_story = db.query(story_models.UserStory).filter(
-            story_models.UserStory.project_id == project_id,
-            story_models.UserStory.title == title
-        ).first()
-        
-        if not existing_story:
-            break
-            
-        # If exists, append counter
-        title = f"{base_title} ({counter})"
-        counter += 1
+    title = story_crud.resolve_unique_titles(db, project_id, [title])[0]
 
     # Convert empty strings to None for date fields
     if start_date == "":
@@ -235,23 +437,27 @@ def create_project_issue(
             end_date=end_date,
         )
     except Exception as e:
+        discard_staged_upload(staged_path)
+        db.rollback()
         raise HTTPException(status_code=422, detail=str(e).replace("\n", " "))
 
     # 5. Create Issue with Safety Net
     try:
         db_story = story_crud.create_user_story(db, story_data, None, user_id=current_user.id)
     except IntegrityError as e:
+        discard_staged_upload(staged_path)
         db.rollback()
-        # DEBUG: Expose internal error
-        print(f"DEBUG: IntegrityError: {e}")
+        logger.info("create_issue conflict in project %s: %s", project_id, e.orig if hasattr(e, 'orig') else e)
         raise HTTPException(
             status_code=409,
             detail=f"Database Conflict: {e.orig if hasattr(e, 'orig') else str(e)}"
         )
     except ValueError as e:
+        discard_staged_upload(staged_path)
         db.rollback()
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
+        discard_staged_upload(staged_path)
         db.rollback()
         raise HTTPException(status_code=400, detail="Unexpected error during creation.")
 
@@ -259,10 +465,9 @@ def create_project_issue(
     story_folder = os.path.join(UPLOAD_BASE_DIR, str(db_story.id))
     os.makedirs(story_folder, exist_ok=True)
 
-    if support_doc:
+    if staged_path:
         file_path = os.path.join(story_folder, support_doc.filename)
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(support_doc.file, buffer)
+        os.replace(staged_path, file_path)
 
         db_story.support_doc_path = file_path
         # db.commit() -- Removed here, will commit at the end
@@ -295,14 +500,128 @@ def create_project_issue(
             "created_at": db_story.created_at
         }
     except Exception as e:
-        print(f"CRITICAL ERROR generating response or committing: {e}")
-        import traceback
-        with open("error_log.txt", "w") as f:
-            f.write(f"Error: {e}\n")
-            traceback.print_exc(file=f)
+        logger.exception("Story creation failed in project %s", project_id)
         raise HTTPException(status_code=500, detail=f"Story creation failed: {str(e)}")
 
 
+def discard_staged_upload(path: str | None):
+    if path and os.path.exists(path):
+        os.remove(path)
+
+
+@router.post("/projects/{project_id}/issues/bulk", response_model=story_schemas.UserStoryBulkCreateResponse, tags=["Project Issues"])
+def bulk_create_project_issues(
+    project_id: int,
+    payload: story_schemas.UserStoryBulkCreateRequest,
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    """
+    Create many issues in one transaction (spreadsheet / backlog imports).
+    Rows can reference parents created in the same batch via `ref` / `parent_ref`.
+    Invalid rows are reported in `errors`; with `atomic=true` nothing is created if any row fails.
+    """
+    project = project_crud.get_project_by_id(db, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    user_role = auth_deps.get_current_user_role(project_id, db, current_user)
+    if not user_role or not auth_deps.Permissions.can_create_issue(user_role):
+        raise HTTPException(status_code=403, detail="Permission denied. Your role cannot create issues.")
+
+    try:
+        created, errors = story_crud.bulk_create_user_stories(
+            db, project_id, payload.items, user_id=current_user.id, atomic=payload.atomic
+        )
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        raise HTTPException(
+            status_code=409,
+            detail=f"Database Conflict: {e.orig if hasattr(e, 'orig') else str(e)}"
+        )
+
+    return {"created": created, "errors": errors}
+
+
+IMPORT_FORMATS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+@router.post("/projects/{project_id}/issues/import", response_model=story_schemas.IssueImportResponse, status_code=202, tags=["Project Issues"])
+def import_project_issues(
+    project_id: int,
+    background_tasks: BackgroundTasks,
+    file: UploadFile = File(...),
+    format: str | None = Query(None, pattern="^(csv|ndjson)$", description="Defaults to the file extension"),
+    batch_size: int = Query(IMPORT_BATCH_SIZE, ge=1, le=IMPORT_MAX_BATCH_SIZE),
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    """
+    Import a CSV or NDJSON backlog in the background, `batch_size` rows per transaction.
+    Rows use the bulk create fields; parents are given by `parent_ref` (another row's
+    `ref`, listed earlier in the file), `parent_story_code` or `parent_issue_id`.
+    Poll /issues/import/{id} for progress and /issues/import/{id}/errors for rejected rows.
+    """
+    project = project_crud.get_project_by_id(db, project_id)
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    user_role = auth_deps.get_current_user_role(project_id, db, current_user)
+    if not user_role or not auth_deps.Permissions.can_create_issue(user_role):
+        raise HTTPException(status_code=403, detail="Permission denied. Your role cannot create issues.")
+
+    file_format = format or IMPORT_FORMATS.get(os.path.splitext(file.filename or "")[1].lower())
+    if not file_format:
+        raise HTTPException(status_code=400, detail="Unknown file type; pass format=csv or format=ndjson")
+
+    # Keep the upload on disk for the background job (the request's file is closed with the request)
+    os.makedirs(IMPORT_UPLOAD_DIR, exist_ok=True)
+    path = os.path.join(IMPORT_UPLOAD_DIR, f"{uuid.uuid4().hex}.{file_format}")
+    with open(path, "wb") as buffer:
+        shutil.copyfileobj(file.file, buffer)
+
+    job = story_crud.create_import_job(db, project_id, current_user.id, file_format, batch_size)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=db.get_bind())
+    background_tasks.add_task(story_crud.run_issue_import, session_factory, job.id, path)
+    return job
+
+@router.get("/projects/{project_id}/issues/import/{import_id}", response_model=story_schemas.IssueImportResponse, tags=["Project Issues"])
+def get_project_issue_import(
+    project_id: int,
+    import_id: int,
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    if not auth_deps.get_current_user_role(project_id, db, current_user):
+        raise HTTPException(status_code=403, detail="You do not have access to this project")
+
+    job = story_crud.get_import_job(db, project_id, import_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return job
+
+@router.get("/projects/{project_id}/issues/import/{import_id}/errors", response_model=story_schemas.IssueImportErrorsPage, tags=["Project Issues"])
+def get_project_issue_import_errors(
+    project_id: int,
+    import_id: int,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    if not auth_deps.get_current_user_role(project_id, db, current_user):
+        raise HTTPException(status_code=403, detail="You do not have access to this project")
+    if not story_crud.get_import_job(db, project_id, import_id):
+        raise HTTPException(status_code=404, detail="Import not found")
+
+    after_row = int(decode_cursor(cursor)[0]) if cursor else 0
+    errors, next_row = story_crud.list_import_errors(db, import_id, limit, after_row=after_row)
+    return {
+        "errors": errors,
+        "next_cursor": encode_cursor(next_row) if next_row is not None else None,
+    }
+
+
 # -------------------- MEMBER MANAGEMENT --------------------
 
 @router.get("/projects/{project_id}/members", tags=["Members"])
@@ -314,7 +633,7 @@ def get_project_members(
     # Only Admin or Scrum Master can view members (Strict Enforcement)
     role = auth_deps.get_current_user_role(project_id, db, current_user)
     
-    print(f"DEBUG: get_project_members UID={current_user.id} PID={project_id} ROLE={role} ({type(role)})")
+    logger.debug("get_project_members uid=%s pid=%s role=%s", current_user.id, project_id, role)
 
     # Strictly check for Access
     if not role or not auth_deps.Permissions.can_manage_members(role):
@@ -323,11 +642,11 @@ def get_project_members(
              detail="You do not have permission to view project members."
          )
 
-    members = db.query(auth_models.ProjectMember).filter(auth_models.ProjectMember.project_id == project_id).all()
+    members = project_crud.get_project_members(db, project_id)
     
     result = []
     for m in members:
-        user = db.query(auth_models.User).filter(auth_models.User.id == m.user_id).first()
+        user = m.user
         if user:
             result.append({
                 "user_id": user.id,
@@ -347,8 +666,7 @@ def add_project_member(
 ):
     # 1. Check Permissions
     current_role = auth_deps.get_current_user_role(project_id, db, current_user)
-    print(f"DEBUG: add_project_member UID={current_user.id} PID={project_id} ROLE={current_role}")
-    print(f"DEBUG: payload email={email} role={role}")
+    logger.debug("add_project_member uid=%s pid=%s role=%s target_role=%s", current_user.id, project_id, current_role, role)
     
     is_global_admin = current_user.global_role == auth_models.GlobalRole.ADMIN
     
@@ -374,7 +692,7 @@ def add_project_member(
         
         return {"message": "Member added/updated successfully"}
     except Exception as e:
-        print(f"ERROR: add_project_member failed: {e}")
+        logger.warning("add_project_member failed: %s", e)
         # Re-raise HTTPExceptions as is
         if isinstance(e, HTTPException):
             raise e
@@ -409,6 +727,8 @@ def remove_project_member(
 @router.get("/projects/{project_id}/assignees", tags=["Members"])
 def get_project_assignees(
     project_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: auth_models.User = Depends(auth_deps.get_current_user)
 ):
@@ -417,11 +737,19 @@ def get_project_assignees(
     if not role:
          raise HTTPException(status_code=403, detail="Access denied")
 
-    members = db.query(auth_models.ProjectMember).filter(auth_models.ProjectMember.project_id == project_id).all()
+    version = project_crud.get_change_version(db, project_id)
+    if version is None:
+         raise HTTPException(status_code=404, detail="Project not found")
+    tag = etag.make_etag("assignees", project_id, version)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+    etag.set_etag(response, tag)
+
+    members = project_crud.get_project_members(db, project_id)
     
     result = []
     for m in members:
-        user = db.query(auth_models.User).filter(auth_models.User.id == m.user_id).first()
+        user = m.user
         if user:
             result.append({
                 "value": user.name, # For the dropdown value
@@ -430,3 +758,35 @@ def get_project_assignees(
                 "role": m.role.value if hasattr(m.role, 'value') else m.role
             })
     return result
+
+
+# -------------------- ASYNC READ PATH --------------------
+# Mounted ahead of the sync routes when ASYNC_DB_ENABLED (see main.py)
+async_router = APIRouter(
+    tags=["Project Issues"]
+)
+
+@async_router.get("/projects/{project_id}/board")
+async def get_project_board_data_async(
+    project_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user_async)
+):
+    version = await project_crud.get_change_version_async(db, project_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    current_role = await auth_deps.get_current_user_role_async(project_id, db, current_user)
+    if current_user.global_role != auth_models.GlobalRole.ADMIN and not current_role:
+        raise HTTPException(status_code=403, detail="You do not have access to this project")
+
+    tag = etag.make_etag("board", project_id, version, current_user.id)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+    etag.set_etag(response, tag)
+
+    project = await project_crud.get_project_by_id_async(db, project_id)
+    issues = await story_crud.get_board_issues_async(db, project_id)
+    return board_payload(project, current_role, current_user, issues)
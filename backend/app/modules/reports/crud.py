@@ -0,0 +1,276 @@
+from collections import Counter, defaultdict
+
+from sqlalchemy import and_, case, func, literal, or_, select, union_all
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.modules.reports import models
+from app.modules.user_story import models as story_models
+
+# Single grouped pass over a project's issues; every breakdown of the report
+# overview is folded from these rows, whose count is bounded by the number of
+# distinct (status, type, assignee, sprint) combinations rather than issues.
+def project_breakdown_statement(project_id: int):
+    story = story_models.UserStory
+    return select(
+        story.status,
+        story.issue_type,
+        story.assignee,
+        story.sprint_number,
+        func.count(story.id).label("count")
+    ).where(story.project_id == project_id)\
+     .group_by(story.status, story.issue_type, story.assignee, story.sprint_number)
+
+def get_project_breakdown_rows(db: Session, project_id: int):
+    return db.execute(project_breakdown_statement(project_id)).all()
+
+# Status / type / assignee / sprint breakdowns plus summary counters for one project
+def fold_project_overview(project_id: int, rows):
+    by_status, by_type, by_assignee, by_sprint = Counter(), Counter(), Counter(), Counter()
+    for row in rows:
+        by_status[row.status] += row.count
+        by_type[row.issue_type] += row.count
+        by_assignee[row.assignee] += row.count
+        by_sprint[row.sprint_number] += row.count
+
+    return {
+        "project_id": project_id,
+        "total_issues": sum(by_status.values()),
+        "done": by_status.get("done", 0),
+        "in_progress": by_status.get("in_progress", 0),
+        "backlog": by_status.get("backlog", 0),
+        "by_status": [{"status": k, "count": v} for k, v in by_status.most_common()],
+        "by_type": [{"type": k, "count": v} for k, v in by_type.most_common()],
+        "by_assignee": [{"assignee": k, "count": v} for k, v in by_assignee.most_common()],
+        "by_sprint": [{"sprint": k, "count": v} for k, v in sorted(by_sprint.items())],
+    }
+
+def get_project_overview(db: Session, project_id: int):
+    return fold_project_overview(project_id, get_project_breakdown_rows(db, project_id))
+
+async def get_project_overview_async(db: AsyncSession, project_id: int):
+    rows = (await db.execute(project_breakdown_statement(project_id))).all()
+    return fold_project_overview(project_id, rows)
+
+# -------------------- CALENDAR --------------------
+
+# Issues created in [start_date, end_date), limited to project_ids (None = all projects);
+# only the columns the calendar renders are selected
+def calendar_statement(start_date, end_date, project_ids: list[int] | None):
+    story = story_models.UserStory
+    stmt = select(story.id, story.title, story.story_code, story.project_id, story.created_at).where(
+        story.created_at >= start_date,
+        story.created_at < end_date
+    )
+    if project_ids is not None:
+        stmt = stmt.where(story.project_id.in_(project_ids))
+    return stmt
+
+# Group calendar rows by creation day: {"YYYY-MM-DD": [issue, ...]}
+def group_calendar_rows(rows) -> dict:
+    calendar_data = defaultdict(list)
+    for row in rows:
+        calendar_data[row.created_at.strftime("%Y-%m-%d")].append({
+            "id": row.id,
+            "title": row.title,
+            "story_code": row.story_code,
+            "project_id": row.project_id,
+        })
+    return calendar_data
+
+def get_calendar_data(db: Session, start_date, end_date, project_ids: list[int] | None):
+    return group_calendar_rows(db.execute(calendar_statement(start_date, end_date, project_ids)).all())
+
+async def get_calendar_data_async(db: AsyncSession, start_date, end_date, project_ids: list[int] | None):
+    rows = (await db.execute(calendar_statement(start_date, end_date, project_ids))).all()
+    return group_calendar_rows(rows)
+
+# Summary counters in one query using conditional aggregation
+def get_project_summary(db: Session, project_id: int):
+    story = story_models.UserStory
+
+    def count_status(value):
+        return func.coalesce(func.sum(case((story.status == value, 1), else_=0)), 0)
+
+    total, done, in_progress, backlog = db.query(
+        func.count(story.id),
+        count_status("done"),
+        count_status("in_progress"),
+        count_status("backlog"),
+    ).filter(story.project_id == project_id).one()
+
+    return {
+        "total_issues": total,
+        "done": int(done),
+        "in_progress": int(in_progress),
+        "backlog": int(backlog),
+    }
+
+# -------------------- MATERIALIZED COUNTERS --------------------
+
+# Apply counter deltas {(project_id, status, issue_type): delta} inside the caller's
+# transaction, so counters commit or roll back together with the story change
+def adjust_issue_stats(db: Session, deltas: dict):
+    table = models.ProjectIssueStats.__table__
+    dialect = db.get_bind().dialect.name
+
+    for (project_id, status, issue_type), delta in deltas.items():
+        if not delta:
+            continue
+        values = {
+            "project_id": project_id,
+            "status": getattr(status, "value", status),
+            "issue_type": getattr(issue_type, "value", issue_type),
+            "issue_count": delta,
+        }
+        if dialect == "mysql":
+            stmt = mysql_insert(table).values(**values)
+            stmt = stmt.on_duplicate_key_update(issue_count=table.c.issue_count + stmt.inserted.issue_count)
+            db.execute(stmt)
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(table).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["project_id", "status", "issue_type"],
+                set_={"issue_count": table.c.issue_count + stmt.excluded.issue_count}
+            )
+            db.execute(stmt)
+        else:
+            updated = db.execute(
+                table.update()
+                .where(
+                    table.c.project_id == values["project_id"],
+                    table.c.status == values["status"],
+                    table.c.issue_type == values["issue_type"]
+                )
+                .values(issue_count=table.c.issue_count + delta)
+            ).rowcount
+            if not updated:
+                db.execute(table.insert().values(**values))
+
+# Recompute every counter from user_story (drift repair / first deploy)
+def rebuild_issue_stats(db: Session):
+    table = models.ProjectIssueStats.__table__
+    story = story_models.UserStory
+    grouped = db.query(
+        story.project_id, story.status, story.issue_type, func.count(story.id)
+    ).group_by(story.project_id, story.status, story.issue_type)
+
+    db.execute(table.delete())
+    db.execute(table.insert().from_select(["project_id", "status", "issue_type", "issue_count"], grouped))
+    db.commit()
+
+def get_total_issues(db: Session) -> int:
+    total = db.query(func.sum(models.ProjectIssueStats.issue_count)).scalar()
+    return int(total or 0)
+
+# Per-status issue counts for one project (board column headers). Served from the
+# counters unless the filter needs columns they don't carry (assignee, sprint).
+def get_project_status_counts(
+    db: Session,
+    project_id: int,
+    issue_type: str | None = None,
+    exclude_issue_types: list[str] | None = None,
+    assignee: str | None = None,
+    sprint_number: str | None = None,
+    in_sprint: bool = False,
+) -> dict:
+    if assignee is None and sprint_number is None and not in_sprint:
+        source = models.ProjectIssueStats
+        count = func.sum(source.issue_count)
+    else:
+        source = story_models.UserStory
+        count = func.count(source.id)
+
+    query = db.query(source.status, count).filter(source.project_id == project_id)
+    if issue_type is not None:
+        query = query.filter(source.issue_type == issue_type)
+    if exclude_issue_types:
+        query = query.filter(source.issue_type.not_in(exclude_issue_types))
+    if assignee is not None:
+        query = query.filter(source.assignee == assignee)
+    if sprint_number is not None:
+        query = query.filter(source.sprint_number == sprint_number)
+    if in_sprint:
+        query = query.filter(source.sprint_number.is_not(None), source.sprint_number != "")
+
+    return {status: int(total or 0) for status, total in query.group_by(source.status).all()}
+
+# Workspace-wide issue counts per status / per type, read from the counters
+def get_issue_counts_by_status(db: Session):
+    stats = models.ProjectIssueStats
+    total = func.sum(stats.issue_count)
+    return db.query(stats.status, total).group_by(stats.status).having(total > 0).all()
+
+def get_issue_counts_by_type(db: Session):
+    stats = models.ProjectIssueStats
+    total = func.sum(stats.issue_count)
+    return db.query(stats.issue_type, total).group_by(stats.issue_type).having(total > 0).all()
+
+
+# -------------------- TIMELINE FEED --------------------
+
+# Append timeline events inside the caller's transaction, so the feed commits or
+# rolls back with the story change. Each event carries project_id, story_id,
+# story_code, title, event_type and description.
+def add_timeline_events(db: Session, events: list[dict]):
+    if events:
+        db.execute(models.TimelineEvent.__table__.insert(), events)
+
+# Newest events of project_ids created at or after `since`, keyset-paginated on
+# (created_at, id); `before` is the last key of the previous page. Each project is
+# read as its own ix_event_feed_project_created range capped at limit + 1 rows and
+# the ranges are merged with UNION ALL, so a page costs O(projects x limit) no matter
+# how busy the window was. Returns (rows, next_key).
+def get_timeline_page(db: Session, project_ids: list[int], since, limit: int, before: tuple | None = None):
+    if not project_ids:
+        return [], None
+    event = models.TimelineEvent
+
+    def project_range(project_id):
+        stmt = select(
+            event.id, event.project_id, event.story_id, event.story_code, event.title,
+            event.event_type, event.description, event.created_at
+        ).where(event.project_id == project_id, event.created_at >= since)
+        if before is not None:
+            created_at, event_id = before
+            stmt = stmt.where(or_(
+                event.created_at < created_at,
+                and_(event.created_at == created_at, event.id < event_id)
+            ))
+        return stmt.order_by(event.created_at.desc(), event.id.desc()).limit(limit + 1)
+
+    if len(project_ids) == 1:
+        stmt = project_range(project_ids[0])
+    else:
+        merged = union_all(*[project_range(pid).subquery().select() for pid in project_ids]).subquery()
+        stmt = select(merged).order_by(merged.c.created_at.desc(), merged.c.id.desc()).limit(limit + 1)
+
+    rows = db.execute(stmt).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, (rows[-1].created_at, rows[-1].id)
+    return rows, None
+
+# Recompute the feed from user_story and its activity log (first deploy / repair):
+# one "created" event per issue and one "updated" event per later save
+def rebuild_event_feed(db: Session):
+    table = models.TimelineEvent.__table__
+    story = story_models.UserStory
+    activity = story_models.UserStoryActivity
+    columns = ["project_id", "story_id", "story_code", "title", "event_type", "description", "created_at"]
+
+    created = select(
+        story.project_id, story.id, story.story_code, story.title,
+        literal("created"), literal("Issue created"), story.created_at
+    )
+    updated = select(
+        story.project_id, story.id, story.story_code, story.title,
+        literal("updated"), activity.changes, activity.created_at
+    ).join(story, story.id == activity.story_id).where(activity.action != "CREATED")
+
+    db.execute(table.delete())
+    db.execute(table.insert().from_select(columns, created))
+    db.execute(table.insert().from_select(columns, updated))
+    db.commit()
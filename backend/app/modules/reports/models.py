@@ -0,0 +1,42 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.database import Base
+
+class ProjectIssueStats(Base):
+    """
+    Materialized issue counters per (project, status, issue_type).
+    Maintained in the same transaction as every story create / status change / delete
+    (see reports.crud.adjust_issue_stats) so report endpoints read O(projects) rows
+    instead of scanning user_story. Rebuild with rebuild_issue_stats.py if it drifts.
+    """
+    __tablename__ = "project_issue_stats"
+
+    project_id = Column(Integer, ForeignKey("project.id", ondelete="CASCADE"), primary_key=True)
+    status = Column(String(50), primary_key=True)
+    issue_type = Column(String(20), primary_key=True)
+    issue_count = Column(Integer, nullable=False, default=0)
+
+
+class TimelineEvent(Base):
+    """
+    Append-only feed behind the reports timeline: one row per issue creation and
+    per later save, written in the same transaction as the story change (see
+    reports.crud.add_timeline_events). Story code and title are copied at event
+    time so pages are read from this table alone. Rebuild with rebuild_event_feed.py.
+    """
+    __tablename__ = "event_feed"
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("project.id", ondelete="CASCADE"), nullable=False)
+    story_id = Column(Integer, ForeignKey("user_story.id", ondelete="CASCADE"), nullable=False, index=True)
+    story_code = Column(String(50), nullable=False)
+    title = Column(String(200), nullable=False)
+
+    event_type = Column(String(20), nullable=False)  # created, updated
+    description = Column(Text, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # Newest-first pages per project, keyset on (created_at, id)
+        Index('ix_event_feed_project_created', 'project_id', 'created_at', 'id'),
+    )
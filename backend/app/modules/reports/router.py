@@ -1,20 +1,37 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func, cast, Date, desc
 from typing import List, Optional
 from datetime import date, datetime, timedelta
 import collections
 
-from app.database import get_db
-from app.modules.user_story import models as story_models
+from app import etag
+from app.database import get_db, get_async_db
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, decode_timestamp_cursor, encode_cursor
 from app.modules.auth import dependencies as auth_deps
 from app.modules.auth import models as auth_models
+from app.modules.reports import crud as reports_crud
+from app.modules.project import crud as project_crud
 
 router = APIRouter(
     prefix="/reports",
     tags=["Reports"]
 )
 
+# Calendar month "YYYY-MM" -> [first day, first day of next month)
+def parse_month(month: str):
+    try:
+        start_date = datetime.strptime(month, "%Y-%m").date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid month format. Use YYYY-MM")
+    # End date is 1st of next month
+    if start_date.month == 12:
+        end_date = date(start_date.year + 1, 1, 1)
+    else:
+        end_date = date(start_date.year, start_date.month + 1, 1)
+    return start_date, end_date
+
 @router.get("/calendar")
 def get_calendar_data(
     month: str = Query(..., description="YYYY-MM format"),
@@ -22,133 +39,108 @@ def get_calendar_data(
     db: Session = Depends(get_db),
     current_user: auth_models.User = Depends(auth_deps.get_current_user)
 ):
-    try:
-        start_date = datetime.strptime(month, "%Y-%m").date()
-        # End date is 1st of next month
-        if start_date.month == 12:
-            end_date = date(start_date.year + 1, 1, 1)
-        else:
-            end_date = date(start_date.year, start_date.month + 1, 1)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid month format. Use YYYY-MM")
+    start_date, end_date = parse_month(month)
 
     # Access Control for Project
     if project_id:
          if not auth_deps.get_current_user_role(project_id, db, current_user):
              raise HTTPException(status_code=403, detail="Access denied to project")
-    
-    # Query Issues in range
-    query = db.query(story_models.UserStory).filter(
-        story_models.UserStory.created_at >= start_date,
-        story_models.UserStory.created_at < end_date
-    )
-    
-    if project_id:
-        query = query.filter(story_models.UserStory.project_id == project_id)
-    
-    # If no project_id, filter by projects user is member of
-    if not project_id:
-         user_projects = [p.project_id for p in current_user.project_memberships]
-         query = query.filter(story_models.UserStory.project_id.in_(user_projects))
-
-    issues = query.all()
-
-    # Group by Date
-    calendar_data = collections.defaultdict(list)
-    for issue in issues:
-        day_str = issue.created_at.strftime("%Y-%m-%d")
-        calendar_data[day_str].append({
-            "id": issue.id,
-            "title": issue.title,
-            "story_code": issue.story_code,
-            "project_id": issue.project_id,
-            # "project_name": issue.project.project_name # Lazy load risk, opt strictly for id or key
-        })
-    
-    return calendar_data
+         project_ids = [project_id]
+    else:
+         # If no project_id, filter by projects user is member of
+         project_ids = list(auth_deps.get_project_roles(db, current_user))
+
+    return reports_crud.get_calendar_data(db, start_date, end_date, project_ids)
 
 @router.get("/timeline")
 def get_timeline_data(
+    response: Response,
     days: int = 14,
     project_id: Optional[int] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db),
     current_user: auth_models.User = Depends(auth_deps.get_current_user)
 ):
-    end_date = datetime.now()
-    start_date = end_date - timedelta(days=days)
-
-    # 1. Fetch Issues Created
-    issue_query = db.query(story_models.UserStory).filter(
-        story_models.UserStory.created_at >= start_date
-    )
-    
-    # 2. Fetch Activity Events (new system)
-    activity_query = db.query(story_models.UserStoryActivity).filter(
-         story_models.UserStoryActivity.created_at >= start_date
-    )
-
-    # 3. Apply Project Filter / Auth
-    # To filter activity by project, we need to join UserStory
-    activity_query = activity_query.join(story_models.UserStory)
+    """
+    Newest issue events of the last `days` days, read from the precomputed event feed.
+    When more events exist, the X-Next-Cursor header holds the cursor for the next page.
+    """
+    start_date = datetime.now() - timedelta(days=days)
 
     if project_id:
         # Check access
         if not auth_deps.get_current_user_role(project_id, db, current_user):
              raise HTTPException(status_code=403, detail="Access denied")
-        
-        issue_query = issue_query.filter(story_models.UserStory.project_id == project_id)
-        activity_query = activity_query.filter(story_models.UserStory.project_id == project_id)
+        project_ids = [project_id]
     else:
         # Filter by user's projects
-        user_projects = [p.project_id for p in current_user.project_memberships]
-        issue_query = issue_query.filter(story_models.UserStory.project_id.in_(user_projects))
-        activity_query = activity_query.filter(story_models.UserStory.project_id.in_(user_projects))
-
-    issues = issue_query.all()
-    activities = activity_query.all()
-
-    # 4. Merge and Serialize
-    events = []
-    
-    for issue in issues:
-        events.append({
-            "type": "created",
-            "timestamp": issue.created_at,
-            "date": issue.created_at.strftime("%Y-%m-%d"),
-            "time": issue.created_at.strftime("%H:%M"),
-            "project_id": issue.project_id,
-            "issue_id": issue.id,
-            "story_code": issue.story_code,
-            "title": issue.title,
-            "description": "Issue created"
-        })
-        
-    # Get all unique story_ids from activities
-    activity_story_ids = {a.story_id for a in activities}
-    # Fetch stories that were created before start_date but have activities in range
-    missing_ids = activity_story_ids - {i.id for i in issues}
-    if missing_ids:
-        extra_stories = db.query(story_models.UserStory).filter(story_models.UserStory.id.in_(missing_ids)).all()
-        story_map = {s.id: s for s in issues + extra_stories}
+        project_ids = list(auth_deps.get_project_roles(db, current_user))
+
+    before = decode_timestamp_cursor(cursor) if cursor else None
+
+    rows, next_key = reports_crud.get_timeline_page(db, project_ids, start_date, limit, before=before)
+    if next_key is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_key[0].isoformat(), next_key[1])
+
+    return [
+        {
+            "type": row.event_type,
+            "timestamp": row.created_at,
+            "date": row.created_at.strftime("%Y-%m-%d"),
+            "time": row.created_at.strftime("%H:%M"),
+            "project_id": row.project_id,
+            "issue_id": row.story_id,
+            "story_code": row.story_code,
+            "title": row.title,
+            "description": row.description,
+        }
+        for row in rows
+    ]
+
+
+# -------------------- ASYNC READ PATH --------------------
+# Mounted ahead of the sync routes when ASYNC_DB_ENABLED (see main.py)
+async_router = APIRouter(
+    tags=["Reports"]
+)
+
+@async_router.get("/reports/calendar")
+async def get_calendar_data_async(
+    month: str = Query(..., description="YYYY-MM format"),
+    project_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user_async)
+):
+    start_date, end_date = parse_month(month)
+
+    if project_id:
+        if not await auth_deps.get_current_user_role_async(project_id, db, current_user):
+            raise HTTPException(status_code=403, detail="Access denied to project")
+        project_ids = [project_id]
     else:
-        story_map = {s.id: s for s in issues}
-
-    for activity in activities:
-        story = story_map.get(activity.story_id)
-        if story:
-            events.append({
-                "type": "updated",
-                "timestamp": activity.created_at,
-                "date": activity.created_at.strftime("%Y-%m-%d"),
-                "time": activity.created_at.strftime("%H:%M"),
-                "project_id": story.project_id,
-                "issue_id": story.id,
-                "story_code": story.story_code,
-                "title": story.title,
-                "description": activity.changes  # Human-readable text from new system
-            })
-
-    # Sort
-    events.sort(key=lambda x: x["timestamp"], reverse=True)
-    
-    return events
+        project_ids = list(await auth_deps.get_project_roles_async(db, current_user))
+
+    return await reports_crud.get_calendar_data_async(db, start_date, end_date, project_ids)
+
+@async_router.get("/projects/{project_id}/reports/overview")
+async def get_project_reports_overview_async(
+    project_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user_async)
+):
+    version = await project_crud.get_change_version_async(db, project_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    if not await auth_deps.get_current_user_role_async(project_id, db, current_user):
+        raise HTTPException(status_code=403, detail="Access denied")
+
+    tag = etag.make_etag("reports:overview", project_id, version)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+    etag.set_etag(response, tag)
+
+    return await reports_crud.get_project_overview_async(db, project_id)
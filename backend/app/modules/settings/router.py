@@ -3,11 +3,12 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_pool_metrics
 from app.modules.auth import dependencies as auth_deps
 from app.modules.auth import models as auth_models
+from app.modules.auth.security import password_hash_pool
 from app.modules.project import models as project_models
-from app.modules.user_story import models as story_models
+from app.modules.reports import crud as reports_crud
 from . import models, schemas
 
 router = APIRouter(
@@ -92,7 +93,7 @@ def get_system_stats(
 ):
     total_users = db.query(func.count(auth_models.User.id)).scalar()
     total_projects = db.query(func.count(project_models.Project.id)).scalar()
-    total_issues = db.query(func.count(story_models.UserStory.id)).scalar()
+    total_issues = reports_crud.get_total_issues(db)
     
     return {
         "total_users": total_users,
@@ -100,3 +101,21 @@ def get_system_stats(
         "total_issues": total_issues,
         "version": "v1.0"
     }
+
+# --- SYSTEM (Connection pool) ---
+@router.get("/system/pool")
+def get_pool_stats(
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    if current_user.global_role != auth_models.GlobalRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return get_pool_metrics()
+
+# --- SYSTEM (Password hashing pool) ---
+@router.get("/system/password-hashing")
+def get_password_hashing_stats(
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    if current_user.global_role != auth_models.GlobalRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return password_hash_pool.metrics()
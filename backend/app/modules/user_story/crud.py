@@ -1,78 +1,424 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import SQLAlchemyError
-from datetime import datetime
+from sqlalchemy.dialects.mysql import match
+from pydantic import ValidationError
+from datetime import datetime, timezone
+from difflib import SequenceMatcher
+from itertools import islice
 from typing import Dict, Any
+import csv
+import io
 import json
+import logging
+import os
+import re
+from collections import Counter
 from . import models, schemas
-from app.modules.project import models as project_models
+from app import events
+from app.modules.project import models as project_models, crud as project_crud
+from app.modules.reports import crud as reports_crud, models as reports_models
 
-# Fetch all user stories, optionally filtered by project_id for project-specific views
-def get_all_user_stories(db: Session, project_id: int | None = None):
-    query = db.query(models.UserStory)
-    if project_id:
-        query = query.filter(models.UserStory.project_id == project_id)
-    return query.all()
+logger = logging.getLogger(__name__)
+
+# Columns a list caller may request via `fields=`; project_name comes from a join,
+# support_doc is derived from support_doc_path
+LIST_FIELDS = {
+    "id": models.UserStory.id,
+    "project_id": models.UserStory.project_id,
+    "project_name": project_models.Project.project_name,
+    "release_number": models.UserStory.release_number,
+    "sprint_number": models.UserStory.sprint_number,
+    "story_code": models.UserStory.story_code,
+    "assignee": models.UserStory.assignee,
+    "reviewer": models.UserStory.reviewer,
+    "title": models.UserStory.title,
+    "description": models.UserStory.description,
+    "status": models.UserStory.status,
+    "issue_type": models.UserStory.issue_type,
+    "parent_issue_id": models.UserStory.parent_issue_id,
+    "support_doc": models.UserStory.support_doc_path,
+    "start_date": models.UserStory.start_date,
+    "end_date": models.UserStory.end_date,
+    "created_at": models.UserStory.created_at,
+}
+
+# Keyset-paginated story listing with server-side filters and column projection
+# Builds the SELECT shared by the sync and async list paths (limit + 1 rows)
+def build_story_list_statement(
+    fields: list[str],
+    limit: int,
+    after_id: int | None = None,
+    project_id: int | None = None,
+    status: str | None = None,
+    issue_type: str | None = None,
+    assignee: str | None = None,
+    sprint_number: str | None = None,
+    parent_issue_id: int | None = None,
+    exclude_issue_types: list[str] | None = None,
+    in_sprint: bool = False,
+):
+    unknown = [f for f in fields if f not in LIST_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}")
+
+    # id is always selected so the next cursor can be computed
+    if "id" not in fields:
+        fields = ["id"] + fields
+
+    stmt = select(*[LIST_FIELDS[f].label(f) for f in fields]).select_from(models.UserStory)
+    if "project_name" in fields:
+        stmt = stmt.outerjoin(
+            project_models.Project,
+            project_models.Project.id == models.UserStory.project_id
+        )
+
+    if project_id is not None:
+        stmt = stmt.where(models.UserStory.project_id == project_id)
+    if status is not None:
+        stmt = stmt.where(models.UserStory.status == status)
+    if issue_type is not None:
+        stmt = stmt.where(models.UserStory.issue_type == issue_type)
+    if assignee is not None:
+        stmt = stmt.where(models.UserStory.assignee == assignee)
+    if sprint_number is not None:
+        stmt = stmt.where(models.UserStory.sprint_number == sprint_number)
+    if parent_issue_id is not None:
+        stmt = stmt.where(models.UserStory.parent_issue_id == parent_issue_id)
+    if exclude_issue_types:
+        stmt = stmt.where(models.UserStory.issue_type.not_in(exclude_issue_types))
+    if in_sprint:
+        stmt = stmt.where(models.UserStory.sprint_number.is_not(None), models.UserStory.sprint_number != "")
+    if after_id is not None:
+        stmt = stmt.where(models.UserStory.id > after_id)
+
+    # Fetch one extra row to learn whether another page exists
+    return stmt.order_by(models.UserStory.id.asc()).limit(limit + 1)
+
+# Trim the extra row fetched by build_story_list_statement; returns (rows, next_cursor_id)
+def split_story_page(rows, limit: int):
+    next_id = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_id = rows[-1].id
+    return rows, next_id
+
+# Returns (rows, next_cursor_id); rows are lightweight Row tuples keyed by field name
+def list_user_stories(db: Session, fields: list[str], limit: int, **filters):
+    rows = db.execute(build_story_list_statement(fields, limit, **filters)).all()
+    return split_story_page(rows, limit)
+
+async def list_user_stories_async(db: AsyncSession, fields: list[str], limit: int, **filters):
+    rows = (await db.execute(build_story_list_statement(fields, limit, **filters))).all()
+    return split_story_page(rows, limit)
+
+# -------------------- BOARD --------------------
+
+# Card summary shown on the kanban board; no description or attachment columns
+BOARD_CARD_FIELDS = ["id", "story_code", "title", "status", "issue_type", "assignee", "sprint_number", "parent_issue_id", "project_id"]
+BOARD_COLUMNS = ["todo", "in_progress", "testing", "done"]
+
+# Card-sized summary of a story carried by live project events
+def story_event_data(db_story, **overrides):
+    data = {field: getattr(db_story, field) for field in BOARD_CARD_FIELDS}
+    data.update(overrides)
+    return data
+
+# Full board (every issue of the project) in one SELECT of the columns it renders;
+# shared by the sync and async board reads
+BOARD_ISSUE_FIELDS = ["id", "story_code", "title", "description", "status", "issue_type", "assignee", "project_id", "sprint_number"]
+
+def board_issues_statement(project_id: int):
+    return select(*[LIST_FIELDS[f].label(f) for f in BOARD_ISSUE_FIELDS])\
+        .where(models.UserStory.project_id == project_id)\
+        .order_by(models.UserStory.id.asc())
+
+def get_board_issues(db: Session, project_id: int):
+    return db.execute(board_issues_statement(project_id)).all()
+
+async def get_board_issues_async(db: AsyncSession, project_id: int):
+    return (await db.execute(board_issues_statement(project_id))).all()
+
+# Distinct sprint numbers used in a project, for the board's sprint filter
+def get_project_sprints(db: Session, project_id: int) -> list[str]:
+    rows = db.query(models.UserStory.sprint_number).filter(
+        models.UserStory.project_id == project_id,
+        models.UserStory.sprint_number.is_not(None),
+        models.UserStory.sprint_number != ""
+    ).distinct().all()
+    return sorted((row.sprint_number for row in rows), key=lambda s: (not s.isdigit(), int(s) if s.isdigit() else 0, s))
+
+# One board column page: (cards, next_cursor_id), keyset on id like the story list
+def get_board_column(db: Session, project_id: int, status: str, limit: int, after_id: int | None = None, **filters):
+    return list_user_stories(
+        db, BOARD_CARD_FIELDS, limit, after_id=after_id, project_id=project_id, status=status, **filters
+    )
+
+# -------------------- INCREMENTAL SYNC --------------------
+
+# Full list row minus the project join (every change belongs to the requested project)
+CHANGE_FIELDS = [f for f in LIST_FIELDS if f != "project_name"]
+
+# Stories and tombstones of a project written after the (change_seq, id) cursor, in
+# cursor order. Both come from (project_id, change_seq, id) indexes, so the cost follows
+# the size of the delta. Returns (changes, deleted, next_cursor, has_more); next_cursor
+# is the cursor of the last returned entry, or the given one when nothing changed.
+def get_project_changes(db: Session, project_id: int, limit: int, after_seq: int = 0, after_id: int = 0):
+    def after_cursor(seq_column, id_column):
+        return or_(seq_column > after_seq, and_(seq_column == after_seq, id_column > after_id))
+
+    stories = db.execute(
+        select(*[LIST_FIELDS[f].label(f) for f in CHANGE_FIELDS], models.UserStory.change_seq)
+        .where(models.UserStory.project_id == project_id)
+        .where(after_cursor(models.UserStory.change_seq, models.UserStory.id))
+        .order_by(models.UserStory.change_seq, models.UserStory.id)
+        .limit(limit + 1)
+    ).all()
+    tombstones = db.execute(
+        select(
+            models.UserStoryTombstone.story_id.label("id"),
+            models.UserStoryTombstone.story_code,
+            models.UserStoryTombstone.change_seq,
+            models.UserStoryTombstone.deleted_at,
+        )
+        .where(models.UserStoryTombstone.project_id == project_id)
+        .where(after_cursor(models.UserStoryTombstone.change_seq, models.UserStoryTombstone.story_id))
+        .order_by(models.UserStoryTombstone.change_seq, models.UserStoryTombstone.story_id)
+        .limit(limit + 1)
+    ).all()
+
+    # Merge both streams and keep the first `limit` entries in cursor order
+    merged = sorted(
+        [(row.change_seq, row.id, False, row) for row in stories]
+        + [(row.change_seq, row.id, True, row) for row in tombstones],
+        key=lambda entry: (entry[0], entry[1])
+    )
+    has_more = len(merged) > limit
+    merged = merged[:limit]
+
+    changes = [row for _, _, deleted, row in merged if not deleted]
+    deleted = [row for _, _, deleted, row in merged if deleted]
+    next_cursor = (merged[-1][0], merged[-1][1]) if merged else (after_seq, after_id)
+    return changes, deleted, next_cursor, has_more
+
+# -------------------- EXPORT --------------------
+
+EXPORT_ACTIVITY_FIELDS = ["id", "story_id", "user_id", "action", "changes", "change_count", "created_at"]
+
+# Stream a project's issues, and optionally their activity rows, as (record_type, dict)
+# pairs. Each query runs on a server-side cursor (yield_per implies stream_results),
+# so memory stays flat however large the project is. The two queries run one after
+# the other because MySQL allows one unbuffered result per connection.
+def iter_project_export(db: Session, project_id: int, include_activity: bool = False, batch_size: int = 1000):
+    issues = db.execute(
+        select(*[LIST_FIELDS[f].label(f) for f in CHANGE_FIELDS], models.UserStory.change_seq)
+        .where(models.UserStory.project_id == project_id)
+        .order_by(models.UserStory.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for row in issues:
+        item = row._asdict()
+        if item["support_doc"]:
+            item["support_doc"] = os.path.basename(item["support_doc"])
+        yield "issue", item
+
+    if not include_activity:
+        return
+
+    activity_columns = models.UserStoryActivity.__table__.c
+    activity = db.execute(
+        select(*[activity_columns[f] for f in EXPORT_ACTIVITY_FIELDS])
+        .join(models.UserStory, models.UserStory.id == models.UserStoryActivity.story_id)
+        .where(models.UserStory.project_id == project_id)
+        .order_by(models.UserStoryActivity.story_id, models.UserStoryActivity.id)
+        .execution_options(yield_per=batch_size)
+    )
+    for row in activity:
+        yield "activity", row._asdict()
+
+# Columns returned by issue search; kept small so result payloads stay tiny
+SEARCH_COLUMNS = (
+    models.UserStory.id,
+    models.UserStory.project_id,
+    project_models.Project.project_name,
+    models.UserStory.story_code,
+    models.UserStory.title,
+    models.UserStory.issue_type,
+    models.UserStory.status,
+)
+
+STORY_CODE_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9]*-\d*$")
+
+# Ranked issue search over story_code, title and description, scoped to project_ids
+# (None = unrestricted, for global admins). Exact/prefix story_code hits rank first,
+# then MySQL FULLTEXT (boolean mode, prefix terms) relevance. Other dialects fall back
+# to LIKE matching so tests can run on SQLite.
+def search_user_stories(db: Session, q: str, project_ids: list[int] | None, limit: int):
+    terms = re.findall(r"\w+", q)
+    if not terms or project_ids == []:
+        return []
+
+    def scoped(query):
+        query = query.select_from(models.UserStory).join(
+            project_models.Project,
+            project_models.Project.id == models.UserStory.project_id
+        )
+        if project_ids is not None:
+            query = query.filter(models.UserStory.project_id.in_(project_ids))
+        return query
+
+    results = []
+    seen = set()
+
+    # 1. Story code prefix (uses ix_user_story_story_code)
+    code = q.strip()
+    if STORY_CODE_PATTERN.match(code):
+        code_hits = scoped(db.query(*SEARCH_COLUMNS))\
+            .filter(models.UserStory.story_code.like(f"{code.upper()}%"))\
+            .order_by(models.UserStory.story_code)\
+            .limit(limit).all()
+        for row in code_hits:
+            seen.add(row.id)
+            results.append(row)
+        if len(results) >= limit:
+            return results
+
+    # 2. Full text over code/title/description
+    if db.get_bind().dialect.name == "mysql":
+        boolean_query = " ".join(f"+{t}*" for t in terms)
+        score = match(
+            models.UserStory.story_code,
+            models.UserStory.title,
+            models.UserStory.description,
+            against=boolean_query
+        ).in_boolean_mode()
+        text_query = scoped(db.query(*SEARCH_COLUMNS))\
+            .filter(score > 0)\
+            .order_by(score.desc(), models.UserStory.id.desc())
+    else:
+        text_query = scoped(db.query(*SEARCH_COLUMNS))
+        for t in terms:
+            pattern = f"%{t}%"
+            text_query = text_query.filter(
+                models.UserStory.title.ilike(pattern)
+                | models.UserStory.story_code.ilike(pattern)
+                | models.UserStory.description.ilike(pattern)
+            )
+        text_query = text_query.order_by(models.UserStory.id.desc())
+
+    for row in text_query.limit(limit + len(seen)).all():
+        if row.id in seen:
+            continue
+        results.append(row)
+        if len(results) >= limit:
+            break
+    return results
 
 # Get single user story by unique ID for detail view and updates
 def get_user_story_by_id(db: Session, story_id: int):
     return db.query(models.UserStory).filter(models.UserStory.id == story_id).first()
 
+# (project_id, project change_version) of a story in one indexed join; None if missing.
+# Lets conditional GETs answer 304 without loading the story.
+def story_version_statement(story_id: int):
+    return select(models.UserStory.project_id, project_models.Project.change_version)\
+        .join(project_models.Project, project_models.Project.id == models.UserStory.project_id)\
+        .where(models.UserStory.id == story_id)
+
+def get_story_version(db: Session, story_id: int):
+    return db.execute(story_version_statement(story_id)).first()
+
+async def get_story_version_async(db: AsyncSession, story_id: int):
+    return (await db.execute(story_version_statement(story_id))).first()
+
+# Async lookup; the project is loaded eagerly since lazy loads are unavailable on AsyncSession
+async def get_user_story_by_id_async(db: AsyncSession, story_id: int):
+    result = await db.execute(
+        select(models.UserStory)
+        .options(joinedload(models.UserStory.project))
+        .where(models.UserStory.id == story_id)
+    )
+    return result.scalars().first()
+
+# Format a story code as PREFIX-0001, falling back to the first two letters of the name
+def format_story_code(prefix: str | None, project_name: str | None, number: int) -> str:
+    prefix_val = prefix if prefix else (project_name or "")[:2].upper()
+    return f"{prefix_val}-{number:04d}"
+
+# Atomically reserve `count` consecutive story numbers for a project.
+# Project.increment_number holds the next free number; the UPDATE takes a row lock,
+# so concurrent creators in the same project are serialized instead of racing into
+# unique_project_story_code violations. Returns (first_number, prefix, project_name).
+def allocate_story_numbers(db: Session, project_id: int, count: int = 1):
+    updated = db.query(project_models.Project)\
+        .filter(project_models.Project.id == project_id)\
+        .update(
+            {project_models.Project.increment_number: project_models.Project.increment_number + count},
+            synchronize_session=False
+        )
+    if not updated:
+        raise ValueError("Project not found")
+
+    next_free, prefix, name = db.query(
+        project_models.Project.increment_number,
+        project_models.Project.project_prefix,
+        project_models.Project.project_name
+    ).filter(project_models.Project.id == project_id).one()
+    return next_free - count, prefix, name
+
 # Auto-generate unique story code in format PREFIX-0001 for each new issue
-# Uses project prefix and increments number based on last story in project
+# Draws the number from the project's atomic sequence (see allocate_story_numbers)
 def generate_story_code(db: Session, project_id: int) -> str:
-    # Fetch Project to get prefix
-    project = db.query(project_models.Project).filter(project_models.Project.id == project_id).first()
-    if not project:
-        raise ValueError("Project not found")
-        
-    # Find the last created story to determine the next number
-    last_story = db.query(models.UserStory)\
-        .filter(models.UserStory.project_id == project_id)\
-        .order_by(models.UserStory.id.desc())\
+    number, prefix, name = allocate_story_numbers(db, project_id)
+    return format_story_code(prefix, name, number)
+
+# Escape LIKE wildcards so user supplied titles match literally
+def _like_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+# Make titles unique within a project by appending " (1)", " (2)", ... (first free suffix).
+# Existing "title" / "title (n)" rows are found with one indexed prefix query per chunk
+# of titles (ix_user_story_project_title) instead of one query per candidate.
+# The project row is locked first; story code allocation takes the same lock, so
+# concurrent creators in a project cannot pick the same title before committing.
+# Titles repeated within `titles` are de-duplicated against each other as well.
+def resolve_unique_titles(db: Session, project_id: int, titles: list[str], chunk_size: int = 200) -> list[str]:
+    db.query(project_models.Project.id)\
+        .filter(project_models.Project.id == project_id)\
+        .with_for_update()\
         .first()
 
-    if last_story:
-        # Get the actual Python string value, not the Column object
-        story_code_val = getattr(last_story, 'story_code', None)
-        if story_code_val:
-            try:
-                # Assumes format "PREFIX-0001"
-                last_num = int(story_code_val.split('-')[-1])
-                next_num = last_num + 1
-            except (ValueError, IndexError):
-                # Fallback if code format is weird
-                count = db.query(models.UserStory).filter(models.UserStory.project_id == project_id).count()
-                next_num = count + 1
-        else:
-            next_num = 1
-    else:
-        next_num = 1
-    
-    # Use project_prefix preferred, fallback to name if empty
-    # Extract actual values to avoid Column type issues
-    prefix_raw = getattr(project, 'project_prefix', None)
-    name_raw = getattr(project, 'project_name', '')
-    prefix_val = prefix_raw if prefix_raw else name_raw[:2].upper()
-    
-    return f"{prefix_val}-{next_num:04d}"
+    bases = list(dict.fromkeys(titles))
+    taken: set[str] = set()
+    for start in range(0, len(bases), chunk_size):
+        chunk = bases[start:start + chunk_size]
+        conditions = [models.UserStory.title.in_(chunk)] + [
+            models.UserStory.title.like(f"{_like_escape(base)} (%)", escape="\\") for base in chunk
+        ]
+        rows = db.query(models.UserStory.title).filter(
+            models.UserStory.project_id == project_id,
+            or_(*conditions)
+        ).all()
+        # MySQL's default collation compares titles case-insensitively; mirror that
+        taken.update(row.title.casefold() for row in rows)
 
-# Create new user story/epic/task with auto-generated code and hierarchy validation
-# Validates parent-child relationships (Epic > Story > Task > Subtask) before creation
-def create_user_story(db: Session, story: schemas.UserStoryCreate, file_path: str | None, user_id: int | None = None):
-    print(f"DEBUG: create_user_story called with user_id={user_id}")
-    if user_id is None:
-        print("WARNING: user_id is None, falling back to 1 (System Admin)")
-        user_id = 1
-        
-    # 1. Generate Story Code (Centralized)
-    try:
-        story_code = generate_story_code(db, story.project_id)
-    except ValueError as e:
-        raise ValueError(str(e)) # Re-raise
-    
-    # ---------------- Hierarchy Validation ----------------
-    parent_id = story.parent_issue_id
-    issue_type = story.issue_type
+    resolved = []
+    for base in titles:
+        title = base
+        counter = 1
+        while title.casefold() in taken:
+            title = f"{base} ({counter})"
+            counter += 1
+        taken.add(title.casefold())
+        resolved.append(title)
+    return resolved
+
+# Enforce the Epic > Story > Task > Subtask hierarchy (Bugs may sit under a Story or Task)
+# parent_type is the issue_type of the resolved parent, or None when parent_id was not found
+def validate_hierarchy(issue_type, parent_id: int | None, parent_type: str | None):
+    issue_type = schemas.IssueType(issue_type)
+    parent_type = getattr(parent_type, "value", parent_type)
 
     if issue_type == schemas.IssueType.epic:
         if parent_id is not None:
@@ -81,39 +427,100 @@ def create_user_story(db: Session, story: schemas.UserStoryCreate, file_path: st
     elif issue_type == schemas.IssueType.story:
         if parent_id is None:
              raise ValueError("Stories must belong to an Epic.")
-        parent = db.query(models.UserStory).get(parent_id)
-        if not parent:
+        if parent_type is None:
              raise ValueError("Parent Epic not found.")
-        if parent.issue_type != schemas.IssueType.epic:
-             raise ValueError(f"Story parent must be an Epic, got {parent.issue_type}.")
+        if parent_type != schemas.IssueType.epic:
+             raise ValueError(f"Story parent must be an Epic, got {parent_type}.")
 
     elif issue_type == schemas.IssueType.task:
         if parent_id is None:
              raise ValueError("Tasks must belong to a Story.")
-        parent = db.query(models.UserStory).get(parent_id)
-        if not parent:
+        if parent_type is None:
              raise ValueError("Parent Story not found.")
-        if parent.issue_type != schemas.IssueType.story:
-             raise ValueError(f"Task parent must be a Story, got {parent.issue_type}.")
+        if parent_type != schemas.IssueType.story:
+             raise ValueError(f"Task parent must be a Story, got {parent_type}.")
 
     elif issue_type == schemas.IssueType.subtask:
         if parent_id is None:
              raise ValueError("Subtasks must belong to a Task.")
-        parent = db.query(models.UserStory).get(parent_id)
-        if not parent:
+        if parent_type is None:
              raise ValueError("Parent Task not found.")
-        if parent.issue_type != schemas.IssueType.task:
-             raise ValueError(f"Subtask parent must be a Task, got {parent.issue_type}.")
+        if parent_type != schemas.IssueType.task:
+             raise ValueError(f"Subtask parent must be a Task, got {parent_type}.")
 
     elif issue_type == schemas.IssueType.bug:
         if parent_id:
-            parent = db.query(models.UserStory).get(parent_id)
-            if not parent:
+            if parent_type is None:
                 raise ValueError("Parent issue not found.")
-            if parent.issue_type not in [schemas.IssueType.story, schemas.IssueType.task]:
-                raise ValueError(f"Bug parent must be a Story or Task, got {parent.issue_type}.")
+            if parent_type not in [schemas.IssueType.story, schemas.IssueType.task]:
+                raise ValueError(f"Bug parent must be a Story or Task, got {parent_type}.")
+
+# -------------------- ACTIVITY DIFFS --------------------
+
+# Fields that can appear in an activity's structured diff
+DIFF_FIELDS = set(schemas.UserStoryUpdateRequest.model_fields) | {"status", "title"}
+
+# Text values longer than this are stored in the diff as a delta, not whole
+DIFF_DELTA_MIN_CHARS = 200
+
+# Changed spans turning `old` into `new`, as [position in old, removed, inserted]
+def text_delta(old: str, new: str) -> list:
+    # autojunk would discard common characters and degrade prose diffs to one big replace
+    matcher = SequenceMatcher(None, old, new, autojunk=False)
+    return [
+        [i1, old[i1:i2], new[j1:j2]]
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+def apply_text_delta(old: str, delta: list) -> str:
+    for position, removed, inserted in reversed(delta):
+        old = old[:position] + inserted + old[position + len(removed):]
+    return old
+
+# Structured form of {field: {"old": ..., "new": ...}} for UserStoryActivity.diff
+def build_change_diff(changes: dict) -> dict:
+    diff = {}
+    for field, change in changes.items():
+        old, new = change["old"], change["new"]
+        if isinstance(old, str) and isinstance(new, str) and max(len(old), len(new)) > DIFF_DELTA_MIN_CHARS:
+            diff[field] = {"delta": text_delta(old, new)}
+        else:
+            diff[field] = {"old": old, "new": new}
+    return diff
+
+# Timeline feed row for a story change (see reports.crud.add_timeline_events)
+def timeline_event(db_story, event_type: str, description: str) -> dict:
+    return {
+        "project_id": db_story.project_id,
+        "story_id": db_story.id,
+        "story_code": db_story.story_code,
+        "title": db_story.title,
+        "event_type": event_type,
+        "description": description,
+    }
+
+# Create new user story/epic/task with auto-generated code and hierarchy validation
+# Validates parent-child relationships (Epic > Story > Task > Subtask) before creation
+def create_user_story(db: Session, story: schemas.UserStoryCreate, file_path: str | None, user_id: int | None = None):
+    logger.debug("create_user_story called with user_id=%s", user_id)
+    if user_id is None:
+        logger.warning("create_user_story: user_id is None, falling back to 1 (System Admin)")
+        user_id = 1
+        
+    # ---------------- Hierarchy Validation ----------------
+    parent_id = story.parent_issue_id
+    parent_type = None
+    if parent_id:
+        parent = db.query(models.UserStory).get(parent_id)
+        parent_type = parent.issue_type if parent else None
+    validate_hierarchy(story.issue_type, parent_id, parent_type)
     # ------------------------------------------------------
 
+    # Generate Story Code (Centralized) once the issue is known to be valid
+    story_code = generate_story_code(db, story.project_id)
+    change_seq = project_crud.bump_change_version(db, story.project_id)
+
     db_story = models.UserStory(
         project_id=story.project_id,
         release_number=story.release_number,
@@ -129,7 +536,8 @@ def create_user_story(db: Session, story: schemas.UserStoryCreate, file_path: st
         support_doc_path=file_path,
         start_date=story.start_date,
         end_date=story.end_date,
-        created_by=user_id # Save creator
+        created_by=user_id, # Save creator
+        change_seq=change_seq
     )
     db.add(db_story)
     db.flush() # Flush to get ID, do not commit yet
@@ -150,12 +558,361 @@ def create_user_story(db: Session, story: schemas.UserStoryCreate, file_path: st
         user_id=user_id,
         action="CREATED",
         changes=changes_text,
-        change_count=2
+        change_count=2,
+        diff=build_change_diff({
+            "status": {"old": None, "new": getattr(story.status, "value", story.status)},
+            "title": {"old": None, "new": story.title},
+        })
     )
     db.add(activity)
+
+    reports_crud.adjust_issue_stats(db, {(story.project_id, story.status, story.issue_type): 1})
+    reports_crud.add_timeline_events(db, [timeline_event(db_story, "created", "Issue created")])
+    events.queue_event(db, story.project_id, "story.created", db_story.id, change_seq, story_event_data(db_story))
     
     return db_story
 
+# Create many issues in one transaction with batched hierarchy validation.
+# Rows are validated in memory (existing parents fetched in one query), a contiguous
+# block of story codes is reserved, and stories + CREATED activities are inserted with
+# executemany, one INSERT per hierarchy level. Returns (created, errors) where errors
+# describe rows that were skipped.
+def bulk_create_user_stories(
+    db: Session,
+    project_id: int,
+    raw_items: list[dict],
+    user_id: int,
+    atomic: bool = False,
+):
+    errors: dict[int, str] = {}
+    items: dict[int, schemas.UserStoryBulkItem] = {}
+
+    # 1. Per-row schema validation
+    for index, raw in enumerate(raw_items):
+        try:
+            items[index] = schemas.UserStoryBulkItem(**raw)
+        except ValidationError as e:
+            first = e.errors()[0]
+            field = ".".join(str(loc) for loc in first["loc"])
+            errors[index] = f"{field}: {first['msg']}" if field else first["msg"]
+        except TypeError:
+            errors[index] = "Row must be a JSON object"
+
+    # 2. Client-side keys
+    ref_index: dict[str, int] = {}
+    for index, item in items.items():
+        if item.ref is None:
+            continue
+        if item.ref in ref_index:
+            errors[index] = f"Duplicate ref '{item.ref}'"
+        else:
+            ref_index[item.ref] = index
+
+    # 3. Existing parents, fetched in one query and scoped to this project
+    parent_ids = {item.parent_issue_id for item in items.values() if item.parent_issue_id}
+    existing_parents = {}
+    if parent_ids:
+        existing_parents = dict(
+            db.query(models.UserStory.id, models.UserStory.issue_type).filter(
+                models.UserStory.project_id == project_id,
+                models.UserStory.id.in_(parent_ids)
+            ).all()
+        )
+
+    # 4. Hierarchy rules against existing or in-batch parents
+    for index, item in items.items():
+        if index in errors:
+            continue
+        try:
+            if item.parent_ref is not None and item.parent_issue_id is not None:
+                raise ValueError("Use either parent_ref or parent_issue_id, not both.")
+            if item.parent_ref is not None:
+                parent_index = ref_index.get(item.parent_ref)
+                parent_type = items[parent_index].issue_type if parent_index is not None else None
+                validate_hierarchy(item.issue_type, item.parent_ref, parent_type)
+            else:
+                validate_hierarchy(
+                    item.issue_type,
+                    item.parent_issue_id,
+                    existing_parents.get(item.parent_issue_id)
+                )
+        except ValueError as e:
+            errors[index] = str(e)
+
+    # 5. Depth of each row in its in-batch parent chain (0 for rows without an in-batch
+    # parent). Only rows that passed the hierarchy rules follow their parent_ref, and those
+    # rules only allow parents of a higher issue type, so every chain ends. Children of
+    # rejected in-batch parents are rejected too; parents are shallower, so walking rows
+    # in depth order settles every chain in one pass.
+    depths: dict[int, int] = {}
+
+    def batch_depth(index: int) -> int:
+        if index not in depths:
+            parent_ref = items[index].parent_ref
+            if parent_ref is None or index in errors:
+                depths[index] = 0
+            else:
+                depths[index] = batch_depth(ref_index[parent_ref]) + 1
+        return depths[index]
+
+    for index in sorted(items, key=batch_depth):
+        item = items[index]
+        if index not in errors and item.parent_ref is not None and ref_index[item.parent_ref] in errors:
+            errors[index] = f"Parent row {ref_index[item.parent_ref]} failed validation."
+
+    valid = [index for index in items if index not in errors]
+    error_list = [
+        {"index": index, "ref": raw_items[index].get("ref") if isinstance(raw_items[index], dict) else None, "detail": detail}
+        for index, detail in sorted(errors.items())
+    ]
+    if not valid or (atomic and errors):
+        return [], error_list
+
+    # 6. Same duplicate-title handling as single creates, then a contiguous block
+    # of story codes assigned in input order
+    titles = resolve_unique_titles(db, project_id, [items[i].title for i in valid])
+    for index, title in zip(valid, titles):
+        items[index].title = title
+    first_number, prefix, name = allocate_story_numbers(db, project_id, count=len(valid))
+    codes = {index: format_story_code(prefix, name, first_number + n) for n, index in enumerate(valid)}
+
+    change_seq = project_crud.bump_change_version(db, project_id)
+
+    # 7. Insert level by level so in-batch parents have ids before their children
+    story_table = models.UserStory.__table__
+    ids: dict[int, int] = {}
+    for depth in sorted({depths[i] for i in valid}):
+        level = [i for i in valid if depths[i] == depth]
+        rows = []
+        for index in level:
+            item = items[index]
+            parent_id = ids[ref_index[item.parent_ref]] if item.parent_ref is not None else item.parent_issue_id
+            rows.append({
+                "project_id": project_id,
+                "release_number": item.release_number,
+                "sprint_number": item.sprint_number if item.sprint_number else "",
+                "story_code": codes[index],
+                "assignee": item.assignee,
+                "reviewer": item.reviewer,
+                "title": item.title,
+                "description": item.description,
+                "status": item.status.value,
+                "issue_type": item.issue_type.value,
+                "parent_issue_id": parent_id,
+                "support_doc_path": None,
+                "start_date": item.start_date,
+                "end_date": item.end_date,
+                "created_by": user_id,
+                "change_seq": change_seq,
+            })
+        db.execute(story_table.insert(), rows)
+
+        code_to_id = dict(
+            db.query(models.UserStory.story_code, models.UserStory.id).filter(
+                models.UserStory.project_id == project_id,
+                models.UserStory.story_code.in_([codes[i] for i in level])
+            ).all()
+        )
+        for index in level:
+            ids[index] = code_to_id[codes[index]]
+
+    # 8. CREATED activity rows, same format as create_user_story
+    db.execute(models.UserStoryActivity.__table__.insert(), [
+        {
+            "story_id": ids[index],
+            "user_id": user_id,
+            "action": "CREATED",
+            "changes": f"Status: None → {items[index].status.value}\nTitle: None → {items[index].title}",
+            "change_count": 2,
+            "diff": build_change_diff({
+                "status": {"old": None, "new": items[index].status.value},
+                "title": {"old": None, "new": items[index].title},
+            }),
+        }
+        for index in valid
+    ])
+
+    stats = Counter((project_id, items[i].status.value, items[i].issue_type.value) for i in valid)
+    reports_crud.adjust_issue_stats(db, stats)
+    reports_crud.add_timeline_events(db, [
+        {
+            "project_id": project_id,
+            "story_id": ids[index],
+            "story_code": codes[index],
+            "title": items[index].title,
+            "event_type": "created",
+            "description": "Issue created",
+        }
+        for index in valid
+    ])
+    for index in valid:
+        item = items[index]
+        events.queue_event(db, project_id, "story.created", ids[index], change_seq, {
+            "id": ids[index],
+            "story_code": codes[index],
+            "title": item.title,
+            "status": item.status.value,
+            "issue_type": item.issue_type.value,
+            "assignee": item.assignee,
+            "sprint_number": item.sprint_number if item.sprint_number else "",
+            "parent_issue_id": ids[ref_index[item.parent_ref]] if item.parent_ref is not None else item.parent_issue_id,
+            "project_id": project_id,
+        })
+
+    created = [
+        {"index": index, "ref": items[index].ref, "id": ids[index], "story_code": codes[index]}
+        for index in valid
+    ]
+    return created, error_list
+
+# -------------------- IMPORT --------------------
+
+# Data rows of an uploaded CSV (the header row names the fields) or NDJSON file, read
+# lazily as (row_number, row). Empty CSV cells count as "not set"; an NDJSON line that
+# is not valid JSON yields None so it is reported as a row error.
+def iter_import_rows(file, file_format: str):
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+    if file_format == "csv":
+        for number, row in enumerate(csv.DictReader(text), start=1):
+            yield number, {key.strip(): value for key, value in row.items() if key is not None and value not in ("", None)}
+        return
+
+    number = 0
+    for line in text:
+        if not line.strip():
+            continue
+        number += 1
+        try:
+            yield number, json.loads(line)
+        except ValueError:
+            yield number, None
+
+# Import one batch of (row_number, row) through bulk_create_user_stories and record
+# its progress and row errors; commits, so each batch is its own transaction.
+# `refs` maps external keys of imported rows to their new ids and `failed_refs` holds
+# keys of rejected rows, both carried across batches. Parents are given by `parent_ref`
+# (external key, same or earlier batch), `parent_story_code` or `parent_issue_id`.
+def import_issue_batch(db: Session, job: models.IssueImport, batch: list, refs: dict[str, int], failed_refs: set[str]):
+    errors = []
+    rows, numbers = [], []
+
+    batch_refs = {raw.get("ref") for _, raw in batch if isinstance(raw, dict)}
+    parent_codes = {raw["parent_story_code"] for _, raw in batch if isinstance(raw, dict) and raw.get("parent_story_code")}
+    code_ids = {}
+    if parent_codes:
+        code_ids = dict(
+            db.query(models.UserStory.story_code, models.UserStory.id).filter(
+                models.UserStory.project_id == job.project_id,
+                models.UserStory.story_code.in_(parent_codes)
+            ).all()
+        )
+
+    for number, raw in batch:
+        if not isinstance(raw, dict):
+            errors.append((number, None, "Row must be a JSON object"))
+            continue
+        raw = dict(raw)
+        ref = raw.get("ref")
+        parent_ref = raw.get("parent_ref")
+        parent_code = raw.pop("parent_story_code", None)
+        try:
+            if ref is not None and (ref in refs or ref in failed_refs):
+                raise ValueError(f"Duplicate ref '{ref}'")
+            if sum(value is not None for value in (parent_ref, parent_code, raw.get("parent_issue_id"))) > 1:
+                raise ValueError("Use only one of parent_ref, parent_story_code or parent_issue_id.")
+            if parent_code is not None:
+                if parent_code not in code_ids:
+                    raise ValueError(f"Parent story_code '{parent_code}' not found.")
+                raw["parent_issue_id"] = code_ids[parent_code]
+            elif parent_ref is not None and parent_ref not in batch_refs:
+                if parent_ref in refs:
+                    raw["parent_ref"] = None
+                    raw["parent_issue_id"] = refs[parent_ref]
+                elif parent_ref in failed_refs:
+                    raise ValueError(f"Parent row '{parent_ref}' failed validation.")
+                else:
+                    raise ValueError(f"Unknown parent_ref '{parent_ref}' (parents must come before their children).")
+        except ValueError as e:
+            errors.append((number, ref, str(e)))
+            continue
+        rows.append(raw)
+        numbers.append(number)
+
+    created, bulk_errors = bulk_create_user_stories(db, job.project_id, rows, user_id=job.user_id)
+    for entry in created:
+        if entry["ref"] is not None:
+            refs[entry["ref"]] = entry["id"]
+    errors.extend((numbers[error["index"]], error["ref"], error["detail"]) for error in bulk_errors)
+    # A rejected duplicate of an imported ref must not hide the row that was imported
+    failed_refs.update(ref for _, ref, _ in errors if ref is not None and ref not in refs)
+
+    if errors:
+        db.execute(models.IssueImportError.__table__.insert(), [
+            {"import_id": job.id, "row_number": number, "ref": ref, "detail": detail}
+            for number, ref, detail in sorted(errors)
+        ])
+    job.processed_rows += len(batch)
+    job.created_count += len(created)
+    job.error_count += len(errors)
+    db.commit()
+
+# Background body of an import: parse the stored upload a batch at a time and import
+# each batch in its own transaction. Batches committed before a fatal error (e.g. an
+# undecodable file) stay in place; the job records where it stopped.
+def run_issue_import(session_factory, import_id: int, path: str):
+    db = session_factory()
+    job = None
+    try:
+        job = db.get(models.IssueImport, import_id)
+        job.status = "running"
+        db.commit()
+
+        refs: dict[str, int] = {}
+        failed_refs: set[str] = set()
+        with open(path, "rb") as file:
+            rows = iter_import_rows(file, job.file_format)
+            while batch := list(islice(rows, job.batch_size)):
+                import_issue_batch(db, job, batch, refs, failed_refs)
+        job.status = "completed"
+    except Exception as e:
+        db.rollback()
+        logger.exception("Issue import %s failed", import_id)
+        job = db.get(models.IssueImport, import_id)
+        if job is not None:
+            job.status = "failed"
+            job.detail = str(e)
+    finally:
+        if job is not None:
+            job.finished_at = datetime.now(timezone.utc)
+            db.commit()
+        db.close()
+        os.remove(path)
+
+def create_import_job(db: Session, project_id: int, user_id: int, file_format: str, batch_size: int):
+    job = models.IssueImport(
+        project_id=project_id, user_id=user_id, file_format=file_format, batch_size=batch_size, status="pending"
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+def get_import_job(db: Session, project_id: int, import_id: int):
+    return db.query(models.IssueImport).filter(
+        models.IssueImport.id == import_id,
+        models.IssueImport.project_id == project_id
+    ).first()
+
+# Row errors of an import in file order, keyset-paginated on row_number; returns (rows, next_row)
+def list_import_errors(db: Session, import_id: int, limit: int, after_row: int = 0):
+    rows = db.query(models.IssueImportError).filter(
+        models.IssueImportError.import_id == import_id,
+        models.IssueImportError.row_number > after_row
+    ).order_by(models.IssueImportError.row_number).limit(limit + 1).all()
+    if len(rows) > limit:
+        return rows[:limit], rows[limit - 1].row_number
+    return rows, None
+
 def update_user_story_by_id(
     db: Session, 
     story_id: int, 
@@ -234,9 +991,20 @@ def update_user_story_by_id(
             user_id=user_id,
             action="UPDATED",
             changes=changes_text,  # Store as formatted text
-            change_count=len(changes)
+            change_count=len(changes),
+            diff=build_change_diff(changes)
         )
         db.add(activity)
+        reports_crud.add_timeline_events(db, [timeline_event(db_story, "updated", changes_text)])
+
+        if "status" in changes:
+            key = (db_story.project_id, db_story.issue_type)
+            reports_crud.adjust_issue_stats(db, {
+                (key[0], changes["status"]["old"], key[1]): -1,
+                (key[0], changes["status"]["new"], key[1]): 1,
+            })
+        db_story.change_seq = project_crud.bump_change_version(db, db_story.project_id)
+        events.queue_event(db, db_story.project_id, "story.updated", story_id, db_story.change_seq, story_event_data(db_story))
         
         # Commit transaction (both story update and activity log)
         db.commit()
@@ -247,11 +1015,11 @@ def update_user_story_by_id(
     except SQLAlchemyError as e:
         # Rollback on any database error
         db.rollback()
-        print(f"ERROR updating story {story_id}: {str(e)}")
+        logger.error("Database error updating story %s: %s", story_id, e)
         raise ValueError(f"Database error during update: {str(e)}")
     except Exception as e:
         db.rollback()
-        print(f"UNEXPECTED ERROR updating story {story_id}: {str(e)}")
+        logger.exception("Unexpected error updating story %s", story_id)
         raise
 
 def update_user_story_status(db: Session, story_id: int, new_status: str, user_id: int | None = None):
@@ -288,10 +1056,16 @@ def update_user_story_status(db: Session, story_id: int, new_status: str, user_i
         
         # Only update and log if status actually changed
         if old_status_value != new_status:
+            change_seq = project_crud.bump_change_version(db, db_story.project_id)
+
             # Update status using query to avoid type issues
             db.query(models.UserStory).filter(
                 models.UserStory.id == story_id
-            ).update({"status": new_status})
+            ).update({"status": new_status, "change_seq": change_seq})
+            events.queue_event(
+                db, db_story.project_id, "story.status_changed", story_id, change_seq,
+                story_event_data(db_story, status=new_status)
+            )
             
             # Create activity record for status change
             changes_text = f"Status: {old_status_value} → {new_status}"
@@ -301,9 +1075,16 @@ def update_user_story_status(db: Session, story_id: int, new_status: str, user_i
                 user_id=user_id,
                 action="STATUS_CHANGED",
                 changes=changes_text,
-                change_count=1
+                change_count=1,
+                diff=build_change_diff({"status": {"old": old_status_value, "new": new_status}})
             )
             db.add(activity)
+            reports_crud.add_timeline_events(db, [timeline_event(db_story, "updated", changes_text)])
+
+            reports_crud.adjust_issue_stats(db, {
+                (db_story.project_id, old_status_value, db_story.issue_type): -1,
+                (db_story.project_id, new_status, db_story.issue_type): 1,
+            })
             
             db.commit()
             db.refresh(db_story)
@@ -312,21 +1093,46 @@ def update_user_story_status(db: Session, story_id: int, new_status: str, user_i
         
     except SQLAlchemyError as e:
         db.rollback()
-        print(f"ERROR updating status for story {story_id}: {str(e)}")
+        logger.error("Database error updating status for story %s: %s", story_id, e)
         raise ValueError(f"Database error during status update: {str(e)}")
     except Exception as e:
         db.rollback()
         raise
 
-def get_story_activity(db: Session, story_id: int):
+def get_story_activity(
+    db: Session,
+    story_id: int,
+    limit: int,
+    before: tuple[datetime, int] | None = None,
+    field: str | None = None,
+):
     """
     Get aggregated activity history for a story.
-    Returns activities in reverse chronological order.
+    Returns (activities, next_key): one page in reverse chronological order, keyset
+    paginated on (created_at, id) via ix_user_story_activity_story_created. next_key
+    is the (created_at, id) to pass as `before` for the next page, None on the last.
+    With `field`, only activities whose structured diff touches that field are returned.
     """
-    return db.query(models.UserStoryActivity)\
-        .filter(models.UserStoryActivity.story_id == story_id)\
-        .order_by(models.UserStoryActivity.created_at.desc())\
-        .all()
+    query = db.query(models.UserStoryActivity)\
+        .filter(models.UserStoryActivity.story_id == story_id)
+    if before is not None:
+        created_at, activity_id = before
+        query = query.filter(or_(
+            models.UserStoryActivity.created_at < created_at,
+            and_(models.UserStoryActivity.created_at == created_at, models.UserStoryActivity.id < activity_id)
+        ))
+    if field is not None:
+        if field not in DIFF_FIELDS:
+            raise ValueError(f"Unknown field: {field}")
+        # JSON_EXTRACT is NULL when the key is absent (as_string avoids SQLite's JSON_QUOTE)
+        query = query.filter(models.UserStoryActivity.diff[field].as_string().is_not(None))
+
+    rows = query.order_by(models.UserStoryActivity.created_at.desc(), models.UserStoryActivity.id.desc())\
+        .limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, (rows[-1].created_at, rows[-1].id)
+    return rows, None
 
 
 def delete_user_story_by_id(db: Session, story_id: int):
@@ -337,6 +1143,33 @@ def delete_user_story_by_id(db: Session, story_id: int):
     db_story = get_user_story_by_id(db, story_id)
     if not db_story:
         return False
+
+    # Activity rows reference the story with a NOT NULL key; remove them explicitly
+    # rather than letting the ORM try to null it out
+    db.query(models.UserStoryActivity)\
+        .filter(models.UserStoryActivity.story_id == story_id)\
+        .delete(synchronize_session=False)
+    db.query(reports_models.TimelineEvent)\
+        .filter(reports_models.TimelineEvent.story_id == story_id)\
+        .delete(synchronize_session=False)
+    reports_crud.adjust_issue_stats(db, {(db_story.project_id, db_story.status, db_story.issue_type): -1})
+    change_seq = project_crud.bump_change_version(db, db_story.project_id)
+
+    # Leave a tombstone for incremental sync; children are detached from the
+    # deleted parent on flush, so they are stamped as changed too
+    db.add(models.UserStoryTombstone(
+        story_id=story_id,
+        project_id=db_story.project_id,
+        story_code=db_story.story_code,
+        change_seq=change_seq,
+    ))
+    db.query(models.UserStory)\
+        .filter(models.UserStory.parent_issue_id == story_id)\
+        .update({"change_seq": change_seq}, synchronize_session=False)
+    events.queue_event(db, db_story.project_id, "story.deleted", story_id, change_seq, {
+        "id": story_id,
+        "story_code": db_story.story_code,
+    })
     
     db.delete(db_story)
     db.commit()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, UniqueConstraint, Index, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 
@@ -31,6 +31,9 @@ class UserStory(Base):
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     created_by = Column(Integer, ForeignKey("users.id"), nullable=True) # key for RBAC ownership
+
+    # Project change_version of the last write to this row (incremental sync cursor)
+    change_seq = Column(Integer, nullable=False, default=0, server_default="0")
     
     # Hierarchy
     parent_issue_id = Column(Integer, ForeignKey("user_story.id", ondelete="CASCADE"), nullable=True)
@@ -45,6 +48,15 @@ class UserStory(Base):
     __table_args__ = (
         UniqueConstraint('project_id', 'story_code', name='unique_project_story_code'),
         # UniqueConstraint('project_id', 'title', name='unique_project_title'), -- REMOVED to allow duplicate titles
+        # Project reports: per-project status/type grouping
+        Index('ix_user_story_project_status_type', 'project_id', 'status', 'issue_type'),
+        # Duplicate-title resolution: "title" / "title (n)" prefix lookups within a project
+        Index('ix_user_story_project_title', 'project_id', 'title'),
+        # Search: story_code prefix lookups + MySQL FULLTEXT over code/title/description
+        Index('ix_user_story_story_code', 'story_code'),
+        Index('ft_user_story_search', 'story_code', 'title', 'description', mysql_prefix='FULLTEXT'),
+        # Incremental sync: changes of a project after a (change_seq, id) cursor
+        Index('ix_user_story_project_change_seq', 'project_id', 'change_seq', 'id'),
     )
 
 
@@ -62,10 +74,77 @@ class UserStoryActivity(Base):
     action = Column(String(50), nullable=False, default="UPDATED")  # UPDATED, CREATED, STATUS_CHANGED, etc.
     changes = Column(Text, nullable=False)  # Human-readable text description of changes
     change_count = Column(Integer, nullable=False, default=0)  # Number of fields changed
+    # Structured diff: {field: {"old", "new"}} or {field: {"delta"}} for long text (see crud.build_change_diff)
+    diff = Column(JSON, nullable=True)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    __table_args__ = (
+        # History pages: newest first within a story, keyset on (created_at, id)
+        Index('ix_user_story_activity_story_created', 'story_id', 'created_at', 'id'),
+    )
     
     # Relationships
     story = relationship("UserStory", backref="activities")
     user = relationship("app.modules.auth.models.User")
 
+
+
+class UserStoryTombstone(Base):
+    """
+    Marker left behind when a user story is deleted, so incremental sync
+    clients can drop it from their cache. The story's activity rows are
+    deleted with it, so they cannot carry this information.
+    """
+    __tablename__ = "user_story_tombstone"
+
+    id = Column(Integer, primary_key=True, index=True)
+    # No foreign key: the story row no longer exists
+    story_id = Column(Integer, nullable=False)
+    project_id = Column(Integer, ForeignKey("project.id", ondelete="CASCADE"), nullable=False)
+    story_code = Column(String(50), nullable=False)
+
+    change_seq = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        Index('ix_user_story_tombstone_project_change_seq', 'project_id', 'change_seq', 'story_id'),
+    )
+
+
+class IssueImport(Base):
+    """
+    One CSV / NDJSON backlog import. Counters are updated in the same
+    transaction as each inserted batch, so they always match the data.
+    """
+    __tablename__ = "issue_import"
+
+    id = Column(Integer, primary_key=True, index=True)
+    project_id = Column(Integer, ForeignKey("project.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+
+    file_format = Column(String(10), nullable=False)  # csv, ndjson
+    batch_size = Column(Integer, nullable=False)
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, completed, failed
+    detail = Column(Text, nullable=True)  # reason when the whole import failed
+
+    processed_rows = Column(Integer, nullable=False, default=0)
+    created_count = Column(Integer, nullable=False, default=0)
+    error_count = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class IssueImportError(Base):
+    __tablename__ = "issue_import_error"
+
+    id = Column(Integer, primary_key=True, index=True)
+    import_id = Column(Integer, ForeignKey("issue_import.id", ondelete="CASCADE"), nullable=False)
+    row_number = Column(Integer, nullable=False)  # 1-based data row in the uploaded file
+    ref = Column(String(100), nullable=True)
+    detail = Column(Text, nullable=False)
+
+    __table_args__ = (
+        Index('ix_issue_import_error_import_row', 'import_id', 'row_number'),
+    )
@@ -1,11 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Form, Query, Request, Response
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import func
 from typing import List, Optional, TYPE_CHECKING
 import os
 import shutil
 
-from app.database import get_db
+from app import etag
+from app.database import get_db, get_async_db
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, NEXT_CURSOR_HEADER, clamp_limit, decode_cursor, decode_timestamp_cursor, encode_cursor
 from app.modules.user_story import crud as story_crud, models as story_models, schemas as story_schemas
 from app.modules.auth import models as auth_models, dependencies as auth_deps
 from app.modules.project import crud as project_crud
@@ -20,53 +23,105 @@ router = APIRouter(
 UPLOAD_BASE_DIR = "uploads/user_stories"
 os.makedirs(UPLOAD_BASE_DIR, exist_ok=True)
 
-@router.get("/user-story", response_model=list[story_schemas.UserStoryResponse])
+@router.get(
+    "/user-story",
+    response_model=list[story_schemas.UserStoryListItem],
+    response_model_exclude_unset=True
+)
 def get_all_user_stories(
+    response: Response,
     project_id: int | None = None,
+    status: str | None = None,
+    issue_type: str | None = None,
+    assignee: str | None = None,
+    sprint_number: str | None = None,
+    parent_issue_id: int | None = None,
+    fields: str | None = Query(None, description="Comma separated list of fields to return, e.g. id,story_code,title"),
+    cursor: str | None = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     db: Session = Depends(get_db)
 ):
     # TODO: This should probably be administrative or removed to enforce project boundaries.
-    stories = story_crud.get_all_user_stories(db, project_id)
-    print(f"DEBUG: Fetched {len(stories)} stories for project_id={project_id}")
-    return [
-        {
-            "id": s.id,
-            "project_id": s.project_id,
-            "project_name": s.project.project_name if s.project else "Unknown Project",
-            "release_number": s.release_number,
-            "sprint_number": s.sprint_number,
-            "story_code": s.story_code,
-            "assignee": s.assignee,
-            "reviewer": s.reviewer,
-            "title": s.title,
-            "description": s.description,
-            "status": s.status,
-            "issue_type": s.issue_type,
-            "parent_issue_id": s.parent_issue_id,
-            "support_doc": os.path.basename(str(s.support_doc_path)) if getattr(s, 'support_doc_path', None) else None,
-            "start_date": s.start_date,
-            "end_date": s.end_date,
-            "created_at": s.created_at,
-        }
-        for s in stories
-    ]
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else list(story_crud.LIST_FIELDS)
+    after_id = int(decode_cursor(cursor)[0]) if cursor else None
+
+    rows, next_id = story_crud.list_user_stories(
+        db,
+        fields=field_list,
+        limit=clamp_limit(limit),
+        after_id=after_id,
+        project_id=project_id,
+        status=status,
+        issue_type=issue_type,
+        assignee=assignee,
+        sprint_number=sprint_number,
+        parent_issue_id=parent_issue_id,
+    )
+    if next_id is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_id)
+    return serialize_list_rows(rows)
+
+def serialize_list_rows(rows):
+    result = []
+    for row in rows:
+        item = row._asdict()
+        if "project_name" in item and item["project_name"] is None:
+            item["project_name"] = "Unknown Project"
+        if "support_doc" in item and item["support_doc"]:
+            item["support_doc"] = os.path.basename(str(item["support_doc"]))
+        result.append(item)
+    return result
+
+@router.get("/user-story/search", response_model=list[story_schemas.UserStorySearchResult])
+def search_user_stories(
+    q: str = Query(..., min_length=1, max_length=100),
+    project_id: int | None = None,
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    """
+    Ranked issue search over story code, title and description.
+    Results are limited to projects the caller is a member of (Global Admins see all).
+    """
+    if project_id is not None:
+        if not auth_deps.get_current_user_role(project_id, db, current_user):
+            raise HTTPException(status_code=403, detail="Access denied to project")
+        project_ids = [project_id]
+    elif current_user.global_role == auth_models.GlobalRole.ADMIN:
+        project_ids = None
+    else:
+        project_ids = list(auth_deps.get_project_roles(db, current_user))
+
+    return story_crud.search_user_stories(db, q, project_ids, limit)
 
 @router.get("/user-story/{story_id}", response_model=story_schemas.UserStoryResponse)
 def get_user_story(
     story_id: int, 
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: auth_models.User = Depends(auth_deps.get_current_user)
 ):
-    story = story_crud.get_user_story_by_id(db, story_id)
-
-    if not story:
+    version = story_crud.get_story_version(db, story_id)
+    if not version:
         raise HTTPException(status_code=404, detail="Story not found")
         
     # Check Read Access (Viewer or above)
-    user_role = auth_deps.get_current_user_role(getattr(story, 'project_id'), db, current_user)
+    user_role = auth_deps.get_current_user_role(version.project_id, db, current_user)
     if not user_role:  # type: ignore
           raise HTTPException(status_code=403, detail="Permission denied.")
 
+    # Unchanged since the client's copy: skip loading the story
+    tag = etag.make_etag(f"story:{story_id}", version.project_id, version.change_version)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+
+    story = story_crud.get_user_story_by_id(db, story_id)
+    etag.set_etag(response, tag)
+    return serialize_story_detail(story)
+
+def serialize_story_detail(story):
     return {
         "id": story.id,
         "project_id": story.project_id,
@@ -241,12 +296,32 @@ def update_user_story(
     }
 
 @router.get("/user-story/{id}/history", response_model=list[story_schemas.UserStoryActivityResponse], tags=["Workflow"])
-def get_story_activity(id: int, db: Session = Depends(get_db)):
+def get_story_activity(
+    id: int,
+    response: Response,
+    cursor: str | None = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    field: str | None = Query(None, description="Only activities that changed this field"),
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
     """
-    Get aggregated activity history for a story.
+    Get aggregated activity history for a story, newest first.
     Returns activities with all field changes grouped by save action.
+    When more entries exist, the X-Next-Cursor header holds the cursor for the next page.
     """
-    return story_crud.get_story_activity(db, id)
+    version = story_crud.get_story_version(db, id)
+    if not version:
+        raise HTTPException(status_code=404, detail="Story not found")
+    if not auth_deps.get_current_user_role(version.project_id, db, current_user):
+        raise HTTPException(status_code=403, detail="Permission denied.")
+
+    before = decode_timestamp_cursor(cursor) if cursor else None
+
+    activities, next_key = story_crud.get_story_activity(db, id, limit, before=before, field=field)
+    if next_key is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_key[0].isoformat(), next_key[1])
+    return activities
 
 
 @router.delete("/user-story/{story_id}")
@@ -274,3 +349,72 @@ def delete_user_story(
         shutil.rmtree(story_folder)
 
     return {"message": "User story and support documents deleted successfully"}
+
+
+# -------------------- ASYNC READ PATH --------------------
+# Async variants of the hot read endpoints; main.py mounts this router ahead of
+# `router` when ASYNC_DB_ENABLED, so these handlers shadow the sync ones.
+async_router = APIRouter(
+    tags=["User Stories"]
+)
+
+@async_router.get(
+    "/user-story",
+    response_model=list[story_schemas.UserStoryListItem],
+    response_model_exclude_unset=True
+)
+async def get_all_user_stories_async(
+    response: Response,
+    project_id: int | None = None,
+    status: str | None = None,
+    issue_type: str | None = None,
+    assignee: str | None = None,
+    sprint_number: str | None = None,
+    parent_issue_id: int | None = None,
+    fields: str | None = Query(None, description="Comma separated list of fields to return, e.g. id,story_code,title"),
+    cursor: str | None = Query(None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db)
+):
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else list(story_crud.LIST_FIELDS)
+    after_id = int(decode_cursor(cursor)[0]) if cursor else None
+
+    rows, next_id = await story_crud.list_user_stories_async(
+        db,
+        fields=field_list,
+        limit=clamp_limit(limit),
+        after_id=after_id,
+        project_id=project_id,
+        status=status,
+        issue_type=issue_type,
+        assignee=assignee,
+        sprint_number=sprint_number,
+        parent_issue_id=parent_issue_id,
+    )
+    if next_id is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_id)
+    return serialize_list_rows(rows)
+
+# ":int" keeps /user-story/search (declared on the sync router) reachable
+@async_router.get("/user-story/{story_id:int}", response_model=story_schemas.UserStoryResponse)
+async def get_user_story_async(
+    story_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user_async)
+):
+    version = await story_crud.get_story_version_async(db, story_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="Story not found")
+
+    if not await auth_deps.get_current_user_role_async(version.project_id, db, current_user):
+        raise HTTPException(status_code=403, detail="Permission denied.")
+
+    tag = etag.make_etag(f"story:{story_id}", version.project_id, version.change_version)
+    if etag.is_not_modified(request, tag):
+        return etag.not_modified_response(tag)
+
+    story = await story_crud.get_user_story_by_id_async(db, story_id)
+    etag.set_etag(response, tag)
+    return serialize_story_detail(story)
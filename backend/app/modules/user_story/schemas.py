@@ -65,6 +65,9 @@ class UserStoryActivityResponse(BaseModel):
     action: str  # UPDATED, CREATED, STATUS_CHANGED
     changes: str  # Human-readable text: "Title: old → new\nDescription: old → new"
     change_count: int  # Number of fields changed
+    # {field: {"old", "new"}}, or {field: {"delta": [[position, removed, inserted], ...]}} for long text;
+    # None for entries recorded before the column existed
+    diff: Optional[dict] = None
     created_at: datetime
 
     class Config:
@@ -92,3 +95,179 @@ class UserStoryResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# -------- LIST (projected) --------
+class UserStoryListItem(BaseModel):
+    """
+    Row of the paginated /user-story listing.
+    Every field is optional because callers may project a subset via `fields=`.
+    """
+    id: int
+    project_id: Optional[int] = None
+    project_name: Optional[str] = None
+    release_number: Optional[str] = None
+    sprint_number: Optional[str] = None
+    story_code: Optional[str] = None
+    assignee: Optional[str] = None
+    reviewer: Optional[str] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+    issue_type: Optional[str] = None
+    parent_issue_id: Optional[int] = None
+    support_doc: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+# -------- SEARCH --------
+class UserStorySearchResult(BaseModel):
+    id: int
+    project_id: int
+    project_name: str
+    story_code: str
+    title: str
+    issue_type: str
+    status: str
+
+    class Config:
+        from_attributes = True
+
+
+# -------- BULK CREATE --------
+class UserStoryBulkItem(BaseModel):
+    """
+    One row of a bulk create request. project_id comes from the URL.
+    A row may reference an existing parent (parent_issue_id) or another row of the
+    same batch by its client-side key (parent_ref -> ref).
+    """
+    ref: Optional[str] = Field(default=None, example="epic-1")
+    parent_ref: Optional[str] = Field(default=None, example=None)
+    release_number: str = Field(..., example="R1.0")
+    sprint_number: Optional[str] = Field(default=None, example="Sprint-3")
+    assignee: str = Field(..., example="Sanji")
+    reviewer: str = Field(..., example="TeamLead")
+    title: str = Field(..., example="Login API")
+    description: str = Field(..., example="Implement login API")
+    status: StoryStatus = Field(..., example="todo")
+    issue_type: IssueType = Field(default=IssueType.story, example="epic")
+    parent_issue_id: Optional[int] = Field(default=None, example=None)
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+
+class UserStoryBulkCreateRequest(BaseModel):
+    # Rows are validated one by one so a bad row is reported instead of failing the request
+    items: list[dict] = Field(..., max_length=5000)
+    # When true, nothing is inserted if any row fails validation
+    atomic: bool = False
+
+
+class UserStoryBulkCreated(BaseModel):
+    index: int
+    ref: Optional[str]
+    id: int
+    story_code: str
+
+
+class UserStoryBulkError(BaseModel):
+    index: int
+    ref: Optional[str]
+    detail: str
+
+
+class UserStoryBulkCreateResponse(BaseModel):
+    created: list[UserStoryBulkCreated]
+    errors: list[UserStoryBulkError]
+
+
+# -------- BOARD --------
+class BoardCard(BaseModel):
+    id: int
+    story_code: Optional[str] = None
+    title: Optional[str] = None
+    status: Optional[str] = None
+    issue_type: Optional[str] = None
+    assignee: Optional[str] = None
+    sprint_number: Optional[str] = None
+    parent_issue_id: Optional[int] = None
+    project_id: Optional[int] = None
+
+
+class BoardColumn(BaseModel):
+    status: str
+    # Total matching cards in the column, not just the ones returned
+    count: int
+    cards: list[BoardCard]
+    # Pass to /board/columns/{status}?cursor= to load the next cards; None on the last page
+    next_cursor: Optional[str] = None
+
+
+class BoardColumnsResponse(BaseModel):
+    project: dict
+    columns: list[BoardColumn]
+    # Sprint numbers in use, only when requested with include_sprints
+    sprints: Optional[list[str]] = None
+
+
+# -------- INCREMENTAL SYNC --------
+class IssueChange(UserStoryListItem):
+    change_seq: int
+
+
+class IssueTombstone(BaseModel):
+    id: int
+    story_code: str
+    change_seq: int
+    deleted_at: Optional[datetime] = None
+
+
+class IssueChangesResponse(BaseModel):
+    """
+    Issues created, updated or deleted since the given cursor.
+    An issue appears once, with its latest state, however often it changed.
+    """
+    changes: list[IssueChange]
+    deleted: list[IssueTombstone]
+    # Send back as `since` on the next poll (also when has_more is false)
+    cursor: str
+    has_more: bool
+
+
+# -------- IMPORT --------
+class IssueImportResponse(BaseModel):
+    id: int
+    project_id: int
+    file_format: str
+    batch_size: int
+    # pending, running, completed, failed
+    status: str
+    detail: Optional[str] = None
+    processed_rows: int
+    created_count: int
+    error_count: int
+    created_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class IssueImportErrorItem(BaseModel):
+    row_number: int
+    ref: Optional[str] = None
+    detail: str
+
+    class Config:
+        from_attributes = True
+
+
+class IssueImportErrorsPage(BaseModel):
+    errors: list[IssueImportErrorItem]
+    # Pass back as `cursor` for the next page; None on the last page
+    next_cursor: Optional[str] = None
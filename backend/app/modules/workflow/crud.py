@@ -1,5 +1,7 @@
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.modules.workflow import models
+from app.modules.workflow.graph import transition_graph
 
 statuses = ["backlog", "todo", "in_progress", "testing", "done"]
 DEFAULT_TRANSITIONS = []
@@ -8,25 +10,78 @@ for s1 in statuses:
         if s1 != s2:
             DEFAULT_TRANSITIONS.append((s1, s2))
 
+# Bump when DEFAULT_TRANSITIONS changes so existing databases pick up the new pairs
+WORKFLOW_SEED_VERSION = 1
+WORKFLOW_SEED_NAME = "workflow_transitions"
+
+# Seed the default transitions idempotently: one marker lookup when already seeded,
+# otherwise a single insert-or-ignore batch (existing rows, incl. disabled ones, are left alone)
 def seed_workflow_transitions(db: Session):
-    for from_s, to_s in DEFAULT_TRANSITIONS:
-        exists = db.query(models.WorkflowTransition).filter(
-            models.WorkflowTransition.from_status == from_s,
-            models.WorkflowTransition.to_status == to_s
-        ).first()
-        if not exists:
-            db.add(models.WorkflowTransition(from_status=from_s, to_status=to_s))
+    applied = db.query(models.SeedVersion.version).filter(
+        models.SeedVersion.name == WORKFLOW_SEED_NAME
+    ).scalar()
+    if applied is not None and applied >= WORKFLOW_SEED_VERSION:
+        return False
+
+    table = models.WorkflowTransition.__table__
+    rows = [{"from_status": f, "to_status": t, "is_active": True} for f, t in DEFAULT_TRANSITIONS]
+    dialect = db.get_bind().dialect.name
+    if dialect == "mysql":
+        db.execute(table.insert().prefix_with("IGNORE"), rows)
+    elif dialect == "sqlite":
+        db.execute(sqlite_insert(table).on_conflict_do_nothing(), rows)
+    else:
+        existing = set(db.query(models.WorkflowTransition.from_status, models.WorkflowTransition.to_status).all())
+        missing = [row for row in rows if (row["from_status"], row["to_status"]) not in existing]
+        if missing:
+            db.execute(table.insert(), missing)
+
+    marker = db.get(models.SeedVersion, WORKFLOW_SEED_NAME)
+    if marker:
+        marker.version = WORKFLOW_SEED_VERSION
+    else:
+        db.add(models.SeedVersion(name=WORKFLOW_SEED_NAME, version=WORKFLOW_SEED_VERSION))
     db.commit()
+    transition_graph.invalidate()
+    return True
+
+# Load (statuses, active edges) for the cached transition graph; one query
+def load_transition_graph(db: Session):
+    rows = db.query(
+        models.WorkflowTransition.from_status,
+        models.WorkflowTransition.to_status,
+        models.WorkflowTransition.is_active
+    ).all()
+
+    known = {s for row in rows for s in (row.from_status, row.to_status)}
+    ordered = [s for s in statuses if s in known] + sorted(known - set(statuses))
+    edges = [(row.from_status, row.to_status) for row in rows if row.is_active]
+    return ordered, edges
+
+# Current transition graph; served from memory, reloaded only after an edit or TTL expiry
+def get_transition_graph(db: Session):
+    return transition_graph.get(lambda: load_transition_graph(db))
+
+# Add, enable or disable a transition and invalidate the cached graph
+def set_transition_active(db: Session, from_status: str, to_status: str, is_active: bool):
+    transition = db.query(models.WorkflowTransition).filter(
+        models.WorkflowTransition.from_status == from_status,
+        models.WorkflowTransition.to_status == to_status
+    ).first()
+    if transition:
+        transition.is_active = is_active
+    else:
+        transition = models.WorkflowTransition(from_status=from_status, to_status=to_status, is_active=is_active)
+        db.add(transition)
+    db.commit()
+    transition_graph.invalidate()
+    return transition
 
 def is_transition_valid(db: Session, from_status: str, to_status: str) -> bool:
     # If status is not changing, it's valid (or handled by other logic)
     if from_status == to_status:
         return True # Handled elsewhere, but technically not a transition
-        
-    transition = db.query(models.WorkflowTransition).filter(
-        models.WorkflowTransition.from_status == from_status,
-        models.WorkflowTransition.to_status == to_status,
-        models.WorkflowTransition.is_active == True
-    ).first()
-    
-    return transition is not None
+
+    from_status = getattr(from_status, "value", from_status)
+    to_status = getattr(to_status, "value", to_status)
+    return get_transition_graph(db).allows(from_status, to_status)
@@ -0,0 +1,74 @@
+import threading
+import time
+
+from app.config import WORKFLOW_CACHE_TTL_SECONDS
+
+
+class TransitionGraph:
+    """
+    Immutable snapshot of the active workflow transitions.
+    Each status gets a small integer id; adjacency[id] is a bitset of the ids it may move to.
+    """
+
+    def __init__(self, statuses: list[str], edges, version: int):
+        self.version = version
+        self.statuses = list(statuses)
+        self.status_ids = {status: i for i, status in enumerate(self.statuses)}
+        self.adjacency = [0] * len(self.statuses)
+        for from_status, to_status in edges:
+            self.adjacency[self.status_ids[from_status]] |= 1 << self.status_ids[to_status]
+
+    def allows(self, from_status: str, to_status: str) -> bool:
+        from_id = self.status_ids.get(from_status)
+        to_id = self.status_ids.get(to_status)
+        if from_id is None or to_id is None:
+            return False
+        return bool(self.adjacency[from_id] >> to_id & 1)
+
+    def next_statuses(self, from_status: str) -> list[str]:
+        from_id = self.status_ids.get(from_status)
+        if from_id is None:
+            return []
+        bits = self.adjacency[from_id]
+        return [status for i, status in enumerate(self.statuses) if bits >> i & 1]
+
+    def as_dict(self) -> dict:
+        return {status: self.next_statuses(status) for status in self.statuses}
+
+
+class TransitionGraphCache:
+    """
+    Process-wide cache of the TransitionGraph.
+    invalidate() bumps the version counter so the next lookup reloads; the TTL bounds
+    how long edits made by other worker processes can go unseen.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._graph: TransitionGraph | None = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def get(self, loader) -> TransitionGraph:
+        graph = self._graph
+        if graph is not None and graph.version == self.version \
+                and time.monotonic() - self._loaded_at < self.ttl_seconds:
+            return graph
+
+        with self._lock:
+            graph = self._graph
+            if graph is None or graph.version != self.version \
+                    or time.monotonic() - self._loaded_at >= self.ttl_seconds:
+                statuses, edges = loader()
+                graph = TransitionGraph(statuses, edges, self.version)
+                self._graph = graph
+                self._loaded_at = time.monotonic()
+            return graph
+
+    def invalidate(self):
+        with self._lock:
+            self.version += 1
+
+
+transition_graph = TransitionGraphCache(WORKFLOW_CACHE_TTL_SECONDS)
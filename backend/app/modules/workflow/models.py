@@ -12,3 +12,11 @@ class WorkflowTransition(Base):
     __table_args__ = (
         UniqueConstraint('from_status', 'to_status', name='unique_transition'),
     )
+
+# Records which version of a seed data set has been applied, so startup can skip
+# re-seeding with a single lookup
+class SeedVersion(Base):
+    __tablename__ = "seed_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False)
@@ -0,0 +1,28 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.modules.auth import models as auth_models, dependencies as auth_deps
+from app.modules.workflow import crud as workflow_crud
+
+router = APIRouter(
+    prefix="/workflow",
+    tags=["Workflow"]
+)
+
+# Full transition map {from_status: [allowed to_status, ...]}; lets the board grey out invalid drops
+@router.get("/transitions", response_model=dict[str, list[str]])
+def get_workflow_transitions(
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    return workflow_crud.get_transition_graph(db).as_dict()
+
+# Statuses an issue currently in `status` may move to
+@router.get("/transitions/{status}", response_model=list[str])
+def get_next_statuses(
+    status: str,
+    db: Session = Depends(get_db),
+    current_user: auth_models.User = Depends(auth_deps.get_current_user)
+):
+    return workflow_crud.get_transition_graph(db).next_statuses(status)
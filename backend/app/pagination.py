@@ -0,0 +1,47 @@
+import base64
+import json
+from datetime import datetime
+
+# Maximum page size any list endpoint will serve, regardless of what the client asks for
+MAX_PAGE_SIZE = 500
+DEFAULT_PAGE_SIZE = 100
+
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+# Encode keyset values (e.g. last seen id) into an opaque, URL-safe cursor string
+def encode_cursor(*values) -> str:
+    raw = json.dumps(list(values), separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+# Decode a cursor produced by encode_cursor back into its keyset values
+# Raises ValueError for tampered or malformed cursors (mapped to 400 by the app handler)
+def decode_cursor(cursor: str, size: int = 1) -> list:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    if not all(isinstance(value, (str, int)) and not isinstance(value, bool) for value in values):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+# Decode a (timestamp, id) keyset cursor written as encode_cursor(timestamp.isoformat(), id)
+def decode_timestamp_cursor(cursor: str) -> tuple[datetime, int]:
+    timestamp, row_id = decode_cursor(cursor, size=2)
+    if not isinstance(timestamp, str) or not isinstance(row_id, int):
+        raise ValueError("Invalid cursor")
+    return datetime.fromisoformat(timestamp), row_id
+
+
+# Clamp a client supplied page size into [1, MAX_PAGE_SIZE]
+def clamp_limit(limit: int | None, default: int = DEFAULT_PAGE_SIZE) -> int:
+    if not limit or limit < 1:
+        return default
+    return min(limit, MAX_PAGE_SIZE)
@@ -0,0 +1,28 @@
+from app.database import engine
+from sqlalchemy import text
+
+def run_migration():
+    # Story codes are now drawn from project.increment_number (next free number).
+    # Move each project's counter past the highest existing PREFIX-NNNN suffix.
+    sql = """
+    UPDATE project p
+    SET p.increment_number = GREATEST(
+        p.increment_number,
+        COALESCE((
+            SELECT MAX(CAST(SUBSTRING_INDEX(s.story_code, '-', -1) AS UNSIGNED))
+            FROM user_story s
+            WHERE s.project_id = p.id
+        ), 0) + 1
+    );
+    """
+    with engine.connect() as connection:
+        try:
+            print("Executing:", sql)
+            result = connection.execute(text(sql))
+            connection.commit()
+            print(f"Migration successful: {result.rowcount} project counters updated.")
+        except Exception as e:
+            print(f"Migration failed: {e}")
+
+if __name__ == "__main__":
+    run_migration()
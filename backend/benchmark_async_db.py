@@ -0,0 +1,123 @@
+"""
+Compare the sync and async DB paths on the hot read endpoints.
+
+    python benchmark_async_db.py [--requests 400] [--concurrency 100] [--rows 2000]
+
+Concurrency above the pool size (DB_POOL_SIZE + DB_MAX_OVERFLOW) is expected to
+time out on the sync path, where threads block on pool checkout while the sessions
+holding connections wait for a free thread to close them.
+
+Each mode runs in its own interpreter (ASYNC_DB_ENABLED is read at import) against
+the same SQLite file and is driven in-process through httpx's ASGI transport.
+Point DATABASE_URL / ASYNC_DATABASE_URL at MySQL for production-like numbers.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+ENDPOINTS = ["/user-story?limit=50&fields=id,story_code,title,status", "/user-story/{story_id}"]
+
+
+def seed(rows: int):
+    from sqlalchemy.orm import Session
+    from app.bootstrap import create_tables
+    from app.database import engine
+    from app.modules.auth import models as auth_models, security
+    from app.modules.project.models import Project
+    from app.modules.user_story.models import UserStory
+
+    create_tables(engine)
+    with Session(engine) as db:
+        user = auth_models.User(name="bench", email="bench@example.com", password_hash="x",
+                                global_role=auth_models.GlobalRole.ADMIN)
+        project = Project(project_name="Bench", project_prefix="BN")
+        db.add_all([user, project])
+        db.flush()
+        db.add_all([
+            UserStory(project_id=project.id, release_number="R1", sprint_number="1", story_code=f"BN-{n:05d}",
+                      assignee="a", reviewer="r", title=f"Story {n}", description="d" * 200,
+                      status="todo", issue_type="story")
+            for n in range(rows)
+        ])
+        db.commit()
+        story_id = db.query(UserStory.id).first().id
+        token = security.create_access_token(security.user_token_claims(user))
+    print(json.dumps({"story_id": story_id, "token": token}))
+
+
+def run_mode(total: int, concurrency: int, story_id: int, token: str):
+    import httpx
+    from app.main import app
+
+    async def main():
+        transport = httpx.ASGITransport(app=app)
+        headers = {"Authorization": f"Bearer {token}"}
+        semaphore = asyncio.Semaphore(concurrency)
+        latencies = []
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers) as client:
+            async def one(i):
+                path = ENDPOINTS[i % len(ENDPOINTS)].format(story_id=story_id)
+                async with semaphore:
+                    start = time.perf_counter()
+                    response = await client.get(path)
+                    latencies.append(time.perf_counter() - start)
+                    response.raise_for_status()
+
+            start = time.perf_counter()
+            await asyncio.gather(*(one(i) for i in range(total)))
+            elapsed = time.perf_counter() - start
+
+        latencies.sort()
+        print(json.dumps({
+            "requests_per_second": round(total / elapsed, 1),
+            "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+            "p99_ms": round(latencies[int(len(latencies) * 0.99) - 1] * 1000, 2),
+        }))
+
+    asyncio.run(main())
+
+
+def spawn(args: list[str], env: dict) -> dict:
+    output = subprocess.run([sys.executable, __file__, *args], env=env, capture_output=True, text=True)
+    if output.returncode != 0:
+        return {"error": output.stderr.strip().splitlines()[-1]}
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--seed", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--run", default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.seed:
+        seed(args.rows)
+    elif args.run:
+        story_id, token = args.run.split(":", 1)
+        run_mode(args.requests, args.concurrency, int(story_id), token)
+    else:
+        env = dict(os.environ, BOOTSTRAP_ON_STARTUP="0", LOG_LEVEL="WARNING")
+        if "DATABASE_URL" not in env:
+            path = os.path.join(tempfile.mkdtemp(), "bench.db")
+            env["DATABASE_URL"] = f"sqlite:///{path}"
+            env["ASYNC_DATABASE_URL"] = f"sqlite+aiosqlite:///{path}"
+
+        seeded = spawn(["--seed", "--rows", str(args.rows)], env)
+        run_args = ["--run", f"{seeded['story_id']}:{seeded['token']}",
+                    "--requests", str(args.requests), "--concurrency", str(args.concurrency)]
+        for mode, flag in (("sync", "0"), ("async", "1")):
+            result = spawn(run_args, dict(env, ASYNC_DB_ENABLED=flag))
+            if "error" in result:
+                # e.g. the sync path exhausting the pool once concurrency exceeds it
+                print(f"{mode:>5}: failed - {result['error']}")
+                continue
+            print(f"{mode:>5}: {result['requests_per_second']} req/s  p50 {result['p50_ms']} ms  p99 {result['p99_ms']} ms")
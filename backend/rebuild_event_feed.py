@@ -0,0 +1,16 @@
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.modules.project import models as project_models  # noqa: F401 (FK target)
+from app.modules.reports import crud as reports_crud, models as reports_models
+
+# Recompute event_feed from user_story and user_story_activity.
+# Run once after deploying the feed table, and whenever the timeline looks off.
+def rebuild():
+    reports_models.Base.metadata.create_all(bind=engine, tables=[reports_models.TimelineEvent.__table__])
+    with Session(engine) as db:
+        reports_crud.rebuild_event_feed(db)
+        print(f"Rebuilt timeline feed: {db.query(reports_models.TimelineEvent).count()} events.")
+
+if __name__ == "__main__":
+    rebuild()
@@ -0,0 +1,16 @@
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.modules.project import models as project_models  # noqa: F401 (FK target)
+from app.modules.reports import crud as reports_crud, models as reports_models
+
+# Recompute project_issue_stats from user_story.
+# Run once after deploying the counters table, and whenever counts look off.
+def rebuild():
+    reports_models.Base.metadata.create_all(bind=engine, tables=[reports_models.ProjectIssueStats.__table__])
+    with Session(engine) as db:
+        reports_crud.rebuild_issue_stats(db)
+        print(f"Rebuilt issue counters: {reports_crud.get_total_issues(db)} issues.")
+
+if __name__ == "__main__":
+    rebuild()
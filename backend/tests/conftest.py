@@ -2,3 +2,39 @@ import sys
 import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+
+@pytest.fixture
+def db_engine():
+    # Fresh SQLite in-memory database per test, with every module's tables registered
+    from app.database import Base
+    from app.modules.auth import models as auth_models  # noqa: F401
+    from app.modules.project import models as project_models  # noqa: F401
+    from app.modules.user_story import models as story_models  # noqa: F401
+    from app.modules.workflow import models as workflow_models  # noqa: F401
+    from app.modules.settings import models as settings_models  # noqa: F401
+    from app.modules.reports import models as reports_models  # noqa: F401
+
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine):
+    session = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)()
+    try:
+        yield session
+    finally:
+        session.close()
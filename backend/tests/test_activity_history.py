@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.models import GlobalRole, User
+from app.modules.project.models import Project
+from app.pagination import encode_cursor
+from app.modules.user_story import crud as story_crud, schemas
+from app.modules.user_story.models import UserStoryActivity
+
+
+@pytest.fixture
+def story(db_session):
+    project = Project(project_name="History", project_prefix="HI")
+    db_session.add(project)
+    db_session.commit()
+    story = story_crud.create_user_story(db_session, schemas.UserStoryCreate(
+        project_id=project.id, release_number="R1", assignee="a", reviewer="b",
+        title="Epic", description="first draft " * 40, status="todo", issue_type="epic",
+    ), None, user_id=1)
+    db_session.commit()
+    return story
+
+
+def test_structured_diff_and_text_delta(db_session, story):
+    old_description = story.description
+    new_description = old_description.replace("first", "second", 1) + "appendix"
+    story_crud.update_user_story_by_id(
+        db_session, story.id, schemas.UserStoryUpdateRequest(description=new_description, assignee="c"), user_id=1
+    )
+
+    created, updated = db_session.query(UserStoryActivity).order_by(UserStoryActivity.id).all()
+    assert created.diff == {"status": {"old": None, "new": "todo"}, "title": {"old": None, "new": "Epic"}}
+    assert updated.diff["assignee"] == {"old": "a", "new": "c"}
+
+    delta = updated.diff["description"]["delta"]
+    assert len(str(delta)) < len(new_description) / 4
+    assert story_crud.apply_text_delta(old_description, delta) == new_description
+
+
+def test_history_is_keyset_paginated(db_session, story):
+    for n in range(4):
+        story_crud.update_user_story_by_id(db_session, story.id, schemas.UserStoryUpdateRequest(assignee=f"u{n}"), user_id=1)
+    story_crud.update_user_story_status(db_session, story.id, "in_progress", user_id=1)
+    # Same timestamp everywhere: ties must be broken by id
+    db_session.query(UserStoryActivity).update({"created_at": datetime(2024, 1, 1)})
+    db_session.commit()
+
+    seen, before = [], None
+    while True:
+        page, before = story_crud.get_story_activity(db_session, story.id, 2, before=before)
+        seen.extend(a.id for a in page)
+        if before is None:
+            break
+    assert seen == sorted(seen, reverse=True) and len(seen) == 6
+
+    status_only, _ = story_crud.get_story_activity(db_session, story.id, 10, field="status")
+    assert [a.action for a in status_only] == ["STATUS_CHANGED", "CREATED"]
+    with pytest.raises(ValueError):
+        story_crud.get_story_activity(db_session, story.id, 10, field="password")
+
+
+def test_history_endpoint_cursor_header(db_engine, db_session, story):
+    for n in range(2):
+        story_crud.update_user_story_by_id(db_session, story.id, schemas.UserStoryUpdateRequest(assignee=f"u{n}"), user_id=1)
+    activities = db_session.query(UserStoryActivity).order_by(UserStoryActivity.id).all()
+    for offset, activity in enumerate(activities):
+        activity.created_at = datetime(2024, 1, 1) + timedelta(minutes=offset)
+    db_session.commit()
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    admin = User(name="admin", email="admin@example.com", password_hash="x", global_role=GlobalRole.ADMIN)
+    outsider = User(name="out", email="out@example.com", password_hash="x", global_role=GlobalRole.USER)
+    db_session.add_all([admin, outsider])
+    db_session.commit()
+    current = {"id": admin.id}
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_deps.get_current_user] = lambda: factory().get(User, current["id"])
+    try:
+        client = TestClient(app)
+        first = client.get(f"/user-story/{story.id}/history", params={"limit": 2})
+        assert [a["changes"] for a in first.json()] == ["Assignee: u0 → u1", "Assignee: a → u0"]
+        second = client.get(f"/user-story/{story.id}/history", params={"cursor": first.headers["x-next-cursor"]})
+        assert [a["action"] for a in second.json()] == ["CREATED"]
+        assert "x-next-cursor" not in second.headers
+        assert client.get(f"/user-story/{story.id}/history", params={"cursor": "bad"}).status_code == 400
+        # Well-formed cursors carrying the wrong types are rejected too
+        for cursor in (encode_cursor(1, 2), encode_cursor([1], 2), encode_cursor("2024-01-01T00:00:00", "x")):
+            assert client.get(f"/user-story/{story.id}/history", params={"cursor": cursor}).status_code == 400
+        assert client.get("/user-story/999999/history").status_code == 404
+
+        current["id"] = outsider.id
+        assert client.get(f"/user-story/{story.id}/history").status_code == 403
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(auth_deps.get_current_user, None)
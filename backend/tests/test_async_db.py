@@ -0,0 +1,126 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_async_db_engine, get_async_db
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.cache import role_cache
+from app.modules.auth.models import GlobalRole, ProjectMember, RoleType, User
+from app.modules.project import router as project_router
+from app.modules.project.models import Project
+from app.modules.reports import crud as reports_crud
+from app.modules.user_story import crud as story_crud, router as story_router
+from app.modules.user_story.models import UserStory
+
+
+@pytest.fixture
+def db_file(tmp_path):
+    # aiosqlite cannot share an in-memory database with the sync engine, so use a file
+    path = tmp_path / "async.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    project = Project(project_name="Async", project_prefix="AS")
+    user = User(name="dev", email="dev@example.com", password_hash="x", global_role=GlobalRole.USER)
+    db.add_all([project, user])
+    db.flush()
+    db.add(ProjectMember(project_id=project.id, user_id=user.id, role=RoleType.DEVELOPER))
+    for n in range(7):
+        db.add(UserStory(
+            project_id=project.id, release_number="R1", sprint_number=str(n % 2), story_code=f"AS-{n:04d}",
+            assignee="alice" if n % 3 else "bob", reviewer="r", title=f"t{n}", description="d",
+            status="done" if n % 2 else "todo", issue_type="story", created_at=datetime(2026, 3, 1 + n),
+        ))
+    db.commit()
+    ids = (project.id, user.id)
+    db.close()
+    engine.dispose()
+    role_cache.invalidate()
+    yield path, ids
+    role_cache.invalidate()
+
+
+def run_async(db_file, fn):
+    async def main():
+        engine = create_async_db_engine(f"sqlite+aiosqlite:///{db_file}")
+        try:
+            async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+                return await fn(db)
+        finally:
+            await engine.dispose()
+    return asyncio.run(main())
+
+
+def test_async_reads_match_sync_reads(db_file):
+    path, (project_id, user_id) = db_file
+    engine = create_engine(f"sqlite:///{path}")
+    db = sessionmaker(bind=engine)()
+    fields = ["id", "story_code", "project_name", "status"]
+    try:
+        sync_page = story_crud.list_user_stories(db, fields, 3, project_id=project_id, status="done")
+        sync_overview = reports_crud.get_project_overview(db, project_id)
+        sync_calendar = reports_crud.get_calendar_data(db, date(2026, 3, 1), date(2026, 4, 1), [project_id])
+    finally:
+        db.close()
+        engine.dispose()
+
+    async def reads(adb):
+        page = await story_crud.list_user_stories_async(adb, fields, 3, project_id=project_id, status="done")
+        overview = await reports_crud.get_project_overview_async(adb, project_id)
+        calendar = await reports_crud.get_calendar_data_async(adb, date(2026, 3, 1), date(2026, 4, 1), [project_id])
+        story = await story_crud.get_user_story_by_id_async(adb, page[0][0].id)
+        return page, overview, calendar, story.project.project_name
+
+    async_page, async_overview, async_calendar, project_name = run_async(path, reads)
+    assert [r._asdict() for r in async_page[0]] == [r._asdict() for r in sync_page[0]]
+    assert async_page[1] == sync_page[1]
+    assert async_overview == sync_overview
+    assert async_calendar == sync_calendar
+    assert project_name == "Async"
+
+
+def test_async_story_endpoints(db_file, monkeypatch):
+    path, (project_id, user_id) = db_file
+    engine = create_async_db_engine(f"sqlite+aiosqlite:///{path}")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_db():
+        async with factory() as db:
+            yield db
+
+    async def override_user():
+        async with factory() as db:
+            return await db.get(User, user_id)
+
+    app = FastAPI()
+    app.include_router(story_router.async_router)
+    app.include_router(project_router.async_router)
+    app.dependency_overrides[get_async_db] = override_db
+    app.dependency_overrides[auth_deps.get_current_user_async] = override_user
+
+    client = TestClient(app)
+    response = client.get("/user-story", params={"project_id": project_id, "limit": 5, "fields": "id,title"})
+    assert response.status_code == 200
+    assert len(response.json()) == 5
+    assert "X-Next-Cursor" in response.headers
+
+    story_id = response.json()[0]["id"]
+    detail = client.get(f"/user-story/{story_id}")
+    assert detail.status_code == 200
+    assert detail.json()["project_name"] == "Async"
+    assert client.get("/user-story/999999").status_code == 404
+
+    board = client.get(f"/projects/{project_id}/board")
+    assert board.status_code == 200
+    assert board.json()["project"]["currentUserRole"] == "DEVELOPER"
+    assert [issue["story_code"] for issue in board.json()["issues"]] == [f"AS-{n:04d}" for n in range(7)]
+    assert client.get(f"/projects/{project_id}/board", headers={"If-None-Match": board.headers["etag"]}).status_code == 304
+    assert client.get("/projects/999999/board").status_code == 404
+
+    asyncio.run(engine.dispose())
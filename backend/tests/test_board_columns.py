@@ -0,0 +1,108 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.models import GlobalRole, User
+from app.modules.project.models import Project
+from app.modules.reports import crud as reports_crud
+from app.modules.user_story.models import UserStory
+
+STATUSES = ["todo", "in_progress", "testing", "done"]
+
+
+@pytest.fixture
+def board(db_engine, db_session):
+    project = Project(project_name="Board", project_prefix="BD")
+    admin = User(name="admin", email="admin@example.com", password_hash="x", global_role=GlobalRole.ADMIN)
+    db_session.add_all([project, admin])
+    db_session.flush()
+    for n in range(40):
+        db_session.add(UserStory(
+            project_id=project.id, release_number="R1", sprint_number="1", story_code=f"BD-{n:04d}",
+            assignee="alice" if n % 2 else "bob", reviewer="r", title=f"t{n}", description="x" * 500,
+            status=STATUSES[n % 4], issue_type="epic" if n == 0 else "story",
+        ))
+    db_session.commit()
+    reports_crud.rebuild_issue_stats(db_session)
+    db_session.commit()
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    admin_id = admin.id
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_deps.get_current_user] = lambda: factory().get(User, admin_id)
+    yield TestClient(app), project.id
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(auth_deps.get_current_user, None)
+
+
+def test_board_returns_card_slices_with_counts(db_engine, board):
+    client, project_id = board
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db_engine, "before_cursor_execute", listener)
+    try:
+        response = client.get(f"/projects/{project_id}/board/columns", params={"per_column": 3})
+    finally:
+        event.remove(db_engine, "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    columns = {c["status"]: c for c in response.json()["columns"]}
+    assert list(columns) == STATUSES
+    # Epic (todo) excluded by default
+    assert columns["todo"]["count"] == 9
+    assert columns["done"]["count"] == 10
+    for column in columns.values():
+        assert len(column["cards"]) == 3
+        assert column["next_cursor"]
+        assert "description" not in column["cards"][0]
+    # project + counts + one query per column, independent of the number of issues
+    user_story_selects = [s for s in statements if "FROM user_story" in s]
+    assert len(user_story_selects) == len(STATUSES)
+
+
+def test_column_pages_continue_from_cursor(board):
+    client, project_id = board
+    first = client.get(f"/projects/{project_id}/board/columns", params={"per_column": 4}).json()["columns"][3]
+    seen = [card["id"] for card in first["cards"]]
+    cursor = first["next_cursor"]
+    while cursor:
+        page = client.get(f"/projects/{project_id}/board/columns/done", params={"cursor": cursor, "limit": 4}).json()
+        seen += [card["id"] for card in page["cards"]]
+        cursor = page["next_cursor"]
+
+    assert len(seen) == len(set(seen)) == 10
+
+
+def test_filtered_counts_use_story_rows(board):
+    client, project_id = board
+    columns = client.get(f"/projects/{project_id}/board/columns", params={"assignee": "alice"}).json()["columns"]
+    assert sum(c["count"] for c in columns) == 20
+    assert all(card["assignee"] == "alice" for c in columns for card in c["cards"])
+
+
+def test_in_sprint_hides_unplanned_cards(db_session, board):
+    client, project_id = board
+    db_session.add(UserStory(
+        project_id=project_id, release_number="R1", sprint_number="", story_code="BD-0100",
+        assignee="bob", reviewer="r", title="unplanned", description="x", status="todo", issue_type="story",
+    ))
+    db_session.commit()
+
+    body = client.get(f"/projects/{project_id}/board/columns", params={"in_sprint": True, "include_sprints": True}).json()
+    todo = body["columns"][0]
+    assert todo["count"] == 9
+    assert "unplanned" not in [card["title"] for card in todo["cards"]]
+    assert body["sprints"] == ["1"]
+    assert client.get(f"/projects/{project_id}/board/columns").json()["sprints"] is None
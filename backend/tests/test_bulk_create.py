@@ -0,0 +1,114 @@
+import pytest
+from sqlalchemy import event
+
+from app.modules.project.models import Project
+from app.modules.user_story import crud as story_crud
+from app.modules.user_story.models import UserStory, UserStoryActivity
+
+
+def row(title, issue_type, **extra):
+    data = dict(
+        release_number="R1",
+        assignee="alice",
+        reviewer="bob",
+        title=title,
+        description="d",
+        status="todo",
+        issue_type=issue_type,
+    )
+    data.update(extra)
+    return data
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(project_name="Import", project_prefix="IM")
+    db_session.add(project)
+    db_session.commit()
+    return project
+
+
+def test_bulk_create_with_in_batch_parents(db_session, project):
+    items = [
+        row("Task", "task", ref="t", parent_ref="s"),
+        row("Epic", "epic", ref="e"),
+        row("Story", "story", ref="s", parent_ref="e"),
+        row("Subtask", "subtask", parent_ref="t"),
+    ]
+    created, errors = story_crud.bulk_create_user_stories(db_session, project.id, items, user_id=1)
+    db_session.commit()
+
+    assert errors == []
+    assert [c["story_code"] for c in created] == ["IM-0001", "IM-0002", "IM-0003", "IM-0004"]
+
+    by_title = {s.title: s for s in db_session.query(UserStory).all()}
+    assert by_title["Story"].parent_issue_id == by_title["Epic"].id
+    assert by_title["Task"].parent_issue_id == by_title["Story"].id
+    assert by_title["Subtask"].parent_issue_id == by_title["Task"].id
+    assert db_session.query(UserStoryActivity).filter_by(action="CREATED").count() == 4
+
+
+def test_bug_under_in_batch_task_is_inserted_after_it(db_session, project):
+    items = [
+        row("Epic", "epic", ref="e"),
+        row("Story", "story", ref="s", parent_ref="e"),
+        row("Task", "task", ref="t", parent_ref="s"),
+        row("Bug on task", "bug", parent_ref="t"),
+        row("Bug on story", "bug", parent_ref="s"),
+    ]
+    created, errors = story_crud.bulk_create_user_stories(db_session, project.id, items, user_id=1)
+    db_session.commit()
+
+    assert errors == [] and len(created) == 5
+    by_title = {s.title: s for s in db_session.query(UserStory).all()}
+    assert by_title["Bug on task"].parent_issue_id == by_title["Task"].id
+    assert by_title["Bug on story"].parent_issue_id == by_title["Story"].id
+
+
+def test_bulk_create_reports_row_errors(db_session, project):
+    epic = story_crud.create_user_story(
+        db_session, story_crud.schemas.UserStoryCreate(project_id=project.id, **row("Existing", "epic")), None, user_id=1
+    )
+    db_session.commit()
+
+    items = [
+        row("Good story", "story", parent_issue_id=epic.id),
+        row("Orphan task", "task"),
+        {"title": "missing fields"},
+        row("Bad epic", "story", ref="bad", parent_ref="nope"),
+        row("Child of bad", "task", parent_ref="bad"),
+        "not an object",
+    ]
+    created, errors = story_crud.bulk_create_user_stories(db_session, project.id, items, user_id=1)
+    db_session.commit()
+
+    assert [c["index"] for c in created] == [0]
+    assert created[0]["story_code"] == "IM-0002"
+    details = {e["index"]: e["detail"] for e in errors}
+    assert details[1] == "Tasks must belong to a Story."
+    assert "release_number" in details[2]
+    assert details[3] == "Parent Epic not found."
+    assert details[4] == "Parent row 3 failed validation."
+    assert 5 in details
+
+
+def test_atomic_batch_inserts_nothing_on_error(db_session, project):
+    items = [row("Epic", "epic"), row("Orphan", "story")]
+    created, errors = story_crud.bulk_create_user_stories(db_session, project.id, items, user_id=1, atomic=True)
+    assert created == [] and len(errors) == 1
+    assert db_session.query(UserStory).count() == 0
+
+
+def test_insert_statements_scale_with_depth_not_rows(db_engine, db_session, project):
+    items = [row("Epic", "epic", ref="e")] + [row(f"Story {i}", "story", parent_ref="e") for i in range(200)]
+    inserts = []
+    listener = lambda conn, cursor, statement, *args: inserts.append(statement) if statement.startswith("INSERT INTO user_story") else None
+    event.listen(db_engine, "before_cursor_execute", listener)
+    try:
+        created, errors = story_crud.bulk_create_user_stories(db_session, project.id, items, user_id=1)
+    finally:
+        event.remove(db_engine, "before_cursor_execute", listener)
+
+    assert len(created) == 201 and errors == []
+    # one INSERT per hierarchy level + one for activities
+    assert len(inserts) == 3
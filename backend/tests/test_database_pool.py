@@ -0,0 +1,40 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.database import MeteredQueuePool, create_db_engine, get_pool_metrics
+
+
+@pytest.fixture
+def pooled_engine(tmp_path):
+    engine = create_db_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=MeteredQueuePool, pool_size=1, max_overflow=1, pool_timeout=0.05
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_echo_off_by_default(pooled_engine):
+    assert pooled_engine.echo is False
+
+
+def test_pool_metrics_track_checkouts_overflow_and_timeouts(pooled_engine):
+    first = pooled_engine.connect()
+    second = pooled_engine.connect()
+    first.execute(text("SELECT 1"))
+
+    metrics = get_pool_metrics(pooled_engine)
+    assert metrics["checked_out"] == 2
+    assert metrics["overflow"] == 1
+    assert metrics["checkouts"] == 2
+
+    with pytest.raises(PoolTimeoutError):
+        pooled_engine.connect()
+    assert get_pool_metrics(pooled_engine)["timeouts"] == 1
+
+    first.close()
+    second.close()
+    metrics = get_pool_metrics(pooled_engine)
+    assert metrics["checked_out"] == 0
+    assert metrics["max_wait_ms"] >= 50
@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import event
+
+from app.modules.project.models import Project
+from app.modules.user_story import crud as story_crud
+from app.modules.user_story.models import UserStory
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(project_name="Dupes", project_prefix="DU")
+    db_session.add(project)
+    db_session.flush()
+    for n, title in enumerate(["Fix login bug", "Fix login bug (1)", "Fix login bug (3)", "100% done", "100x done (1)"]):
+        db_session.add(UserStory(
+            project_id=project.id, release_number="R1", sprint_number="", story_code=f"DU-{n}",
+            assignee="a", reviewer="b", title=title, description="d", status="todo", issue_type="epic",
+        ))
+    db_session.commit()
+    return project
+
+
+def test_next_free_suffix(db_session, project):
+    assert story_crud.resolve_unique_titles(db_session, project.id, ["Fix login bug"]) == ["Fix login bug (2)"]
+    assert story_crud.resolve_unique_titles(db_session, project.id, ["Brand new"]) == ["Brand new"]
+
+
+def test_like_wildcards_are_literal(db_session, project):
+    # "100x done (1)" must not be treated as a suffix of "100% done"
+    assert story_crud.resolve_unique_titles(db_session, project.id, ["100% done"]) == ["100% done (1)"]
+
+
+def test_batch_titles_are_unique_among_themselves(db_session, project):
+    titles = ["Fix login bug", "Fix login bug", "Other", "Other"]
+    assert story_crud.resolve_unique_titles(db_session, project.id, titles) == [
+        "Fix login bug (2)", "Fix login bug (4)", "Other", "Other (1)"
+    ]
+
+
+def test_single_lookup_query(db_engine, db_session, project):
+    project_id = project.id
+    selects = []
+    listener = lambda conn, cursor, statement, *args: selects.append(statement) if "user_story" in statement else None
+    event.listen(db_engine, "before_cursor_execute", listener)
+    try:
+        story_crud.resolve_unique_titles(db_session, project_id, ["Fix login bug"])
+    finally:
+        event.remove(db_engine, "before_cursor_execute", listener)
+    assert len(selects) == 1
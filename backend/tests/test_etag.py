@@ -0,0 +1,117 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.modules.auth import crud as auth_crud
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.models import GlobalRole, RoleType, User
+from app.modules.project.models import Project
+from app.modules.user_story import crud as story_crud
+from app.modules.user_story.models import UserStory
+
+
+@pytest.fixture
+def project_client(db_engine, db_session):
+    project = Project(project_name="Cached", project_prefix="CA")
+    admin = User(name="admin", email="admin@example.com", password_hash="x", global_role=GlobalRole.ADMIN)
+    member = User(name="dev", email="dev@example.com", password_hash="x", global_role=GlobalRole.USER)
+    db_session.add_all([project, admin, member])
+    db_session.flush()
+    stories = [
+        UserStory(
+            project_id=project.id, release_number="R1", sprint_number="1", story_code=f"CA-{n:04d}",
+            assignee="alice", reviewer="r", title=f"t{n}", description="d", status="todo", issue_type="story",
+        )
+        for n in range(5)
+    ]
+    db_session.add_all(stories)
+    db_session.commit()
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    admin_id = admin.id
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_deps.get_current_user] = lambda: factory().get(User, admin_id)
+    yield TestClient(app), project.id, member.id, [story.id for story in stories]
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(auth_deps.get_current_user, None)
+
+
+def count_statements(db_engine, call):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db_engine, "before_cursor_execute", listener)
+    try:
+        response = call()
+    finally:
+        event.remove(db_engine, "before_cursor_execute", listener)
+    return response, statements
+
+
+def test_board_revalidates_with_304(db_engine, project_client):
+    client, project_id, _, _ = project_client
+    first = client.get(f"/projects/{project_id}/board")
+    assert first.status_code == 200
+    tag = first.headers["etag"]
+    assert tag.startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second, statements = count_statements(
+        db_engine, lambda: client.get(f"/projects/{project_id}/board", headers={"If-None-Match": tag})
+    )
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == tag
+    # Only the version lookup and the access check; the issues are never loaded
+    assert not any("user_story" in statement.lower() for statement in statements)
+
+
+def test_story_write_changes_etag(db_session, project_client):
+    client, project_id, _, story_ids = project_client
+    tag = client.get(f"/projects/{project_id}/reports/issues-by-status").headers["etag"]
+    assert client.get(
+        f"/projects/{project_id}/reports/issues-by-status", headers={"If-None-Match": tag}
+    ).status_code == 304
+
+    assert story_crud.delete_user_story_by_id(db_session, story_ids[0])
+
+    response = client.get(f"/projects/{project_id}/reports/issues-by-status", headers={"If-None-Match": tag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != tag
+    assert sum(row["count"] for row in response.json()) == 4
+
+
+def test_member_change_changes_assignees_etag(db_session, project_client):
+    client, project_id, member_id, _ = project_client
+    first = client.get(f"/projects/{project_id}/assignees")
+    tag = first.headers["etag"]
+
+    auth_crud.assign_role(db_session, member_id, project_id, RoleType.DEVELOPER)
+
+    second = client.get(f"/projects/{project_id}/assignees", headers={"If-None-Match": tag})
+    assert second.status_code == 200
+    assert second.headers["etag"] != tag
+
+
+def test_story_detail_etag_and_unknown_project(project_client):
+    client, project_id, _, story_ids = project_client
+    first = client.get(f"/user-story/{story_ids[1]}")
+    assert first.status_code == 200
+    assert client.get(
+        f"/user-story/{story_ids[1]}", headers={"If-None-Match": first.headers["etag"]}
+    ).status_code == 304
+    # A different story in the same project never shares the tag
+    other = client.get(f"/user-story/{story_ids[2]}")
+    assert other.headers["etag"] != first.headers["etag"]
+
+    assert client.get("/projects/9999/reports/summary").status_code == 404
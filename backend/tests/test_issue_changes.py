@@ -0,0 +1,116 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.models import GlobalRole, User
+from app.modules.project.models import Project
+from app.modules.user_story import crud as story_crud, schemas
+
+
+def epic(project_id, title):
+    return schemas.UserStoryCreate(
+        project_id=project_id, release_number="R1", assignee="a", reviewer="b",
+        title=title, description="d", status="todo", issue_type="epic",
+    )
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(project_name="Sync", project_prefix="SY")
+    db_session.add(project)
+    db_session.commit()
+    return project.id
+
+
+@pytest.fixture
+def client(db_engine, db_session):
+    admin = User(name="admin", email="admin@example.com", password_hash="x", global_role=GlobalRole.ADMIN)
+    db_session.add(admin)
+    db_session.commit()
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    admin_id = admin.id
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_deps.get_current_user] = lambda: factory().get(User, admin_id)
+    yield TestClient(app)
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(auth_deps.get_current_user, None)
+
+
+def test_changes_return_only_the_delta(db_session, project):
+    a = story_crud.create_user_story(db_session, epic(project, "A"), None, user_id=1)
+    b = story_crud.create_user_story(db_session, epic(project, "B"), None, user_id=1)
+    db_session.commit()
+
+    changes, deleted, cursor, has_more = story_crud.get_project_changes(db_session, project, limit=100)
+    assert [row.id for row in changes] == [a.id, b.id]
+    assert deleted == [] and not has_more
+
+    story_crud.update_user_story_status(db_session, a.id, "in_progress", user_id=1)
+    story_crud.update_user_story_status(db_session, a.id, "done", user_id=1)
+    changes, deleted, cursor, _ = story_crud.get_project_changes(
+        db_session, project, limit=100, after_seq=cursor[0], after_id=cursor[1]
+    )
+    # Two writes, one entry with the latest state
+    assert [(row.id, row.status) for row in changes] == [(a.id, "done")]
+
+    assert story_crud.delete_user_story_by_id(db_session, b.id)
+    changes, deleted, cursor, _ = story_crud.get_project_changes(
+        db_session, project, limit=100, after_seq=cursor[0], after_id=cursor[1]
+    )
+    assert changes == []
+    assert [(row.id, row.story_code) for row in deleted] == [(b.id, b.story_code)]
+
+    # Caught up: nothing new, cursor unchanged
+    assert story_crud.get_project_changes(
+        db_session, project, limit=100, after_seq=cursor[0], after_id=cursor[1]
+    ) == ([], [], cursor, False)
+
+
+def test_bulk_rows_share_a_sequence_and_page_by_id(db_session, project):
+    items = [
+        dict(release_number="R1", assignee="a", reviewer="b", title=f"E{i}", description="d", status="todo", issue_type="epic")
+        for i in range(5)
+    ]
+    created, _ = story_crud.bulk_create_user_stories(db_session, project, items, user_id=1)
+    db_session.commit()
+
+    seen = []
+    after = (0, 0)
+    while True:
+        changes, _, after, has_more = story_crud.get_project_changes(
+            db_session, project, limit=2, after_seq=after[0], after_id=after[1]
+        )
+        seen.extend(row.id for row in changes)
+        if not has_more:
+            break
+    assert seen == sorted(entry["id"] for entry in created)
+    assert len({row.change_seq for row in story_crud.get_project_changes(db_session, project, limit=10)[0]}) == 1
+
+
+def test_changes_endpoint_round_trip(db_session, project, client):
+    story = story_crud.create_user_story(db_session, epic(project, "A"), None, user_id=1)
+    db_session.commit()
+
+    first = client.get(f"/projects/{project}/issues/changes").json()
+    assert [item["id"] for item in first["changes"]] == [story.id]
+    assert first["has_more"] is False
+
+    assert story_crud.delete_user_story_by_id(db_session, story.id)
+    second = client.get(f"/projects/{project}/issues/changes", params={"since": first["cursor"]}).json()
+    assert second["changes"] == []
+    assert [item["id"] for item in second["deleted"]] == [story.id]
+
+    assert client.get(f"/projects/{project}/issues/changes", params={"since": "garbage"}).status_code == 400
+    assert client.get("/projects/9999/issues/changes").status_code == 404
@@ -0,0 +1,89 @@
+import csv
+import gzip
+import io
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.models import GlobalRole, User
+from app.modules.project.models import Project
+from app.modules.user_story import crud as story_crud
+
+
+@pytest.fixture
+def exported(db_engine, db_session):
+    project = Project(project_name="Audit", project_prefix="AU")
+    admin = User(name="admin", email="admin@example.com", password_hash="x", global_role=GlobalRole.ADMIN)
+    db_session.add_all([project, admin])
+    db_session.commit()
+    items = [
+        dict(release_number="R1", assignee="a", reviewer="b", title=f"Epic, {i}", description="multi\nline", status="todo", issue_type="epic")
+        for i in range(3)
+    ]
+    story_crud.bulk_create_user_stories(db_session, project.id, items, user_id=admin.id)
+    db_session.commit()
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    admin_id = admin.id
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_deps.get_current_user] = lambda: factory().get(User, admin_id)
+    yield TestClient(app), project.id
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(auth_deps.get_current_user, None)
+
+
+def test_ndjson_export_with_activity(exported):
+    client, project_id = exported
+    response = client.get(f"/projects/{project_id}/issues/export", params={"include_activity": True})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert 'filename="AU-issues.ndjson"' in response.headers["content-disposition"]
+
+    records = [json.loads(line) for line in response.text.splitlines()]
+    assert [r["record_type"] for r in records] == ["issue"] * 3 + ["activity"] * 3
+    assert records[0]["title"] == "Epic, 0"
+    assert records[3]["story_id"] == records[0]["id"]
+    assert records[3]["action"] == "CREATED"
+
+
+def test_csv_export_round_trips(exported):
+    client, project_id = exported
+    response = client.get(f"/projects/{project_id}/issues/export", params={"format": "csv"})
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["title"] for row in rows] == ["Epic, 0", "Epic, 1", "Epic, 2"]
+    assert rows[0]["description"] == "multi\nline"
+    assert rows[0]["parent_issue_id"] == ""
+
+
+def test_gzip_export(exported):
+    client, project_id = exported
+    response = client.get(f"/projects/{project_id}/issues/export", params={"gzip": True})
+    assert response.headers["content-type"] == "application/gzip"
+    lines = gzip.decompress(response.content).decode("utf-8").splitlines()
+    assert len(lines) == 3
+
+
+def test_export_streams_rows_lazily(db_session, exported):
+    _, project_id = exported
+    records = story_crud.iter_project_export(db_session, project_id, include_activity=True, batch_size=1)
+    assert next(records)[0] == "issue"
+    records.close()
+
+
+def test_export_rejects_unknown_format(exported):
+    client, project_id = exported
+    assert client.get(f"/projects/{project_id}/issues/export", params={"format": "xml"}).status_code == 422
+    assert client.get("/projects/9999/issues/export").status_code == 404
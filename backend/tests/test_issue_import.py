@@ -0,0 +1,152 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.models import GlobalRole, User
+from app.modules.project.models import Project
+from app.modules.user_story.models import UserStory
+
+CSV_HEADER = "ref,parent_ref,parent_story_code,release_number,assignee,reviewer,title,description,status,issue_type\n"
+
+
+@pytest.fixture
+def importer(db_engine, db_session):
+    project = Project(project_name="Import", project_prefix="IM")
+    admin = User(name="admin", email="admin@example.com", password_hash="x", global_role=GlobalRole.ADMIN)
+    db_session.add_all([project, admin])
+    db_session.flush()
+    existing = UserStory(
+        project_id=project.id, release_number="R1", sprint_number="", story_code="IM-0100", assignee="a",
+        reviewer="b", title="Existing epic", description="d", status="todo", issue_type="epic",
+    )
+    db_session.add(existing)
+    db_session.commit()
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    admin_id = admin.id
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_deps.get_current_user] = lambda: factory().get(User, admin_id)
+    yield TestClient(app), project.id
+    app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(auth_deps.get_current_user, None)
+
+
+def test_csv_import_resolves_parents_across_batches(db_session, importer):
+    client, project_id = importer
+    body = CSV_HEADER + "\n".join([
+        "e1,,,R1,a,b,Epic,d,todo,epic",
+        "s1,e1,,R1,a,b,Story under epic,d,todo,story",
+        "t1,s1,,R1,a,b,Task,d,todo,task",
+        "bad,,,R1,a,b,Bad status,d,nope,story",
+        "t2,bad,,R1,a,b,Orphan,d,todo,task",
+        "s2,,IM-0100,R1,a,b,Story under existing,d,todo,story",
+        "t3,missing,,R1,a,b,Unknown parent,d,todo,task",
+    ]) + "\n"
+
+    response = client.post(
+        f"/projects/{project_id}/issues/import",
+        params={"batch_size": 2},
+        files={"file": ("backlog.csv", body.encode("utf-8"), "text/csv")},
+    )
+    assert response.status_code == 202
+    import_id = response.json()["id"]
+
+    job = client.get(f"/projects/{project_id}/issues/import/{import_id}").json()
+    assert job["status"] == "completed"
+    assert (job["processed_rows"], job["created_count"], job["error_count"]) == (7, 4, 3)
+
+    stories = {s.title: s for s in db_session.query(UserStory).filter(UserStory.project_id == project_id)}
+    assert stories["Story under epic"].parent_issue_id == stories["Epic"].id
+    assert stories["Task"].parent_issue_id == stories["Story under epic"].id
+    assert stories["Story under existing"].parent_issue_id == stories["Existing epic"].id
+
+    first = client.get(f"/projects/{project_id}/issues/import/{import_id}/errors", params={"limit": 2}).json()
+    assert [e["row_number"] for e in first["errors"]] == [4, 5]
+    assert first["errors"][1]["detail"] == "Parent row 'bad' failed validation."
+    rest = client.get(
+        f"/projects/{project_id}/issues/import/{import_id}/errors", params={"cursor": first["next_cursor"]}
+    ).json()
+    assert [e["row_number"] for e in rest["errors"]] == [7]
+    assert "Unknown parent_ref" in rest["errors"][0]["detail"]
+    assert rest["next_cursor"] is None
+
+
+def test_csv_import_bug_under_task_in_same_batch(db_session, importer):
+    client, project_id = importer
+    body = CSV_HEADER + "\n".join([
+        "e1,,,R1,a,b,Epic,d,todo,epic",
+        "s1,e1,,R1,a,b,Story,d,todo,story",
+        "t1,s1,,R1,a,b,Task,d,todo,task",
+        "b1,t1,,R1,a,b,Bug on task,d,todo,bug",
+    ]) + "\n"
+
+    import_id = client.post(
+        f"/projects/{project_id}/issues/import",
+        files={"file": ("backlog.csv", body.encode("utf-8"), "text/csv")},
+    ).json()["id"]
+
+    job = client.get(f"/projects/{project_id}/issues/import/{import_id}").json()
+    assert job["status"] == "completed"
+    assert (job["processed_rows"], job["created_count"], job["error_count"]) == (4, 4, 0)
+    stories = {s.title: s for s in db_session.query(UserStory).filter(UserStory.project_id == project_id)}
+    assert stories["Bug on task"].parent_issue_id == stories["Task"].id
+
+
+def test_csv_import_duplicate_ref_keeps_imported_parent(db_session, importer):
+    client, project_id = importer
+    body = CSV_HEADER + "\n".join([
+        "e1,,,R1,a,b,Epic,d,todo,epic",
+        "e2,,,R1,a,b,Other epic,d,todo,epic",
+        "e1,,,R1,a,b,Duplicate epic,d,todo,epic",
+        "e3,,,R1,a,b,Third epic,d,todo,epic",
+        "s1,e1,,R1,a,b,Story,d,todo,story",
+    ]) + "\n"
+
+    import_id = client.post(
+        f"/projects/{project_id}/issues/import",
+        params={"batch_size": 2},
+        files={"file": ("backlog.csv", body.encode("utf-8"), "text/csv")},
+    ).json()["id"]
+
+    job = client.get(f"/projects/{project_id}/issues/import/{import_id}").json()
+    assert (job["processed_rows"], job["created_count"], job["error_count"]) == (5, 4, 1)
+    errors = client.get(f"/projects/{project_id}/issues/import/{import_id}/errors").json()["errors"]
+    assert [(e["row_number"], e["detail"]) for e in errors] == [(3, "Duplicate ref 'e1'")]
+    stories = {s.title: s for s in db_session.query(UserStory).filter(UserStory.project_id == project_id)}
+    assert stories["Story"].parent_issue_id == stories["Epic"].id
+
+
+def test_ndjson_import_reports_bad_lines(importer):
+    client, project_id = importer
+    row = dict(release_number="R1", assignee="a", reviewer="b", title="From json", description="d", status="todo", issue_type="epic")
+    body = json.dumps(row) + "\n{not json\n\n" + json.dumps([1, 2]) + "\n"
+
+    import_id = client.post(
+        f"/projects/{project_id}/issues/import",
+        files={"file": ("backlog.ndjson", body.encode("utf-8"), "application/x-ndjson")},
+    ).json()["id"]
+
+    job = client.get(f"/projects/{project_id}/issues/import/{import_id}").json()
+    assert (job["processed_rows"], job["created_count"], job["error_count"]) == (3, 1, 2)
+    errors = client.get(f"/projects/{project_id}/issues/import/{import_id}/errors").json()["errors"]
+    assert [(e["row_number"], e["detail"]) for e in errors] == [(2, "Row must be a JSON object"), (3, "Row must be a JSON object")]
+
+
+def test_import_needs_a_known_format(importer):
+    client, project_id = importer
+    response = client.post(f"/projects/{project_id}/issues/import", files={"file": ("backlog.txt", b"x", "text/plain")})
+    assert response.status_code == 400
+    assert client.get(f"/projects/{project_id}/issues/import/9999").status_code == 404
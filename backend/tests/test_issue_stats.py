@@ -0,0 +1,72 @@
+import pytest
+
+from app.modules.project.models import Project
+from app.modules.reports import crud as reports_crud
+from app.modules.reports.models import ProjectIssueStats
+from app.modules.user_story import crud as story_crud, schemas
+from app.modules.user_story.models import UserStory
+
+
+def epic(project_id, title, status="todo"):
+    return schemas.UserStoryCreate(
+        project_id=project_id, release_number="R1", assignee="a", reviewer="b",
+        title=title, description="d", status=status, issue_type="epic",
+    )
+
+
+def counters(db):
+    return {
+        (s.project_id, s.status, s.issue_type): s.issue_count
+        for s in db.query(ProjectIssueStats).all()
+        if s.issue_count
+    }
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(project_name="Stats", project_prefix="ST")
+    db_session.add(project)
+    db_session.commit()
+    return project.id
+
+
+def test_counters_follow_story_lifecycle(db_session, project):
+    a = story_crud.create_user_story(db_session, epic(project, "A"), None, user_id=1)
+    b = story_crud.create_user_story(db_session, epic(project, "B"), None, user_id=1)
+    db_session.commit()
+    assert counters(db_session) == {(project, "todo", "epic"): 2}
+
+    story_crud.update_user_story_status(db_session, a.id, "in_progress", user_id=1)
+    story_crud.update_user_story_by_id(db_session, b.id, schemas.UserStoryUpdateRequest(status="done"), user_id=1)
+    assert counters(db_session) == {(project, "in_progress", "epic"): 1, (project, "done", "epic"): 1}
+
+    assert story_crud.delete_user_story_by_id(db_session, a.id)
+    assert counters(db_session) == {(project, "done", "epic"): 1}
+    assert reports_crud.get_total_issues(db_session) == 1
+
+
+def test_bulk_create_updates_counters(db_session, project):
+    items = [
+        dict(release_number="R1", assignee="a", reviewer="b", title=f"E{i}", description="d", status="backlog", issue_type="epic")
+        for i in range(3)
+    ]
+    story_crud.bulk_create_user_stories(db_session, project, items, user_id=1)
+    db_session.commit()
+    assert counters(db_session) == {(project, "backlog", "epic"): 3}
+
+
+def test_rebuild_repairs_drift(db_session, project):
+    story_crud.create_user_story(db_session, epic(project, "A"), None, user_id=1)
+    db_session.commit()
+    # Rows written behind the counters' back
+    db_session.add(UserStory(
+        project_id=project, release_number="R1", sprint_number="", story_code="ST-9", assignee="a",
+        reviewer="b", title="raw", description="d", status="done", issue_type="bug",
+    ))
+    db_session.commit()
+    assert reports_crud.get_total_issues(db_session) == 1
+
+    reports_crud.rebuild_issue_stats(db_session)
+    assert counters(db_session) == {(project, "todo", "epic"): 1, (project, "done", "bug"): 1}
+    assert dict(reports_crud.get_issue_counts_by_type(db_session)) == {"epic": 1, "bug": 1}
+    assert dict(reports_crud.get_issue_counts_by_status(db_session)) == {"todo": 1, "done": 1}
@@ -0,0 +1,34 @@
+import logging
+
+from fastapi.testclient import TestClient
+
+from app.log import DebugSamplingFilter, REQUEST_ID_HEADER, RequestIdFilter, request_id_var
+
+
+def make_record(level):
+    return logging.LogRecord("app.test", level, __file__, 1, "msg", None, None)
+
+
+def test_debug_records_are_sampled_but_info_is_kept():
+    drop_all = DebugSamplingFilter(0.0)
+    assert not drop_all.filter(make_record(logging.DEBUG))
+    assert drop_all.filter(make_record(logging.INFO))
+    assert DebugSamplingFilter(1.0).filter(make_record(logging.DEBUG))
+
+
+def test_records_carry_current_request_id():
+    token = request_id_var.set("abc123")
+    try:
+        record = make_record(logging.INFO)
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+    assert record.request_id == "abc123"
+
+
+def test_request_id_is_echoed_or_generated():
+    from app.main import app
+
+    client = TestClient(app)
+    assert client.get("/", headers={REQUEST_ID_HEADER: "req-1"}).headers[REQUEST_ID_HEADER] == "req-1"
+    assert len(client.get("/").headers[REQUEST_ID_HEADER]) == 32
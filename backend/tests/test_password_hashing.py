@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.modules.auth import security
+from app.modules.auth.models import GlobalRole, User
+
+
+@pytest.fixture
+def client(db_engine, monkeypatch):
+    from app.main import app
+
+    monkeypatch.setattr(security, "BCRYPT_ROUNDS", 5)
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app), factory
+    app.dependency_overrides.pop(get_db, None)
+
+
+def test_login_upgrades_hash_when_cost_changes(client):
+    client, factory = client
+    with factory() as db:
+        db.add(User(name="dev", email="dev@example.com", password_hash=security.get_password_hash("Password123!", rounds=4),
+                    global_role=GlobalRole.USER, is_active=True))
+        db.commit()
+
+    response = client.post("/auth/login", data={"username": "dev@example.com", "password": "Password123!"})
+    assert response.status_code == 200
+
+    with factory() as db:
+        stored = db.query(User).filter(User.email == "dev@example.com").one().password_hash
+    assert stored.startswith("$2b$05$")
+    assert not security.password_needs_rehash(stored)
+
+    assert client.post("/auth/login", data={"username": "dev@example.com", "password": "Password123!"}).status_code == 200
+    assert client.post("/auth/login", data={"username": "dev@example.com", "password": "wrong-pass"}).status_code == 401
+
+
+def test_register_hashes_on_pool(client):
+    client, factory = client
+    completed = security.password_hash_pool.completed
+    response = client.post("/auth/register", json={
+        "name": "New", "email": "new@example.com", "password": "Password123!",
+        "confirm_password": "Password123!", "role": "DEVELOPER",
+    })
+    assert response.status_code == 200
+    assert security.password_hash_pool.completed == completed + 1
+
+
+def test_pool_rejects_beyond_capacity():
+    pool = security.PasswordHashPool(workers=1, max_queue=1)
+    release = threading.Event()
+    blocked = [pool.submit(release.wait), pool.submit(release.wait)]
+
+    with pytest.raises(security.PasswordHashPoolBusy):
+        pool.submit(release.wait)
+    metrics = pool.metrics()
+    assert metrics["rejected"] == 1
+    assert metrics["running"] == 1 and metrics["queued"] == 1
+
+    release.set()
+    for future in blocked:
+        future.result(timeout=5)
+    assert pool.metrics()["completed"] == 2
+    assert asyncio.run(pool.run(security.verify_password, "pw", security.get_password_hash("pw", rounds=4)))
+
+
+def test_cancelled_queued_job_frees_its_slot():
+    pool = security.PasswordHashPool(workers=1, max_queue=1)
+    release = threading.Event()
+    blocker = pool.submit(release.wait)
+
+    async def cancel_while_queued():
+        task = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        queued = pool.metrics()["queued"]
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return queued
+
+    try:
+        assert asyncio.run(cancel_while_queued()) == 1
+        metrics = pool.metrics()
+        assert metrics["running"] == 1 and metrics["queued"] == 0
+
+        # The freed slot admits a new job instead of raising PasswordHashPoolBusy
+        queued = pool.submit(release.wait)
+    finally:
+        release.set()
+    blocker.result(timeout=5)
+    queued.result(timeout=5)
+    metrics = pool.metrics()
+    assert (metrics["running"], metrics["queued"], metrics["completed"]) == (0, 0, 2)
@@ -0,0 +1,136 @@
+import asyncio
+import json
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app import events
+from app.database import get_db
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.models import GlobalRole, User
+from app.modules.project.models import Project
+from app.modules.user_story import crud as story_crud, schemas
+
+
+def epic(project_id, title):
+    return schemas.UserStoryCreate(
+        project_id=project_id, release_number="R1", assignee="a", reviewer="b",
+        title=title, description="d", status="todo", issue_type="epic",
+    )
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(project_name="Live", project_prefix="LV")
+    db_session.add(project)
+    db_session.commit()
+    return project.id
+
+
+class RecordingHub:
+    def __init__(self):
+        self.published = []
+
+    def publish(self, project_id, event):
+        self.published.append((project_id, event["type"], event["story_id"]))
+
+
+@pytest.fixture
+def recorded(monkeypatch):
+    hub = RecordingHub()
+    monkeypatch.setattr(events, "hub", hub)
+    return hub.published
+
+
+def test_story_writes_publish_after_commit(db_session, project, recorded):
+    story = story_crud.create_user_story(db_session, epic(project, "A"), None, user_id=1)
+    assert recorded == []
+    db_session.commit()
+    assert recorded == [(project, "story.created", story.id)]
+
+    story_crud.update_user_story_status(db_session, story.id, "in_progress", user_id=1)
+    story_crud.update_user_story_by_id(db_session, story.id, schemas.UserStoryUpdateRequest(title="B"), user_id=1)
+    story_crud.delete_user_story_by_id(db_session, story.id)
+    assert [event_type for _, event_type, _ in recorded[1:]] == ["story.status_changed", "story.updated", "story.deleted"]
+
+
+def test_rolled_back_writes_publish_nothing(db_session, project, recorded):
+    story_crud.create_user_story(db_session, epic(project, "A"), None, user_id=1)
+    db_session.rollback()
+    db_session.commit()
+    assert recorded == []
+
+
+def test_stream_delivers_events_and_unsubscribes():
+    hub = events.InProcessEventHub(queue_size=2)
+
+    async def run():
+        events.set_hub(hub)
+        stream = events.stream_project_events(7, heartbeat_seconds=0.05)
+        assert await stream.__anext__() == ": connected\n\n"
+        assert hub.subscriber_count(7) == 1
+
+        # Published from another thread, as request handlers do
+        thread = threading.Thread(target=hub.publish, args=(7, {"type": "story.updated", "change_seq": 3, "story_id": 1}))
+        thread.start()
+        thread.join()
+        chunk = await stream.__anext__()
+        assert chunk.startswith("id: 3\nevent: story.updated\n")
+        assert json.loads(chunk.split("data: ", 1)[1])["story_id"] == 1
+
+        assert await stream.__anext__() == ": keep-alive\n\n"
+        await stream.aclose()
+        assert hub.subscriber_count() == 0
+
+    previous = events.hub
+    try:
+        asyncio.run(run())
+    finally:
+        events.set_hub(previous)
+
+
+def test_slow_subscriber_gets_resync():
+    hub = events.InProcessEventHub(queue_size=2)
+
+    async def run():
+        subscription = hub.subscribe(1)
+        for n in range(5):
+            hub.publish(1, {"type": "story.updated", "change_seq": n, "story_id": n})
+        await asyncio.sleep(0)
+        received = [await subscription.get()]
+        while not subscription.queue.empty():
+            received.append(subscription.queue.get_nowait())
+        return received
+
+    received = asyncio.run(run())
+    assert events.RESYNC_EVENT in received
+    assert len(received) <= 2
+
+
+def test_stream_requires_membership(db_engine, db_session, project):
+    outsider = User(name="out", email="out@example.com", password_hash="x", global_role=GlobalRole.USER)
+    db_session.add(outsider)
+    db_session.commit()
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    outsider_id = outsider.id
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_deps.get_current_user] = lambda: factory().get(User, outsider_id)
+    try:
+        client = TestClient(app)
+        assert client.get(f"/projects/{project}/events").status_code == 403
+        assert client.get("/projects/9999/events").status_code == 404
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(auth_deps.get_current_user, None)
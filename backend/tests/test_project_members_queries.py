@@ -0,0 +1,56 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event
+
+from app.modules.auth.models import ProjectMember, RoleType, User
+from app.modules.project import crud as project_crud
+from app.modules.project.models import Project
+
+
+@contextmanager
+def count_queries(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.fixture
+def project_with_members(db_session):
+    project = Project(project_name="Big Team", project_prefix="BT", increment_number=1)
+    db_session.add(project)
+    db_session.flush()
+    for i in range(50):
+        user = User(name=f"user{i}", email=f"user{i}@example.com", password_hash="x")
+        db_session.add(user)
+        db_session.flush()
+        db_session.add(ProjectMember(project_id=project.id, user_id=user.id, role=RoleType.DEVELOPER))
+    db_session.commit()
+    project_id = project.id
+    db_session.expunge_all()
+    return project_id
+
+
+def test_get_project_members_is_single_query(db_engine, db_session, project_with_members):
+    with count_queries(db_engine) as statements:
+        members = project_crud.get_project_members(db_session, project_with_members)
+        names = [m.user.name for m in members]
+
+    assert len(names) == 50
+    assert len(statements) == 1
+
+
+def test_get_project_with_members_query_count_is_constant(db_engine, db_session, project_with_members):
+    with count_queries(db_engine) as statements:
+        project = project_crud.get_project_with_members(db_session, project_with_members)
+        emails = {m.user.email for m in project.members}
+
+    assert len(emails) == 50
+    assert len(statements) == 3
@@ -0,0 +1,55 @@
+import pytest
+from sqlalchemy import event
+
+from app.modules.project.models import Project
+from app.modules.reports import crud as reports_crud
+from app.modules.user_story.models import UserStory
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(project_name="Reports", project_prefix="RP")
+    other = Project(project_name="Other", project_prefix="OT")
+    db_session.add_all([project, other])
+    db_session.flush()
+    specs = [
+        ("done", "story", "alice", "1"),
+        ("done", "bug", "alice", "1"),
+        ("in_progress", "story", "bob", "2"),
+        ("backlog", "epic", "bob", ""),
+        ("todo", "task", "carol", "2"),
+    ]
+    for n, (status, issue_type, assignee, sprint) in enumerate(specs):
+        db_session.add(UserStory(
+            project_id=project.id, release_number="R1", sprint_number=sprint, story_code=f"RP-{n}",
+            assignee=assignee, reviewer="r", title=f"t{n}", description="d", status=status, issue_type=issue_type,
+        ))
+    db_session.add(UserStory(
+        project_id=other.id, release_number="R1", sprint_number="9", story_code="OT-1",
+        assignee="zed", reviewer="r", title="x", description="d", status="done", issue_type="story",
+    ))
+    db_session.commit()
+    return project.id
+
+
+def test_overview_breakdowns_in_one_query(db_engine, db_session, project):
+    statements = []
+    listener = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(db_engine, "before_cursor_execute", listener)
+    try:
+        overview = reports_crud.get_project_overview(db_session, project)
+    finally:
+        event.remove(db_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+    assert (overview["total_issues"], overview["done"], overview["in_progress"], overview["backlog"]) == (5, 2, 1, 1)
+    assert {r["status"]: r["count"] for r in overview["by_status"]} == {"done": 2, "in_progress": 1, "backlog": 1, "todo": 1}
+    assert {r["type"]: r["count"] for r in overview["by_type"]} == {"story": 2, "bug": 1, "epic": 1, "task": 1}
+    assert {r["assignee"]: r["count"] for r in overview["by_assignee"]} == {"alice": 2, "bob": 2, "carol": 1}
+    assert overview["by_sprint"] == [{"sprint": "", "count": 1}, {"sprint": "1", "count": 2}, {"sprint": "2", "count": 2}]
+
+
+def test_summary_matches_overview(db_session, project):
+    summary = reports_crud.get_project_summary(db_session, project)
+    assert summary == {"total_issues": 5, "done": 2, "in_progress": 1, "backlog": 1}
+    assert reports_crud.get_project_summary(db_session, 999)["total_issues"] == 0
@@ -0,0 +1,59 @@
+import pytest
+from sqlalchemy import event
+
+from app.modules.auth import crud as auth_crud, dependencies as auth_deps
+from app.modules.auth.cache import role_cache
+from app.modules.auth.models import GlobalRole, ProjectMember, RoleType, User
+from app.modules.project.models import Project
+
+
+@pytest.fixture(autouse=True)
+def clear_role_cache():
+    role_cache.invalidate()
+    yield
+    role_cache.invalidate()
+
+
+@pytest.fixture
+def member(db_session):
+    projects = [Project(project_name=f"P{i}", project_prefix=f"P{i}", increment_number=1) for i in range(3)]
+    user = User(name="dev", email="dev@example.com", password_hash="x", global_role=GlobalRole.USER)
+    db_session.add_all(projects + [user])
+    db_session.flush()
+    db_session.add(ProjectMember(project_id=projects[0].id, user_id=user.id, role=RoleType.DEVELOPER))
+    db_session.add(ProjectMember(project_id=projects[1].id, user_id=user.id, role=RoleType.VIEWER))
+    db_session.commit()
+    return user, projects
+
+
+def test_roles_resolved_once_per_request(db_engine, db_session, member):
+    user, projects = member
+    p0, p1, p2 = [p.id for p in projects]
+    db_session.refresh(user)
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db_engine, "before_cursor_execute", listener)
+    try:
+        for _ in range(5):
+            assert auth_deps.get_current_user_role(p0, db_session, user) == RoleType.DEVELOPER
+            assert auth_deps.get_current_user_role(p1, db_session, user) == RoleType.VIEWER
+            assert auth_deps.get_current_user_role(p2, db_session, user) is None
+    finally:
+        event.remove(db_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+
+
+def test_membership_writes_invalidate_process_cache(db_session, member):
+    user, projects = member
+    assert role_cache.get(user.id) is None
+    auth_deps.get_project_roles(db_session, user)
+    assert role_cache.get(user.id) == {projects[0].id: RoleType.DEVELOPER, projects[1].id: RoleType.VIEWER}
+
+    auth_crud.assign_role(db_session, user.id, projects[2].id, RoleType.TESTER)
+    assert role_cache.get(user.id) is None
+    assert auth_crud.get_user_roles(db_session, user.id)[projects[2].id] == RoleType.TESTER
+
+    auth_deps.get_project_roles(db_session, db_session.get(User, user.id))
+    auth_crud.remove_project_member(db_session, user.id, projects[0].id)
+    assert role_cache.get(user.id) is None
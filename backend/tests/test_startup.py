@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app import bootstrap as app_bootstrap
+from app.modules.auth import models as auth_models
+from app.modules.workflow import crud as workflow_crud, models as workflow_models
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Importing the app must not touch the database; budget covers interpreter + FastAPI import
+IMPORT_BUDGET_SECONDS = 5.0
+
+IMPORT_PROBE = """
+import time
+start = time.perf_counter()
+from sqlalchemy import event
+from app.database import engine
+connections = []
+event.listen(engine, "connect", lambda *args: connections.append(1))
+import app.main
+print(len(connections), time.perf_counter() - start)
+"""
+
+
+def test_app_import_is_cheap_and_does_not_connect():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_PROBE],
+        cwd=BACKEND_DIR, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    connections, elapsed = result.stdout.split()[-2:]
+
+    assert int(connections) == 0
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
+
+
+def test_bootstrap_is_idempotent_and_cheap_when_applied():
+    engine = create_engine("sqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    try:
+        app_bootstrap.bootstrap(engine)
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            app_bootstrap.bootstrap(engine)
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+        # Only the seed marker and admin lookups; create_all itself only inspects tables
+        assert len([s for s in statements if s.lstrip().upper().startswith("SELECT")]) == 2
+        assert not [s for s in statements if s.lstrip().upper().startswith(("INSERT", "UPDATE", "CREATE"))]
+
+        with Session(engine) as db:
+            assert db.query(auth_models.User).filter(auth_models.User.email == app_bootstrap.SUPER_ADMIN_EMAIL).count() == 1
+            assert db.query(workflow_models.WorkflowTransition).count() == len(workflow_crud.DEFAULT_TRANSITIONS)
+    finally:
+        engine.dispose()
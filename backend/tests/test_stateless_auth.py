@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from jose import jwt
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.config import SECRET_KEY, ALGORITHM, STATELESS_AUTH_MAX_TOKEN_LIFETIME_MINUTES
+from app.database import get_db
+from app.modules.auth import crud as auth_crud, dependencies as auth_deps, security
+from app.modules.auth.cache import revocations
+from app.modules.auth.models import GlobalRole, PreferredRole, User
+
+
+@pytest.fixture
+def user(db_session):
+    user = User(
+        name="dev",
+        email="dev@example.com",
+        password_hash="x",
+        is_active=True,
+        global_role=GlobalRole.USER,
+        preferred_role=PreferredRole.DEVELOPER,
+    )
+    db_session.add(user)
+    db_session.commit()
+    return user
+
+
+@pytest.fixture
+def stateless(monkeypatch):
+    monkeypatch.setattr(auth_deps, "STATELESS_AUTH_ENABLED", True)
+    monkeypatch.setattr(security, "STATELESS_AUTH_ENABLED", True)
+    revocations.refresh([])
+    yield
+    revocations.refresh([])
+
+
+def make_token(user, minutes=5):
+    return security.create_access_token(security.user_token_claims(user), expires_delta=timedelta(minutes=minutes))
+
+
+def test_short_lived_token_skips_user_lookup(db_session, user, stateless):
+    token = make_token(user)
+    principal = auth_deps.get_current_user(token, db_session)
+
+    assert isinstance(principal, auth_deps.TokenPrincipal)
+    assert (principal.id, principal.name, principal.global_role) == (user.id, "dev", GlobalRole.USER)
+    assert principal.preferred_role == PreferredRole.DEVELOPER
+
+
+def test_long_lived_token_uses_database(db_session, user, stateless):
+    token = make_token(user, minutes=120)
+    assert isinstance(auth_deps.get_current_user(token, db_session), User)
+
+
+def test_token_without_claims_uses_database(db_session, user, stateless):
+    token = security.create_access_token({"sub": str(user.id)}, expires_delta=timedelta(minutes=5))
+    assert isinstance(auth_deps.get_current_user(token, db_session), User)
+
+
+def test_deactivation_seen_after_refresh(db_session, user, stateless):
+    token = make_token(user)
+    user.is_active = False
+    db_session.commit()
+
+    # Simulate the periodic reload done by each worker
+    revocations.refresh(auth_crud.get_inactive_user_ids(db_session))
+    with pytest.raises(HTTPException) as exc:
+        auth_deps.get_current_user(token, db_session)
+    assert exc.value.status_code == 400
+
+
+def test_disabled_by_default(db_session, user):
+    token = make_token(user)
+    assert isinstance(auth_deps.get_current_user(token, db_session), User)
+    assert jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])["name"] == "dev"
+
+
+def test_login_token_uses_fast_path(db_engine, db_session, stateless, monkeypatch):
+    monkeypatch.setattr(security, "BCRYPT_ROUNDS", 4)
+    db_session.add(User(
+        name="dev", email="dev@example.com", password_hash=security.get_password_hash("Password123!"),
+        is_active=True, global_role=GlobalRole.USER,
+    ))
+    db_session.commit()
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    try:
+        client = TestClient(app)
+        login = client.post("/auth/login", data={"username": "dev@example.com", "password": "Password123!"})
+        assert login.status_code == 200
+        token = login.json()["access_token"]
+        claims = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        assert claims["exp"] - claims["iat"] <= STATELESS_AUTH_MAX_TOKEN_LIFETIME_MINUTES * 60
+
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db_engine, "before_cursor_execute", listener)
+        try:
+            me = client.get("/auth/me", headers={"Authorization": f"Bearer {token}"})
+        finally:
+            event.remove(db_engine, "before_cursor_execute", listener)
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+
+    assert me.status_code == 200
+    assert me.json()["email"] == "dev@example.com"
+    assert not any("from users" in statement.lower() for statement in statements)
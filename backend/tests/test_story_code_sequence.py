@@ -0,0 +1,113 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.models import GlobalRole, User
+from app.modules.project import router as project_router
+from app.modules.project.models import Project
+from app.modules.user_story import crud as story_crud, schemas
+
+
+@pytest.fixture
+def project(db_session):
+    project = Project(project_name="Banking", project_prefix="BA")
+    db_session.add(project)
+    db_session.commit()
+    return project
+
+
+def make_epic(project_id, title):
+    return schemas.UserStoryCreate(
+        project_id=project_id,
+        release_number="R1",
+        assignee="alice",
+        reviewer="bob",
+        title=title,
+        description="d",
+        status="todo",
+        issue_type="epic",
+    )
+
+
+def test_codes_come_from_project_sequence(db_session, project):
+    codes = []
+    for i in range(3):
+        story = story_crud.create_user_story(db_session, make_epic(project.id, f"Epic {i}"), None, user_id=1)
+        codes.append(story.story_code)
+    db_session.commit()
+
+    assert codes == ["BA-0001", "BA-0002", "BA-0003"]
+    db_session.refresh(project)
+    assert project.increment_number == 4
+
+
+def test_block_allocation_is_contiguous(db_session, project):
+    first, prefix, _ = story_crud.allocate_story_numbers(db_session, project.id, count=10)
+    second, _, _ = story_crud.allocate_story_numbers(db_session, project.id, count=1)
+
+    assert (first, prefix) == (1, "BA")
+    assert second == 11
+
+
+def test_sequence_ignores_existing_codes(db_session, project):
+    # Codes no longer depend on parsing the last story's suffix
+    odd = story_crud.create_user_story(db_session, make_epic(project.id, "A"), None, user_id=1)
+    odd.story_code = "LEGACY"
+    db_session.commit()
+
+    b = story_crud.create_user_story(db_session, make_epic(project.id, "B"), None, user_id=1)
+    assert b.story_code == "BA-0002"
+
+
+def test_unknown_project(db_session):
+    with pytest.raises(ValueError):
+        story_crud.generate_story_code(db_session, 999)
+
+
+def test_upload_is_copied_before_the_project_row_is_locked(db_engine, db_session, project, tmp_path, monkeypatch):
+    admin = User(name="admin", email="admin@example.com", password_hash="x", global_role=GlobalRole.ADMIN)
+    db_session.add(admin)
+    db_session.commit()
+    admin_id = admin.id
+    monkeypatch.setattr(project_router, "UPLOAD_BASE_DIR", str(tmp_path))
+
+    order = []
+    copyfileobj = project_router.shutil.copyfileobj
+    monkeypatch.setattr(project_router.shutil, "copyfileobj", lambda *args: (order.append("copy"), copyfileobj(*args)))
+    # Title resolution takes the project row lock (SELECT ... FOR UPDATE)
+    resolve_unique_titles = story_crud.resolve_unique_titles
+    monkeypatch.setattr(story_crud, "resolve_unique_titles", lambda *args: (order.append("lock"), resolve_unique_titles(*args))[1])
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_deps.get_current_user] = lambda: factory().get(User, admin_id)
+    try:
+        response = TestClient(app).post(
+            f"/projects/{project.id}/issues",
+            data=dict(release_number="R1", assignee="a", reviewer="b", title="Epic", description="d", status="todo", issue_type="epic"),
+            files={"support_doc": ("spec.txt", b"attached", "text/plain")},
+        )
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(auth_deps.get_current_user, None)
+
+    assert response.status_code == 200
+    assert response.json()["support_doc"] == "spec.txt"
+    assert order == ["copy", "lock"]
+    story_folder = tmp_path / str(response.json()["id"])
+    assert (story_folder / "spec.txt").read_bytes() == b"attached"
+    # The staging file was moved, not left behind
+    assert sorted(os.listdir(tmp_path)) == [str(response.json()["id"])]
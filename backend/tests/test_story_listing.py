@@ -0,0 +1,77 @@
+import pytest
+
+from app.pagination import decode_cursor, encode_cursor
+from app.modules.project.models import Project
+from app.modules.user_story import crud as story_crud
+from app.modules.user_story.models import UserStory
+
+
+def make_story(project_id, n, **overrides):
+    data = dict(
+        project_id=project_id,
+        release_number="R1",
+        sprint_number="1",
+        story_code=f"P{project_id}-{n:04d}",
+        assignee="alice",
+        reviewer="bob",
+        title=f"Story {n}",
+        description="long description " * 10,
+        status="todo",
+        issue_type="story",
+    )
+    data.update(overrides)
+    return UserStory(**data)
+
+
+@pytest.fixture
+def seeded(db_session):
+    p1 = Project(project_name="One", project_prefix="ONE", increment_number=1)
+    p2 = Project(project_name="Two", project_prefix="TWO", increment_number=1)
+    db_session.add_all([p1, p2])
+    db_session.flush()
+    for n in range(1, 8):
+        db_session.add(make_story(p1.id, n, status="done" if n % 2 else "todo"))
+    db_session.add(make_story(p2.id, 1, assignee="carol"))
+    db_session.commit()
+    return p1, p2
+
+
+def test_cursor_roundtrip():
+    assert decode_cursor(encode_cursor(42)) == [42]
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor!")
+
+
+def test_keyset_pages_cover_all_rows_once(db_session, seeded):
+    seen = []
+    after_id = None
+    while True:
+        rows, next_id = story_crud.list_user_stories(
+            db_session, fields=["id", "title"], limit=3, after_id=after_id
+        )
+        seen.extend(r.id for r in rows)
+        if next_id is None:
+            break
+        after_id = next_id
+
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen)) == 8
+
+
+def test_filters_and_projection(db_session, seeded):
+    p1, _ = seeded
+    rows, next_id = story_crud.list_user_stories(
+        db_session, fields=["story_code", "project_name"], limit=50, project_id=p1.id, status="todo"
+    )
+    assert next_id is None
+    assert len(rows) == 3
+    assert set(rows[0]._fields) == {"id", "story_code", "project_name"}
+    assert all(r.project_name == "One" for r in rows)
+
+    rows, _ = story_crud.list_user_stories(db_session, fields=["id"], limit=50, assignee="carol")
+    assert len(rows) == 1
+
+
+def test_unknown_field_rejected(db_session, seeded):
+    with pytest.raises(ValueError):
+        story_crud.list_user_stories(db_session, fields=["password_hash"], limit=10)
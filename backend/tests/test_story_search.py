@@ -0,0 +1,64 @@
+import pytest
+
+from app.modules.project.models import Project
+from app.modules.user_story import crud as story_crud
+from app.modules.user_story.models import UserStory
+
+
+def make_story(project, n, title, description="details"):
+    return UserStory(
+        project_id=project.id,
+        release_number="R1",
+        sprint_number="1",
+        story_code=f"{project.project_prefix}-{n:04d}",
+        assignee="alice",
+        reviewer="bob",
+        title=title,
+        description=description,
+        status="todo",
+        issue_type="story",
+    )
+
+
+@pytest.fixture
+def projects(db_session):
+    ba = Project(project_name="Banking", project_prefix="BA", increment_number=1)
+    hr = Project(project_name="Hiring", project_prefix="HR", increment_number=1)
+    db_session.add_all([ba, hr])
+    db_session.flush()
+    db_session.add_all([
+        make_story(ba, 1, "Login page"),
+        make_story(ba, 2, "Fix login bug", "Users cannot authenticate"),
+        make_story(ba, 12, "Payments"),
+        make_story(hr, 1, "Login for recruiters"),
+    ])
+    db_session.commit()
+    return ba, hr
+
+
+def test_story_code_prefix_ranks_first(db_session, projects):
+    ba, _ = projects
+    results = story_crud.search_user_stories(db_session, "BA-001", [ba.id], limit=10)
+    assert results[0].story_code == "BA-0012"
+
+    results = story_crud.search_user_stories(db_session, "ba-000", [ba.id], limit=10)
+    assert [r.story_code for r in results][:2] == ["BA-0001", "BA-0002"]
+
+
+def test_text_search_is_scoped_to_projects(db_session, projects):
+    ba, hr = projects
+    results = story_crud.search_user_stories(db_session, "login", [ba.id], limit=10)
+    assert {r.project_name for r in results} == {"Banking"}
+    assert len(results) == 2
+
+    results = story_crud.search_user_stories(db_session, "login", None, limit=10)
+    assert len(results) == 3
+
+    assert story_crud.search_user_stories(db_session, "login", [], limit=10) == []
+
+
+def test_search_matches_description_and_respects_limit(db_session, projects):
+    results = story_crud.search_user_stories(db_session, "authenticate", None, limit=10)
+    assert [r.title for r in results] == ["Fix login bug"]
+
+    assert len(story_crud.search_user_stories(db_session, "login", None, limit=1)) == 1
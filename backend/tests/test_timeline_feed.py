@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from app.database import get_db
+from app.modules.auth import dependencies as auth_deps
+from app.modules.auth.models import GlobalRole, User
+from app.modules.project.models import Project
+from app.modules.reports import crud as reports_crud
+from app.modules.reports.models import TimelineEvent
+from app.modules.user_story import crud as story_crud, schemas
+from app.pagination import encode_cursor
+
+WINDOW_START = datetime(2000, 1, 1)
+
+
+def epic(project_id, title):
+    return schemas.UserStoryCreate(
+        project_id=project_id, release_number="R1", assignee="a", reviewer="b",
+        title=title, description="d", status="todo", issue_type="epic",
+    )
+
+
+@pytest.fixture
+def projects(db_session):
+    first = Project(project_name="One", project_prefix="ON")
+    second = Project(project_name="Two", project_prefix="TW")
+    db_session.add_all([first, second])
+    db_session.commit()
+
+    for n in range(3):
+        for project in (first, second):
+            story = story_crud.create_user_story(db_session, epic(project.id, f"{project.project_prefix}{n}"), None, user_id=1)
+            db_session.commit()
+            story_crud.update_user_story_status(db_session, story.id, "in_progress", user_id=1)
+    # Distinct, increasing timestamps in insertion order
+    for offset, row in enumerate(db_session.query(TimelineEvent).order_by(TimelineEvent.id)):
+        row.created_at = datetime(2024, 1, 1) + timedelta(minutes=offset)
+    db_session.commit()
+    return first.id, second.id
+
+
+def test_writes_append_one_event_per_change(db_session, projects):
+    rows = db_session.query(TimelineEvent).order_by(TimelineEvent.id).all()
+    assert [r.event_type for r in rows[:2]] == ["created", "updated"]
+    assert rows[1].description == "Status: todo → in_progress"
+    assert len(rows) == 12
+
+
+def test_pages_merge_projects_newest_first(db_session, projects):
+    seen, before = [], None
+    while True:
+        rows, before = reports_crud.get_timeline_page(db_session, list(projects), WINDOW_START, 5, before=before)
+        seen.extend(r.id for r in rows)
+        if before is None:
+            break
+    assert seen == sorted(seen, reverse=True) and len(seen) == 12
+
+    only_first, _ = reports_crud.get_timeline_page(db_session, [projects[0]], WINDOW_START, 100)
+    assert {r.project_id for r in only_first} == {projects[0]} and len(only_first) == 6
+
+
+def test_rebuild_matches_live_feed(db_session, projects):
+    live = sorted((r.story_id, r.event_type, r.description) for r in db_session.query(TimelineEvent))
+    reports_crud.rebuild_event_feed(db_session)
+    rebuilt = sorted((r.story_id, r.event_type, r.description) for r in db_session.query(TimelineEvent))
+    assert rebuilt == live
+
+
+def test_timeline_endpoint_reads_one_page(db_engine, db_session, projects):
+    admin = User(name="admin", email="admin@example.com", password_hash="x", global_role=GlobalRole.ADMIN)
+    db_session.add(admin)
+    db_session.commit()
+
+    from app.main import app
+    factory = sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
+
+    def override_get_db():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    admin_id = admin.id
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_deps.get_current_user] = lambda: factory().get(User, admin_id)
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    try:
+        client = TestClient(app)
+        params = {"project_id": projects[1], "limit": 4, "days": 100000}
+        event.listen(db_engine, "before_cursor_execute", listener)
+        first = client.get("/reports/timeline", params=params)
+        event.remove(db_engine, "before_cursor_execute", listener)
+
+        body = first.json()
+        assert [e["title"] for e in body] == ["TW2", "TW2", "TW1", "TW1"]
+        assert body[0]["type"] == "updated" and body[1]["description"] == "Issue created"
+        assert [s for s in statements if "user_story" in s] == []
+
+        rest = client.get("/reports/timeline", params={**params, "cursor": first.headers["x-next-cursor"]}).json()
+        assert [e["title"] for e in rest] == ["TW0", "TW0"]
+        assert client.get("/reports/timeline", params={**params, "cursor": encode_cursor(1, 2)}).status_code == 400
+    finally:
+        app.dependency_overrides.pop(get_db, None)
+        app.dependency_overrides.pop(auth_deps.get_current_user, None)
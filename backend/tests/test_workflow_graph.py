@@ -0,0 +1,51 @@
+import pytest
+from sqlalchemy import event
+
+from app.modules.workflow import crud as workflow_crud
+from app.modules.workflow.graph import transition_graph
+from app.modules.user_story.schemas import StoryStatus
+
+
+@pytest.fixture(autouse=True)
+def fresh_graph():
+    transition_graph.invalidate()
+    yield
+    transition_graph.invalidate()
+
+
+@pytest.fixture
+def seeded(db_session):
+    workflow_crud.seed_workflow_transitions(db_session)
+    return db_session
+
+
+def test_transition_checks_hit_memory_after_first_load(db_engine, seeded):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(db_engine, "before_cursor_execute", listener)
+    try:
+        for _ in range(50):
+            assert workflow_crud.is_transition_valid(seeded, "todo", "in_progress")
+            assert workflow_crud.is_transition_valid(seeded, StoryStatus.done, StoryStatus.backlog)
+            assert not workflow_crud.is_transition_valid(seeded, "todo", "archived")
+    finally:
+        event.remove(db_engine, "before_cursor_execute", listener)
+
+    assert len(statements) == 1
+
+
+def test_editing_a_transition_invalidates_graph(seeded):
+    assert workflow_crud.is_transition_valid(seeded, "done", "todo")
+
+    workflow_crud.set_transition_active(seeded, "done", "todo", False)
+    assert not workflow_crud.is_transition_valid(seeded, "done", "todo")
+    assert "todo" not in workflow_crud.get_transition_graph(seeded).next_statuses("done")
+
+    workflow_crud.set_transition_active(seeded, "done", "todo", True)
+    assert workflow_crud.is_transition_valid(seeded, "done", "todo")
+
+
+def test_next_statuses_in_workflow_order(seeded):
+    graph = workflow_crud.get_transition_graph(seeded)
+    assert graph.next_statuses("todo") == ["backlog", "in_progress", "testing", "done"]
+    assert graph.next_statuses("unknown") == []
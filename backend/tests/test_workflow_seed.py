@@ -0,0 +1,35 @@
+from sqlalchemy import event
+
+from app.modules.workflow import crud as workflow_crud, models as workflow_models
+
+
+def count_statements(engine, fn):
+    statements = []
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+    return statements
+
+
+def test_seed_is_one_lookup_once_applied(db_engine, db_session):
+    assert workflow_crud.seed_workflow_transitions(db_session)
+    assert db_session.query(workflow_models.WorkflowTransition).count() == len(workflow_crud.DEFAULT_TRANSITIONS)
+
+    statements = count_statements(db_engine, lambda: workflow_crud.seed_workflow_transitions(db_session))
+    assert len(statements) == 1
+    assert db_session.query(workflow_models.WorkflowTransition).count() == len(workflow_crud.DEFAULT_TRANSITIONS)
+
+
+def test_seed_keeps_existing_rows(db_session):
+    db_session.add(workflow_models.WorkflowTransition(from_status="done", to_status="todo", is_active=False))
+    db_session.commit()
+
+    workflow_crud.seed_workflow_transitions(db_session)
+
+    rows = db_session.query(workflow_models.WorkflowTransition).all()
+    assert len(rows) == len(workflow_crud.DEFAULT_TRANSITIONS)
+    disabled = [(r.from_status, r.to_status) for r in rows if not r.is_active]
+    assert disabled == [("done", "todo")]
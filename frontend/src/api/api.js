@@ -44,4 +44,96 @@ export const updateUserStoryStatus = (id, newStatus) => {
   return api.post(`/user-story/${id}/status`, { new_status: newStatus });
 };
 
+// One page of the /user-story listing; pass the returned nextCursor to load the next page.
+// Takes the same filters and `fields` list as fetchUserStories.
+export const fetchUserStoryPage = async (params = {}, cursor = null) => {
+  const query = { limit: 100, ...params };
+  if (Array.isArray(query.fields)) {
+    query.fields = query.fields.join(',');
+  }
+  const res = await api.get('/user-story', { params: cursor ? { ...query, cursor } : query });
+  return { stories: res.data, nextCursor: res.headers['x-next-cursor'] || null };
+};
+
+// Fetch issues from the paginated /user-story listing, following the X-Next-Cursor header
+// until every page is loaded. Pass filters (project_id, assignee, issue_type...) and an
+// optional `fields` list so the server only ships the columns the caller needs.
+// Only for narrowly filtered lists; unbounded lists should page with fetchUserStoryPage.
+export const fetchUserStories = async (params = {}) => {
+  const stories = [];
+  let cursor = null;
+  do {
+    const page = await fetchUserStoryPage({ ...params, limit: 500 }, cursor);
+    stories.push(...page.stories);
+    cursor = page.nextCursor;
+  } while (cursor);
+  return stories;
+};
+
+// One page of a story's activity history, newest first; pass the returned nextCursor to load older entries
+export const fetchStoryHistory = async (storyId, cursor) => {
+  const res = await api.get(`/user-story/${storyId}/history`, { params: cursor ? { cursor } : {} });
+  return { activities: res.data, nextCursor: res.headers['x-next-cursor'] || null };
+};
+
+// Kanban board sliced by column: first `perColumn` cards per status, totals and cursors
+export const fetchBoardColumns = async (projectId, params = {}) => {
+  const res = await api.get(`/projects/${projectId}/board/columns`, { params });
+  return res.data;
+};
+
+// Next cards of one board column, appended client-side without refetching the board
+export const fetchBoardColumnPage = async (projectId, status, cursor, params = {}) => {
+  const res = await api.get(`/projects/${projectId}/board/columns/${status}`, { params: { ...params, cursor } });
+  return res.data;
+};
+
+// Issues created, updated or deleted since `since` (cursor from the previous call; omit for a snapshot)
+export const fetchIssueChanges = async (projectId, since, limit) => {
+  const res = await api.get(`/projects/${projectId}/issues/changes`, { params: { since, limit } });
+  return res.data;
+};
+
+// Live project events (SSE). EventSource cannot send the Authorization header, so the
+// stream is read with fetch. onEvent receives parsed events; a dropped connection is
+// reopened after a short delay and reported as a resync event, since events may have
+// been missed meanwhile. Returns a function that closes the stream.
+export const subscribeProjectEvents = (projectId, onEvent, retryMs = 5000) => {
+  const controller = new AbortController();
+  const token = localStorage.getItem('token');
+
+  const connect = async () => {
+    const res = await fetch(`/api/projects/${projectId}/events`, {
+      headers: token ? { Authorization: `Bearer ${token}` } : {},
+      signal: controller.signal,
+    });
+    if (!res.ok) return false; // no access: do not retry
+    const reader = res.body.pipeThrough(new TextDecoderStream()).getReader();
+    let buffer = '';
+    for (;;) {
+      const { value, done } = await reader.read();
+      if (done) return true;
+      buffer += value;
+      const frames = buffer.split('\n\n');
+      buffer = frames.pop();
+      frames.forEach(frame => {
+        const data = frame.split('\n').find(line => line.startsWith('data: '));
+        if (data) onEvent(JSON.parse(data.slice(6)));
+      });
+    }
+  };
+
+  (async () => {
+    for (;;) {
+      const retry = await connect().catch(() => !controller.signal.aborted);
+      if (!retry || controller.signal.aborted) return;
+      await new Promise(resolve => setTimeout(resolve, retryMs));
+      if (controller.signal.aborted) return;
+      onEvent({ type: 'resync' });
+    }
+  })();
+
+  return () => controller.abort();
+};
+
 export default api;
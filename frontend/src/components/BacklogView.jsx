@@ -15,9 +15,13 @@ const BacklogView = () => {
         loading,
         currentProject,
         refreshIssues,
+        requireIssues,
         canChangeStatus
     } = useProject();
 
+    // The project context only loads the full issue list while a view needs it
+    useEffect(() => requireIssues(), [requireIssues]);
+
 
 
     // Safe derivation
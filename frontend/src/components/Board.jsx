@@ -1,4 +1,4 @@
-import React, { useEffect, useState } from 'react';
+import React, { useCallback, useEffect, useMemo, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import { useProject } from '../context/ProjectContext';
 import { useAuth } from '../context/AuthContext';
@@ -19,7 +19,7 @@ import {
   arrayMove,
 } from '@dnd-kit/sortable';
 
-import api, { toFormData, updateUserStoryStatus } from '../api/api';
+import api, { fetchBoardColumnPage, fetchBoardColumns, fetchUserStories, toFormData, updateUserStoryStatus } from '../api/api';
 import TaskCard from './TaskCard';
 import CreateStoryModal from './modals/CreateStoryModal';
 import ProjectHeader from './ProjectHeader';
@@ -35,8 +35,11 @@ const COLUMNS = {
   [STORY_STATUS.DONE]: { title: 'DONE', id: STORY_STATUS.DONE, color: 'bg-green-500', bg: 'bg-green-50' },
 };
 
+// Cards loaded per column at a time; the rest are fetched with "Load more"
+const CARDS_PER_PAGE = 25;
+
 // Column component: Represents single status column with droppable area for tasks
-const Column = ({ title, id, tasks, onClickTask, color, bg, onCreateIssue, canCreateIssue }) => {
+const Column = ({ title, id, tasks, count, hasMore, loadingMore, onLoadMore, onClickTask, color, bg, onCreateIssue, canCreateIssue }) => {
   const { setNodeRef, isOver } = useDroppable({
     id: id,
   });
@@ -49,7 +52,7 @@ const Column = ({ title, id, tasks, onClickTask, color, bg, onCreateIssue, canCr
           {title}
         </div>
         <span className="bg-white/80 text-gray-600 px-2 py-0.5 rounded-full text-[10px] shadow-sm">
-          {tasks.length}
+          {count}
         </span>
       </div>
 
@@ -64,6 +67,16 @@ const Column = ({ title, id, tasks, onClickTask, color, bg, onCreateIssue, canCr
           ))}
         </SortableContext>
 
+        {hasMore && (
+          <button
+            onClick={onLoadMore}
+            disabled={loadingMore}
+            className="w-full mt-1 py-1.5 text-xs font-medium text-blue-600 hover:bg-blue-50 rounded disabled:text-gray-400"
+          >
+            {loadingMore ? 'Loading...' : `Load more (${count - tasks.length})`}
+          </button>
+        )}
+
         {tasks.length === 0 && (
           <div className="h-full w-full flex flex-col items-center justify-center text-gray-400 text-sm italic min-h-[100px] border-2 border-dashed border-gray-100 rounded-lg">
             {id === 'todo' && canCreateIssue ? (
@@ -91,8 +104,8 @@ const Board = () => {
   const navigate = useNavigate();
   const { projectId } = useParams();
   const { openCreateIssueModal } = useApp();
-  // Context Data
-  const { issues: tasks, loading, error, refreshIssues, currentProject, canCreateIssue, canChangeStatus } = useProject();
+  // Context Data (project header and permissions; the board loads its own cards)
+  const { error, currentProject, canCreateIssue, canChangeStatus } = useProject();
 
   const [activeTask, setActiveTask] = useState(null);
 
@@ -108,38 +121,108 @@ const Board = () => {
     })
   );
 
-  // Listen for global story creation events to trigger refresh
-  useEffect(() => {
-    const handleStoryCreated = () => refreshIssues();
-    window.addEventListener('story-created', handleStoryCreated);
-    return () => window.removeEventListener('story-created', handleStoryCreated);
-  }, [refreshIssues]);
-
   const [assigneeFilter, setAssigneeFilter] = useState('');
   const [sprintFilter, setSprintFilter] = useState('');
   const [typeFilter, setTypeFilter] = useState('');
 
-  // Separate Epics and Board Tasks
-  const rawEpics = tasks.filter(t => t.issue_type === 'epic');
-  const boardTasks = tasks.filter(t => t.issue_type !== 'epic'); // Stories, Tasks, Bugs, Subtasks
+  // Board columns are loaded a page at a time: { [status]: { count, cards, next_cursor } }
+  const [columns, setColumns] = useState(null);
+  const [sprints, setSprints] = useState([]);
+  const [assignees, setAssignees] = useState([]);
+  const [rawEpics, setRawEpics] = useState([]);
+  const [loadingMore, setLoadingMore] = useState(null);
+
+  // Only issues planned into a sprint belong on the board; epics are shown separately.
+  // Filters are applied by the server so column counts stay exact.
+  const columnParams = useMemo(() => ({
+    in_sprint: true,
+    assignee: assigneeFilter || undefined,
+    sprint_number: sprintFilter || undefined,
+    issue_type: typeFilter || undefined,
+  }), [assigneeFilter, sprintFilter, typeFilter]);
+
+  const loadBoard = useCallback(async () => {
+    if (!projectId) return;
+    // Epics never sit in the columns, so an epic filter leaves them empty
+    if (typeFilter === 'epic') {
+      setColumns(Object.fromEntries(Object.keys(COLUMNS).map(status => [status, { count: 0, cards: [], next_cursor: null }])));
+      return;
+    }
+    try {
+      const data = await fetchBoardColumns(projectId, { ...columnParams, per_column: CARDS_PER_PAGE, include_sprints: true });
+      setColumns(Object.fromEntries(data.columns.map(column => [column.status, column])));
+      setSprints(data.sprints || []);
+    } catch (error) {
+      console.error('Failed to load board columns', error);
+    }
+  }, [projectId, typeFilter, columnParams]);
+
+  const loadEpics = useCallback(async () => {
+    if (!projectId) return;
+    try {
+      setRawEpics(await fetchUserStories({
+        project_id: projectId,
+        issue_type: 'epic',
+        fields: ['id', 'story_code', 'title', 'status', 'issue_type', 'assignee', 'sprint_number'],
+      }));
+    } catch (error) {
+      console.error('Failed to load epics', error);
+    }
+  }, [projectId]);
 
-  const epics = rawEpics.filter(task => {
-    const matchesAssignee = assigneeFilter ? task.assignee === assigneeFilter : true;
-    const matchesSprint = sprintFilter ? task.sprint_number === sprintFilter : true;
-    const matchesType = typeFilter ? task.issue_type === typeFilter : true;
-    return matchesAssignee && matchesSprint && matchesType;
-  });
+  useEffect(() => {
+    loadBoard();
+  }, [loadBoard]);
 
-  const filteredBoardTasks = boardTasks.filter(task => {
-    // Validation: Must have a Sprint AND not be 'backlog' status
-    if (!task.sprint_number || task.status === 'backlog') return false;
+  useEffect(() => {
+    loadEpics();
+    if (!projectId) return;
+    api.get(`/projects/${projectId}/assignees`)
+      .then(res => setAssignees(res.data.map(a => a.value)))
+      .catch(error => console.warn('Could not fetch assignees', error));
+  }, [projectId, loadEpics]);
+
+  const refreshBoard = useCallback(() => {
+    loadBoard();
+    loadEpics();
+  }, [loadBoard, loadEpics]);
+
+  // Listen for global story creation / update events to trigger refresh
+  useEffect(() => {
+    window.addEventListener('story-created', refreshBoard);
+    window.addEventListener('story-updated', refreshBoard);
+    return () => {
+      window.removeEventListener('story-created', refreshBoard);
+      window.removeEventListener('story-updated', refreshBoard);
+    };
+  }, [refreshBoard]);
+
+  const loadMoreCards = async (status) => {
+    const column = columns[status];
+    setLoadingMore(status);
+    try {
+      const page = await fetchBoardColumnPage(projectId, status, column.next_cursor, { ...columnParams, limit: CARDS_PER_PAGE });
+      setColumns(prev => ({
+        ...prev,
+        [status]: { ...page, cards: [...prev[status].cards, ...page.cards] },
+      }));
+    } catch (error) {
+      console.error('Failed to load more cards', error);
+    } finally {
+      setLoadingMore(null);
+    }
+  };
 
+  const epics = rawEpics.filter(task => {
     const matchesAssignee = assigneeFilter ? task.assignee === assigneeFilter : true;
     const matchesSprint = sprintFilter ? task.sprint_number === sprintFilter : true;
     const matchesType = typeFilter ? task.issue_type === typeFilter : true;
     return matchesAssignee && matchesSprint && matchesType;
   });
 
+  // Every card currently loaded on the board
+  const tasks = columns ? Object.values(columns).flatMap(column => column.cards) : [];
+
   const handleDragStart = (event) => {
     const { active } = event;
     const task = tasks.find((t) => String(t.id) === active.id);
@@ -180,7 +263,7 @@ const Board = () => {
 
       try {
         await updateUserStoryStatus(task.id, newStatus);
-        refreshIssues();
+        loadBoard();
       } catch (error) {
         console.error('Failed to update task status', error);
         const message = error.response?.data?.detail || 'Failed to update status.';
@@ -204,10 +287,11 @@ const Board = () => {
   };
 
 
-  // Stats
-  const totalIssues = tasks.length;
-  const inProgress = tasks.filter(t => t.status === 'in_progress').length;
-  const testing = tasks.filter(t => t.status === 'testing').length;
+  // Stats (column totals from the server, not just the loaded cards)
+  const columnCount = (status) => (columns && columns[status] ? columns[status].count : 0);
+  const totalIssues = Object.keys(COLUMNS).reduce((sum, status) => sum + columnCount(status), 0);
+  const inProgress = columnCount(STORY_STATUS.IN_PROGRESS);
+  const testing = columnCount(STORY_STATUS.TESTING);
 
   const headerProjectName = projectId ? (projectName || 'Loading...') : 'All Projects';
 
@@ -229,7 +313,7 @@ const Board = () => {
     </div>
   );
 
-  if (loading && tasks.length === 0) return <div className="p-10 text-center text-gray-500">Loading board...</div>;
+  if (!columns) return <div className="p-10 text-center text-gray-500">Loading board...</div>;
 
 
   return (
@@ -241,7 +325,7 @@ const Board = () => {
         <div>
           {projectId && (
             <div className="flex items-center gap-3 text-xs font-medium text-gray-500">
-              <span>{filteredBoardTasks.length} issues</span>
+              <span>{totalIssues} issues</span>
               <span className="w-1 h-1 rounded-full bg-gray-300"></span>
               <span className="text-blue-600">{inProgress} in progress</span>
             </div>
@@ -256,7 +340,7 @@ const Board = () => {
             className="bg-gray-50 border border-gray-200 text-gray-700 py-1.5 px-3 rounded text-xs font-medium focus:outline-none focus:ring-1 focus:ring-blue-500"
           >
             <option value="">All Sprints</option>
-            {[...new Set(tasks.map(t => t.sprint_number).filter(Boolean))].map(s => <option key={s} value={s}>Sprint {s}</option>)}
+            {sprints.map(s => <option key={s} value={s}>Sprint {s}</option>)}
           </select>
 
           <select
@@ -265,7 +349,7 @@ const Board = () => {
             className="bg-gray-50 border border-gray-200 text-gray-700 py-1.5 px-3 rounded text-xs font-medium focus:outline-none focus:ring-1 focus:ring-blue-500"
           >
             <option value="">All Assignees</option>
-            {[...new Set(tasks.map(t => t.assignee).filter(Boolean))].map(a => <option key={a} value={a}>{a}</option>)}
+            {assignees.map(a => <option key={a} value={a}>{a}</option>)}
           </select>
 
           <select
@@ -316,7 +400,11 @@ const Board = () => {
                 title={col.title}
                 color={col.color}
                 bg={col.bg}
-                tasks={filteredBoardTasks.filter((t) => t.status === col.id)}
+                tasks={columns[col.id] ? columns[col.id].cards : []}
+                count={columnCount(col.id)}
+                hasMore={Boolean(columns[col.id] && columns[col.id].next_cursor)}
+                loadingMore={loadingMore === col.id}
+                onLoadMore={() => loadMoreCards(col.id)}
                 onClickTask={handleTaskClick}
                 onCreateIssue={() => openCreateIssueModal(projectId)}
                 canCreateIssue={canCreateIssue}
@@ -6,51 +6,56 @@ const GlobalSearch = () => {
     const [query, setQuery] = useState('');
     const [results, setResults] = useState([]);
     const [isOpen, setIsOpen] = useState(false);
-    const [allData, setAllData] = useState({ projects: [], stories: [] });
+    const [projects, setProjects] = useState([]);
     const wrapperRef = useRef(null);
     const navigate = useNavigate();
 
-    // Fetch data for search (Simulated global index)
-    // In a real app, this would be a backend search endpoint.
-    // For now, we fetch all and filter client side as requested "Partial match...".
+    // Projects are few, so they are filtered client side; issues are searched on the server.
     useEffect(() => {
-        const fetchData = async () => {
+        const fetchProjects = async () => {
             try {
-                const [projectsRes, storiesRes] = await Promise.all([
-                    api.get('/project'),
-                    api.get('/user-story')
-                ]);
-                setAllData({
-                    projects: projectsRes.data,
-                    stories: storiesRes.data
-                });
+                const res = await api.get('/project');
+                setProjects(res.data);
             } catch (error) {
-                console.error("Search index build failed", error);
+                console.error("Failed to load projects for search", error);
             }
         };
-        fetchData(); // Simplification: fetching on mount. Ideally debounce or fetch on focus.
+        fetchProjects();
     }, []);
 
     useEffect(() => {
-        if (!query.trim()) {
+        const trimmed = query.trim();
+        if (!trimmed) {
             setResults([]);
             return;
         }
 
-        const lowerQuery = query.toLowerCase();
-        
-        const matchedProjects = allData.projects.filter(p => 
+        const lowerQuery = trimmed.toLowerCase();
+        const matchedProjects = projects.filter(p =>
             p.project_name.toLowerCase().includes(lowerQuery)
         ).map(p => ({ ...p, type: 'project' }));
 
-        const matchedStories = allData.stories.filter(s => 
-            s.title.toLowerCase().includes(lowerQuery) || 
-            s.story_code.toLowerCase().includes(lowerQuery)
-        ).map(s => ({ ...s, type: 'story' }));
+        // Debounce so we only hit the search endpoint once typing pauses
+        let cancelled = false;
+        const timer = setTimeout(async () => {
+            try {
+                const res = await api.get('/user-story/search', { params: { q: trimmed, limit: 20 } });
+                if (cancelled) return;
+                const matchedStories = res.data.map(s => ({ ...s, type: 'story' }));
+                setResults([...matchedProjects, ...matchedStories]);
+            } catch (error) {
+                if (cancelled) return;
+                console.error("Issue search failed", error);
+                setResults(matchedProjects);
+            }
+            setIsOpen(true);
+        }, 200);
 
-        setResults([...matchedProjects, ...matchedStories]);
-        setIsOpen(true);
-    }, [query, allData]);
+        return () => {
+            cancelled = true;
+            clearTimeout(timer);
+        };
+    }, [query, projects]);
 
     // Close on click outside
     useEffect(() => {
@@ -4,6 +4,7 @@ import ProjectSidebar from './ProjectSidebar';
 import ProjectHeader from '../ProjectHeader';
 import { useApp } from '../../context/AppContext';
 import { useProject } from '../../context/ProjectContext';
+import { subscribeProjectEvents } from '../../api/api';
 import Toast from '../Toast';
 
 const ProjectLayout = () => {
@@ -19,6 +20,22 @@ const ProjectLayout = () => {
         }
     }, [projectId, fetchProjectData]);
 
+    // Live updates: changes made by other users (or a resync request after a dropped
+    // connection) refresh the open view through the same 'story-updated' event as local
+    // edits; bursts such as imports are coalesced into one refresh
+    useEffect(() => {
+        if (!projectId) return undefined;
+        let timer = null;
+        const unsubscribe = subscribeProjectEvents(projectId, () => {
+            clearTimeout(timer);
+            timer = setTimeout(() => window.dispatchEvent(new Event('story-updated')), 300);
+        });
+        return () => {
+            clearTimeout(timer);
+            unsubscribe();
+        };
+    }, [projectId]);
+
     // Global Toast Listener
     useEffect(() => {
         const handleStoryCreated = () => {
@@ -1,5 +1,5 @@
 import React, { useState } from 'react';
-import api, { toFormData } from '../../api/api';
+import api, { toFormData, fetchUserStories } from '../../api/api';
 
 import { STATUS_OPTIONS, ISSUE_TYPE_OPTIONS } from '../../constants';
 
@@ -78,9 +78,10 @@ const CreateStoryModal = ({ isOpen, onClose, projectId, onStoryCreated }) => {
     if (isOpen && selectedProjectId) {
       const fetchParents = async () => {
         try {
-          const response = await api.get('/user-story');
-          // Filter for current project
-          const issues = response.data.filter(i => i.project_id === parseInt(selectedProjectId));
+          const issues = await fetchUserStories({
+            project_id: selectedProjectId,
+            fields: ['id', 'project_id', 'story_code', 'title', 'issue_type'],
+          });
           setParentIssues(issues);
         } catch (e) {
           console.error("Failed to fetch parent issues", e);
@@ -1,6 +1,6 @@
-import React, { createContext, useContext, useState, useEffect, useCallback } from 'react';
+import React, { createContext, useContext, useState, useEffect, useCallback, useRef } from 'react';
 import { useParams, useLocation } from 'react-router-dom';
-import api from '../api/api';
+import { fetchBoardColumns, fetchIssueChanges } from '../api/api';
 
 const ProjectContext = createContext();
 
@@ -13,25 +13,69 @@ export const ProjectProvider = ({ children }) => {
   
   const location = useLocation();
 
+  // The full issue list is only loaded while a view that lists every issue (the backlog)
+  // has asked for it through requireIssues; the board pages its columns on its own
+  const issuesRequested = useRef(false);
+  const loadedProjectId = useRef(null);
+  // Incremental sync cursor of the loaded issue list (null = take a fresh snapshot)
+  const issuesCursor = useRef(null);
+
+  // First call takes a snapshot of the project's issues; later calls only fetch what was
+  // created, updated or deleted since the stored cursor and merge it into the list
+  const loadIssues = useCallback(async (projectId) => {
+    setLoading(true);
+    try {
+      const fresh = issuesCursor.current === null;
+      const changed = [];
+      const deletedIds = new Set();
+      let since = issuesCursor.current;
+      let hasMore = true;
+      while (hasMore) {
+        const page = await fetchIssueChanges(projectId, since || undefined, 500);
+        changed.push(...page.changes);
+        page.deleted.forEach(tombstone => deletedIds.add(tombstone.id));
+        since = page.cursor;
+        hasMore = page.has_more;
+      }
+      if (loadedProjectId.current !== Number(projectId)) return; // project switched meanwhile
+      issuesCursor.current = since;
+
+      setIssues(prev => {
+        const byId = new Map((fresh ? [] : prev).map(issue => [issue.id, issue]));
+        changed.forEach(issue => byId.set(issue.id, issue));
+        deletedIds.forEach(id => byId.delete(id));
+        return [...byId.values()].sort((a, b) => a.id - b.id);
+      });
+    } catch (err) {
+      console.error("Failed to fetch project issues", err);
+    } finally {
+      setLoading(false);
+    }
+  }, []);
+
   const fetchProjectData = useCallback(async (projectId) => {
     if (!projectId) {
         setCurrentProject(null);
         setIssues([]);
         setUserRole(null);
+        loadedProjectId.current = null;
+        issuesCursor.current = null;
         return;
     }
 
     setLoading(true);
     setError(null);
     try {
-      // Use the Board Data endpoint which returns generic project structure + issues + role
-      // This is efficient and provides RBAC info.
-      const res = await api.get(`/projects/${projectId}/board`);
-      
-      const { project, issues: fetchedIssues } = res.data;
-      
+      // The sliced board returns the project header + the caller's role at constant cost
+      // (one card); the issue list itself is loaded only when requested
+      const { project } = await fetchBoardColumns(projectId, { per_column: 1, statuses: 'todo' });
+
       setCurrentProject(project);
-      setIssues(fetchedIssues);
+      if (loadedProjectId.current !== project.id) {
+          setIssues([]);
+          issuesCursor.current = null;
+      }
+      loadedProjectId.current = project.id;
       
       // Store Current User Role (Normalized to UPPERCASE)
       if (project.currentUserRole) {
@@ -56,10 +100,26 @@ export const ProjectProvider = ({ children }) => {
       setCurrentProject(null);
       setIssues([]);
       setUserRole(null);
+      loadedProjectId.current = null;
+      issuesCursor.current = null;
     } finally {
       setLoading(false);
     }
-  }, []);
+    if (issuesRequested.current && loadedProjectId.current) {
+      await loadIssues(loadedProjectId.current);
+    }
+  }, [loadIssues]);
+
+  // Called from a view's effect; returns the cleanup that stops loading the issue list
+  const requireIssues = useCallback(() => {
+    issuesRequested.current = true;
+    if (loadedProjectId.current) {
+      loadIssues(loadedProjectId.current);
+    }
+    return () => {
+      issuesRequested.current = false;
+    };
+  }, [loadIssues]);
 
   // Effect to sniff URL for projectId
   useEffect(() => {
@@ -76,6 +136,8 @@ export const ProjectProvider = ({ children }) => {
          if (currentProject) {
             setCurrentProject(null);
             setIssues([]);
+            loadedProjectId.current = null;
+            issuesCursor.current = null;
          }
      }
   }, [location.pathname, fetchProjectData]); // currentProject in dependency might cause loop if not careful
@@ -114,6 +176,7 @@ export const ProjectProvider = ({ children }) => {
       error,
       refreshIssues,
       fetchProjectData,
+      requireIssues,
       userRole,
       isAdmin,
       isScrumMaster, 
@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import api from '../api/api';
+import { fetchUserStories } from '../api/api';
 import SprintGroupedIssueList from '../components/SprintGroupedIssueList';
 import { useAuth } from '../context/AuthContext';
 import { STATUS_OPTIONS } from '../constants'; // Ensure this is imported
@@ -18,9 +18,8 @@ const AssignedToMePage = () => {
             if (!currentUser) return;
             
             try {
-                // Fetch all issues (API respects visibility)
-                const response = await api.get('/user-story');
-                const allIssues = response.data;
+                // Fetch only issues assigned to the current user (filtered server-side)
+                const allIssues = await fetchUserStories({ assignee: currentUser.name });
                 
                 // Filter Frontend: Assigned to Me
                 // Case-insensitive match just in case, though backend usually standardizes
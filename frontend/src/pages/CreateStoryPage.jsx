@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import api, { toFormData } from '../api/api';
+import api, { toFormData, fetchUserStories } from '../api/api';
 
 const CreateStoryPage = () => {
     const { projectId } = useParams();
@@ -48,12 +48,15 @@ const CreateStoryPage = () => {
                 const [projRes, assigneesRes, issuesRes] = await Promise.all([
                     api.get(`/project/${projectId}`),
                     api.get(`/projects/${projectId}/assignees`),
-                    api.get('/user-story')
+                    fetchUserStories({
+                        project_id: projectId,
+                        fields: ['id', 'project_id', 'story_code', 'title', 'issue_type'],
+                    })
                 ]);
                 setProject(projRes.data);
                 setAssignees(assigneesRes.data);
                 // Filter issues for this project to be potential parents
-                setParentIssues(issuesRes.data.filter(i => i.project_id === parseInt(projectId)));
+                setParentIssues(issuesRes);
             } catch (error) {
                 console.error("Failed to load project metadata", error);
             }
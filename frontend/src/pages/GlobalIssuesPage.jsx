@@ -1,47 +1,81 @@
-import React, { useEffect, useState } from 'react';
-import api from '../api/api';
+import React, { useCallback, useEffect, useRef, useState } from 'react';
+import { fetchUserStoryPage } from '../api/api';
 import SprintGroupedIssueList from '../components/SprintGroupedIssueList';
 import IssueFilters from '../components/IssueFilters';
 
 const GlobalIssuesPage = () => {
     const [tasks, setTasks] = useState([]);
     const [loading, setLoading] = useState(true);
+    const [loadingMore, setLoadingMore] = useState(false);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [knownAssignees, setKnownAssignees] = useState([]);
 
     const [assigneeFilter, setAssigneeFilter] = useState('');
     const [typeFilter, setTypeFilter] = useState('');
 
+    // Ignores pages that arrive after the filters have changed
+    const requestRef = useRef(0);
+
+    const filterParams = useCallback(() => {
+        const params = {};
+        if (assigneeFilter) params.assignee = assigneeFilter;
+        if (typeFilter) params.issue_type = typeFilter;
+        return params;
+    }, [assigneeFilter, typeFilter]);
+
+    const addAssignees = (stories) => {
+        setKnownAssignees(prev => [...new Set([...prev, ...stories.map(t => t.assignee).filter(Boolean)])]);
+    };
+
+    // Filters are applied by the server, so each change restarts from the first page
     useEffect(() => {
-        const fetchAllTasks = async () => {
+        const requestId = ++requestRef.current;
+        const fetchFirstPage = async () => {
+            setLoading(true);
             try {
-                const response = await api.get('/user-story');
-                setTasks(response.data);
+                const page = await fetchUserStoryPage(filterParams());
+                if (requestId !== requestRef.current) return;
+                setTasks(page.stories);
+                setNextCursor(page.nextCursor);
+                addAssignees(page.stories);
             } catch (error) {
                 console.error("Failed to fetch tasks", error);
             } finally {
-                setLoading(false);
+                if (requestId === requestRef.current) setLoading(false);
             }
         };
 
-        fetchAllTasks();
-    }, []);
+        fetchFirstPage();
+    }, [filterParams]);
 
-    // Derived filters
-    const uniqueAssignees = [...new Set(tasks.map(t => t.assignee).filter(Boolean))];
+    const loadMore = async () => {
+        if (!nextCursor || loadingMore) return;
+        const requestId = requestRef.current;
+        setLoadingMore(true);
+        try {
+            const page = await fetchUserStoryPage(filterParams(), nextCursor);
+            if (requestId !== requestRef.current) return;
+            setTasks(prev => [...prev, ...page.stories]);
+            setNextCursor(page.nextCursor);
+            addAssignees(page.stories);
+        } catch (error) {
+            console.error("Failed to fetch more tasks", error);
+        } finally {
+            setLoadingMore(false);
+        }
+    };
 
-    const filteredTasks = tasks.filter(task => {
-        const matchesAssignee = assigneeFilter ? task.assignee === assigneeFilter : true;
-        const matchesType = typeFilter ? task.issue_type === typeFilter : true;
-        return matchesAssignee && matchesType;
-    });
-
-    if (loading) return <div className="p-8 text-gray-500">Loading issues...</div>;
+    // Keep the selected assignee listed even before a page containing them is loaded
+    const uniqueAssignees = assigneeFilter && !knownAssignees.includes(assigneeFilter)
+        ? [...knownAssignees, assigneeFilter]
+        : knownAssignees;
 
     return (
         <div className="h-full bg-white flex flex-col">
              <div className="px-8 py-5 border-b border-gray-200 flex justify-between items-center bg-gray-50/50">
                 <h1 className="text-2xl font-bold text-gray-900">All Issues</h1>
-                
-                <IssueFilters 
+
+                <IssueFilters
                     assigneeFilter={assigneeFilter}
                     setAssigneeFilter={setAssigneeFilter}
                     typeFilter={typeFilter}
@@ -49,9 +83,26 @@ const GlobalIssuesPage = () => {
                     uniqueAssignees={uniqueAssignees}
                 />
              </div>
-             
+
              <div className="flex-1 overflow-auto p-8">
-                 <SprintGroupedIssueList issues={filteredTasks} showProjectColumn={true} />
+                 {loading ? (
+                     <div className="text-gray-500">Loading issues...</div>
+                 ) : (
+                     <>
+                         <SprintGroupedIssueList issues={tasks} showProjectColumn={true} />
+                         {nextCursor && (
+                             <div className="flex justify-center mt-6">
+                                 <button
+                                     onClick={loadMore}
+                                     disabled={loadingMore}
+                                     className="px-4 py-2 text-sm font-medium text-blue-600 border border-gray-300 rounded hover:bg-gray-50 disabled:text-gray-400"
+                                 >
+                                     {loadingMore ? 'Loading...' : 'Load more issues'}
+                                 </button>
+                             </div>
+                         )}
+                     </>
+                 )}
              </div>
         </div>
     );
@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react';
 import { useParams } from 'react-router-dom';
-import api from '../api/api';
+import { fetchUserStories } from '../api/api';
 import { ISSUE_TYPE_OPTIONS } from '../constants';
 import SprintGroupedIssueList from '../components/SprintGroupedIssueList';
 import IssueFilters from '../components/IssueFilters';
@@ -17,10 +17,8 @@ const ProjectIssuesPage = () => {
         const fetchProjectTasks = async () => {
             try {
                 // Fetch issues strictly for this project using standardized API
-                const response = await api.get('/user-story', {
-                    params: { project_id: projectId }
-                });
-                setTasks(response.data);
+                const stories = await fetchUserStories({ project_id: projectId });
+                setTasks(stories);
             } catch (error) {
                 console.error("Failed to fetch tasks", error);
             } finally {
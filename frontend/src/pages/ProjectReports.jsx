@@ -24,16 +24,13 @@ const ProjectReports = () => {
                 const projectRes = await api.get(`/projects/${projectId}`);
                 setProjectName(projectRes.data.project_name);
 
-                // Fetch Reports
-                const [summaryRes, statusRes, typeRes] = await Promise.all([
-                    api.get(`/projects/${projectId}/reports/summary`),
-                    api.get(`/projects/${projectId}/reports/issues-by-status`),
-                    api.get(`/projects/${projectId}/reports/issues-by-type`)
-                ]);
-
-                setSummary(summaryRes.data);
-                setStatusData(statusRes.data);
-                setTypeData(typeRes.data);
+                // Fetch Reports (summary + breakdowns in one round trip)
+                const overviewRes = await api.get(`/projects/${projectId}/reports/overview`);
+                const overview = overviewRes.data;
+
+                setSummary(overview);
+                setStatusData(overview.by_status);
+                setTypeData(overview.by_type);
 
              } catch (err) {
                  console.error("Failed to fetch reports", err);
@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import api from '../api/api';
+import api, { fetchUserStories } from '../api/api';
 import { 
     PieChart, Pie, Cell, Tooltip, Legend, ResponsiveContainer, 
     BarChart, Bar, XAxis, YAxis, CartesianGrid 
@@ -21,7 +21,7 @@ const ReportsPage = () => {
                      api.get('/reports/summary'),
                      api.get('/reports/issues-by-status'),
                      api.get('/reports/issues-by-type'),
-                     api.get('/user-story')
+                     fetchUserStories({ fields: ['id', 'assignee', 'sprint_number'] })
                  ]);
 
                  setStats({
@@ -29,7 +29,7 @@ const ReportsPage = () => {
                      totalIssues: summaryRes.data.total_issues,
                      statusCounts: statusRes.data, // [{status: 'todo', count: 1}]
                      typeCounts: typeRes.data,     // [{type: 'story', count: 1}]
-                     stories: storiesRes.data      // For Assignee/Sprint fallback
+                     stories: storiesRes           // For Assignee/Sprint fallback
                  });
 
              } catch (error) {
@@ -1,6 +1,6 @@
 import React, { useEffect, useState, useCallback } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import api from '../api/api';
+import api, { fetchStoryHistory, fetchUserStories } from '../api/api';
 
 import { STATUS_OPTIONS } from '../constants';
 
@@ -9,6 +9,8 @@ const StoryDetailPage = () => {
     const navigate = useNavigate();
     const [story, setStory] = useState(null);
     const [history, setHistory] = useState([]);
+    const [historyCursor, setHistoryCursor] = useState(null);
+    const [loadingHistory, setLoadingHistory] = useState(false);
     const [loading, setLoading] = useState(true);
     const [isEditing, setIsEditing] = useState(false);
 
@@ -60,9 +62,12 @@ const StoryDetailPage = () => {
             
             // 2. Fetch Dependencies
             const [historyRes, projectsRes, allStoriesRes] = await Promise.all([
-                api.get(`/user-story/${id}/history`),
+                fetchStoryHistory(id),
                 api.get('/auth/me/projects'),
-                api.get('/user-story'), 
+                fetchUserStories({
+                    project_id: currentStory.project_id,
+                    fields: ['id', 'project_id', 'story_code', 'title', 'issue_type', 'sprint_number'],
+                }),
             ]);
 
             // 3. Fetch Assignees (Safely)
@@ -75,9 +80,10 @@ const StoryDetailPage = () => {
             }
             setAvailableAssignees(assignees);
 
-            setHistory(historyRes.data);
+            setHistory(historyRes.activities);
+            setHistoryCursor(historyRes.nextCursor);
 
-            const projectStories = allStoriesRes.data.filter(s => s.project_id === currentStory.project_id);
+            const projectStories = allStoriesRes;
             
             // Epics
             const projectEpics = projectStories.filter(i =>
@@ -128,6 +134,20 @@ const StoryDetailPage = () => {
         fetchData();
     }, [fetchData]);
 
+    // Older activity is paged by the history endpoint; append the next page on demand
+    const loadMoreHistory = async () => {
+        setLoadingHistory(true);
+        try {
+            const page = await fetchStoryHistory(id, historyCursor);
+            setHistory(prev => [...prev, ...page.activities]);
+            setHistoryCursor(page.nextCursor);
+        } catch (error) {
+            console.error("Failed to load older activity", error);
+        } finally {
+            setLoadingHistory(false);
+        }
+    };
+
     const handleSave = async () => {
         try {
             // Build updates object with only changed fields
@@ -426,6 +446,15 @@ const StoryDetailPage = () => {
                                         </div>
                                     ))}
                                     {history.length === 0 && <p className="text-sm text-[#5E6C84] italic">No activity yet.</p>}
+                                    {historyCursor && (
+                                        <button
+                                            onClick={loadMoreHistory}
+                                            disabled={loadingHistory}
+                                            className="text-sm text-[#0052CC] hover:underline disabled:text-[#5E6C84] disabled:no-underline"
+                                        >
+                                            {loadingHistory ? 'Loading...' : 'Show older activity'}
+                                        </button>
+                                    )}
                                 </div>
                             )}
                         </div>
@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
-import api from '../api/api';
+import { fetchUserStories } from '../api/api';
 
 const TimelinePage = () => {
     const { projectId } = useParams();
@@ -22,9 +22,9 @@ const TimelinePage = () => {
         const fetchTasks = async () => {
             setLoading(true);
             try {
-                const res = await api.get(`/user-story?project_id=${projectId}`);
-                setTasks(res.data);
-                groupTasks(res.data);
+                const stories = await fetchUserStories({ project_id: projectId });
+                setTasks(stories);
+                groupTasks(stories);
             } catch (error) {
                 console.error("Failed to fetch timeline tasks", error);
             } finally {